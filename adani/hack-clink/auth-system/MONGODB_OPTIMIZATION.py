@@ -6,7 +6,7 @@ import streamlit as st
 import pandas as pd
 import traceback
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from SIMPLE_DATA_INPUT import render_simple_data_input_page
 
 def render_mongodb_optimization_run(role: str) -> None:
@@ -15,7 +15,7 @@ def render_mongodb_optimization_run(role: str) -> None:
     if not require_authentication():
         return
     
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         st.warning("You cannot run optimization. Please contact an administrator.")
         return
     
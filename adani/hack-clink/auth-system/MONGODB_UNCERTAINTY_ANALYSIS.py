@@ -7,7 +7,7 @@ import pandas as pd
 import random
 import traceback
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from SIMPLE_DATA_INPUT import render_simple_data_input_page
 
 def render_mongodb_uncertainty_analysis():
@@ -16,7 +16,7 @@ def render_mongodb_uncertainty_analysis():
     if not require_authentication():
         return
     
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
     
     st.title("🎲 Demand Uncertainty Analysis")
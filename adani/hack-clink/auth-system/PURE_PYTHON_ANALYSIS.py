@@ -7,7 +7,7 @@ import pandas as pd
 import random
 import traceback
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_OR_PLANNER, require_authentication, require_role
 
 def render_pure_python_uncertainty_analysis():
     """Render pure python demand uncertainty analysis page - no external dependencies."""
@@ -15,7 +15,7 @@ def render_pure_python_uncertainty_analysis():
     if not require_authentication():
         return
     
-    if not require_role(["Admin", "Planner"]):
+    if not require_role(ADMIN_OR_PLANNER):
         return
     
     st.title("🎲 Demand Uncertainty Analysis")
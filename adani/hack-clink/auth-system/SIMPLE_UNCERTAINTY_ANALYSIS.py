@@ -7,7 +7,7 @@ import pandas as pd
 import random
 import traceback
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 
 def render_simple_uncertainty_analysis():
     """Render simple demand uncertainty analysis page."""
@@ -15,7 +15,7 @@ def render_simple_uncertainty_analysis():
     if not require_authentication():
         return
     
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
     
     st.title("🎲 Demand Uncertainty Analysis")
@@ -7,7 +7,7 @@ import pandas as pd
 import traceback
 from typing import Dict, Any
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_OR_PLANNER, require_authentication, require_role
 
 def render_simplified_uncertainty_analysis():
     """Render simplified demand uncertainty analysis page."""
@@ -15,7 +15,7 @@ def render_simplified_uncertainty_analysis():
     if not require_authentication():
         return
     
-    if not require_role(["Admin", "Planner"]):
+    if not require_role(ADMIN_OR_PLANNER):
         return
     
     st.title("🎲 Demand Uncertainty Analysis")
@@ -6,7 +6,7 @@ import streamlit as st
 import pandas as pd
 import traceback
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_OR_PLANNER, require_authentication, require_role
 
 def render_ultra_simple_optimization_run(role: str) -> None:
     """Render ultra-simple optimization run page."""
@@ -14,7 +14,7 @@ def render_ultra_simple_optimization_run(role: str) -> None:
     if not require_authentication():
         return
     
-    if not require_role(["Admin", "Planner"]):
+    if not require_role(ADMIN_OR_PLANNER):
         st.warning("Viewer role: you cannot run optimization. Open Optimization Results to view runs.")
         return
     
@@ -6,7 +6,7 @@ import streamlit as st
 import pandas as pd
 import traceback
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_OR_PLANNER, require_authentication, require_role
 
 def render_ultra_simple_uncertainty_analysis():
     """Render ultra-simple demand uncertainty analysis page."""
@@ -14,7 +14,7 @@ def render_ultra_simple_uncertainty_analysis():
     if not require_authentication():
         return
     
-    if not require_role(["Admin", "Planner"]):
+    if not require_role(ADMIN_OR_PLANNER):
         return
     
     st.title("🎲 Demand Uncertainty Analysis")
@@ -28,6 +28,7 @@ def render_ultra_simple_uncertainty_analysis():
     
     num_scenarios = st.sidebar.slider("Number of Scenarios", 3, 10, 5)
     volatility = st.sidebar.slider("Demand Volatility", 0.1, 0.5, 0.3)
+    show_traceback = st.sidebar.checkbox("Show full traceback", value=False)
     
     # Display current configuration
     st.info(f"📊 Ready to run: {num_scenarios} scenarios, {volatility:.1%} volatility")
@@ -81,8 +82,9 @@ def render_ultra_simple_uncertainty_analysis():
         except Exception as e:
             st.error(f"❌ Analysis failed: {str(e)}")
             st.error("🚨 Please try again or contact an administrator.")
-            st.text("Error details:")
-            st.code(traceback.format_exc())
+            if show_traceback:
+                st.text("Error details:")
+                st.code(traceback.format_exc())
     
     # Display results
     if st.session_state.analysis_results:
@@ -173,5 +175,3 @@ def render_ultra_simple_uncertainty_analysis():
         st.info("📊 No analysis results found. Please run analysis first.")
         if st.button("🚀 Run Analysis", type="primary"):
             st.rerun()
-
-print("✅ Ultra-simple demand uncertainty analysis UI created successfully")
@@ -6,8 +6,22 @@ import streamlit as st
 import pandas as pd
 import random
 import traceback
+from dataclasses import dataclass
+
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
+
+
+@dataclass(slots=True, frozen=True)
+class ScenarioMetrics:
+    """Cost and service metrics for one side of the uncertainty comparison."""
+    total_cost: float
+    service_level: float
+    unmet_demand: float
+    demand_penalty: float
+    production_cost: float
+    transport_cost: float
+    holding_cost: float
 
-from backend.middleware.role_guard import require_authentication, require_role
 
 def render_ultra_simple_uncertainty_analysis():
     """Render ultra-simple demand uncertainty analysis page."""
@@ -15,7 +29,7 @@ def render_ultra_simple_uncertainty_analysis():
     if not require_authentication():
         return
     
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
     
     st.title("🎲 Demand Uncertainty Analysis")
@@ -75,6 +89,7 @@ def render_ultra_simple_uncertainty_analysis():
     
     num_scenarios = st.sidebar.slider("Number of Scenarios", 3, 10, 5)
     volatility = st.sidebar.slider("Demand Volatility", 0.1, 0.5, 0.3)
+    show_traceback = st.sidebar.checkbox("Show full traceback", value=False)
     
     # Display current configuration
     st.info(f"📊 Ready to run: {num_scenarios} scenarios, {volatility:.1%} volatility")
@@ -222,24 +237,24 @@ def render_ultra_simple_uncertainty_analysis():
                 
                 # Store results
                 st.session_state.uncertainty_analysis_results = {
-                    "deterministic": {
-                        "total_cost": det_total_cost,
-                        "service_level": det_service_level,
-                        "unmet_demand": det_unmet_demand,
-                        "demand_penalty": 0.0,
-                        "production_cost": total_production_cost,
-                        "transport_cost": total_transport_cost,
-                        "holding_cost": total_holding_cost
-                    },
-                    "stochastic": {
-                        "total_cost": stoch_total_cost,
-                        "service_level": stoch_service_level,
-                        "unmet_demand": stoch_unmet_demand,
-                        "demand_penalty": stoch_penalty_cost,
-                        "production_cost": stoch_production_cost,
-                        "transport_cost": stoch_transport_cost,
-                        "holding_cost": stoch_holding_cost
-                    },
+                    "deterministic": ScenarioMetrics(
+                        total_cost=det_total_cost,
+                        service_level=det_service_level,
+                        unmet_demand=det_unmet_demand,
+                        demand_penalty=0.0,
+                        production_cost=total_production_cost,
+                        transport_cost=total_transport_cost,
+                        holding_cost=total_holding_cost
+                    ),
+                    "stochastic": ScenarioMetrics(
+                        total_cost=stoch_total_cost,
+                        service_level=stoch_service_level,
+                        unmet_demand=stoch_unmet_demand,
+                        demand_penalty=stoch_penalty_cost,
+                        production_cost=stoch_production_cost,
+                        transport_cost=stoch_transport_cost,
+                        holding_cost=stoch_holding_cost
+                    ),
                     "scenarios": scenarios,
                     "user_data_summary": {
                         "num_plants": len(plants),
@@ -254,8 +269,9 @@ def render_ultra_simple_uncertainty_analysis():
         except Exception as e:
             st.error(f"❌ Analysis failed: {str(e)}")
             st.error("🚨 Please try again or contact an administrator.")
-            st.text("Error details:")
-            st.code(traceback.format_exc())
+            if show_traceback:
+                st.text("Error details:")
+                st.code(traceback.format_exc())
     
     # Display results
     if st.session_state.uncertainty_analysis_results:
@@ -289,16 +305,16 @@ def render_ultra_simple_uncertainty_analysis():
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                cost_diff = stoch["total_cost"] - det["total_cost"]
-                cost_pct = (cost_diff / det["total_cost"]) * 100 if det["total_cost"] > 0 else 0
+                cost_diff = stoch.total_cost - det.total_cost
+                cost_pct = (cost_diff / det.total_cost) * 100 if det.total_cost > 0 else 0
                 st.metric("Cost Impact", f"{cost_pct:+.2f}%")
             
             with col2:
-                service_diff = stoch["service_level"] - det["service_level"]
+                service_diff = stoch.service_level - det.service_level
                 st.metric("Service Change", f"{service_diff:+.2%}%")
             
             with col3:
-                penalty_diff = stoch["demand_penalty"] - det["demand_penalty"]
+                penalty_diff = stoch.demand_penalty - det.demand_penalty
                 st.metric("Penalty Change", f"${penalty_diff:,.0f}")
             
             # Detailed comparison
@@ -307,14 +323,14 @@ def render_ultra_simple_uncertainty_analysis():
             comparison_data = {
                 "Metric": ["Total Cost", "Service Level", "Unmet Demand"],
                 "Deterministic": [
-                    f"${det['total_cost']:,.0f}",
-                    f"{det['service_level']:.1%}",
-                    f"{det['unmet_demand']:,.0f}"
+                    f"${det.total_cost:,.0f}",
+                    f"{det.service_level:.1%}",
+                    f"{det.unmet_demand:,.0f}"
                 ],
                 "Stochastic": [
-                    f"${stoch['total_cost']:,.0f}",
-                    f"{stoch['service_level']:.1%}",
-                    f"{stoch['unmet_demand']:,.0f}"
+                    f"${stoch.total_cost:,.0f}",
+                    f"{stoch.service_level:.1%}",
+                    f"{stoch.unmet_demand:,.0f}"
                 ]
             }
             
@@ -362,5 +378,3 @@ def render_ultra_simple_uncertainty_analysis():
         st.info("📊 No analysis results found. Please run analysis first.")
         if st.button("🚀 Run Analysis", type="primary"):
             st.rerun()
-
-print("✅ Ultra-simple uncertainty analysis UI created successfully")
@@ -1,26 +1,26 @@
 """Analyze the Excel dataset to understand structure and constraints."""
 
-import pandas as pd
 import sys
 
+from excel_cache import load_workbook
+
 def analyze_excel(file_path):
     """Read and analyze all sheets from the Excel file."""
     
-    xl = pd.ExcelFile(file_path)
+    workbook = load_workbook(file_path)
     
     print("=" * 80)
     print("DATASET ANALYSIS")
     print("=" * 80)
-    print(f"\nTotal sheets: {len(xl.sheet_names)}\n")
+    print(f"\nTotal sheets: {len(workbook)}\n")
     
     sheets_data = {}
     
-    for sheet_name in xl.sheet_names:
+    for sheet_name, df in workbook.items():
         print(f"\n{'='*80}")
         print(f"SHEET: {sheet_name}")
         print(f"{'='*80}")
         
-        df = pd.read_excel(xl, sheet_name)
         sheets_data[sheet_name] = df
         
         print(f"Shape: {df.shape} (rows x columns)")
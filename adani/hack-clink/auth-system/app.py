@@ -9,24 +9,35 @@ The actual authentication logic lives in backend/auth/*.
 The actual database logic lives in backend/database/*.
 """
 
+import importlib
 import os
 import streamlit as st
 
-# Ensure CBC solver is in PATH before any checks
-_cbc_path = r"C:\solvers\cbc\bin"
-if os.path.exists(_cbc_path):
-    current_path = os.environ.get("PATH", "")
-    if _cbc_path not in current_path:
-        os.environ["PATH"] = _cbc_path + os.pathsep + current_path
-
-# Fix statsmodels import issue for plotly trendline functions
-try:
-    import statsmodels.api as sm
-except ImportError:
-    # Apply comprehensive statsmodels fix
-    from statsmodels_fix import patch_statsmodels, patch_plotly_trendline
-    patch_statsmodels()
-    patch_plotly_trendline()
+
+@st.cache_resource(show_spinner=False)
+def _one_time_env_setup() -> bool:
+    """Process-wide environment setup; cached so Streamlit reruns skip it."""
+
+    # Ensure CBC solver is in PATH before any checks
+    cbc_path = r"C:\solvers\cbc\bin"
+    if os.path.isdir(cbc_path):
+        current_path = os.environ.get("PATH", "")
+        if cbc_path not in current_path:
+            os.environ["PATH"] = cbc_path + os.pathsep + current_path
+
+    # Fix statsmodels import issue for plotly trendline functions
+    try:
+        import statsmodels.api  # noqa: F401
+    except ImportError:
+        # Apply comprehensive statsmodels fix
+        from statsmodels_fix import patch_statsmodels, patch_plotly_trendline
+        patch_statsmodels()
+        patch_plotly_trendline()
+
+    return True
+
+
+_one_time_env_setup()
 
 from backend.auth.session import (
     ensure_session_defaults,
@@ -39,23 +50,42 @@ from backend.core.logger import audit_log
 from backend.utils.health_check import run_startup_checks
 from ui.login import render_login_page
 from ui.signup import render_signup_page
-from ui.dashboards import render_dashboard
-from ui.plant_page import render_plant_page
-from ui.demand_page import render_demand_page
-from ui.transport_page import render_transport_page
-from ui.inventory_page import render_inventory_page
-from ui.optimization_run import render_optimization_run
-from ui.optimization_results import render_optimization_results
-from ui.uncertainty_settings import render_uncertainty_settings
-from ui.scenario_comparison import render_scenario_comparison
-from ui.management_dashboard import render_management_dashboard
-from ui.run_comparison import render_run_comparison
-from ui.demand_uncertainty_ui import render_demand_uncertainty_analysis
-from ULTRA_SIMPLE_UNCERTAINTY import render_ultra_simple_uncertainty_analysis
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from SIMPLE_DATA_INPUT import render_simple_data_input_page
+
+
+# Page modules are imported lazily: only the selected page is rendered per rerun,
+# so there is no reason to pay the import cost (pandas/plotly/pyomo) for the rest.
+# page -> (module, render function, called with role=...)
+_PAGES = {
+    "Dashboard": ("ui.dashboards", "render_dashboard", False),
+    "Data Input": ("SIMPLE_DATA_INPUT", "render_simple_data_input_page", False),
+    "Plants": ("ui.plant_page", "render_plant_page", True),
+    "Demands": ("ui.demand_page", "render_demand_page", True),
+    "Transport": ("ui.transport_page", "render_transport_page", True),
+    "Inventory Policies": ("ui.inventory_page", "render_inventory_page", True),
+    "Run Optimization": ("ui.optimization_run", "render_optimization_run", True),
+    "Optimization Results": ("ui.optimization_results", "render_optimization_results", True),
+    "Demand Uncertainty Settings": ("ui.uncertainty_settings", "render_uncertainty_settings", True),
+    "Scenario Comparison": ("ui.scenario_comparison", "render_scenario_comparison", True),
+    "Demand Uncertainty Analysis": ("ULTRA_SIMPLE_UNCERTAINTY", "render_ultra_simple_uncertainty_analysis", False),
+    "Management Insights Dashboard": ("ui.management_dashboard", "render_management_dashboard", True),
+    "Run Comparison": ("ui.run_comparison", "render_run_comparison", True),
+}
+
+
+def _render_page(choice: str, role: str | None) -> None:
+    """Import the selected page module on demand and render it."""
+
+    if choice not in _PAGES:
+        choice = "Optimization Results"
+    module_name, fn_name, takes_role = _PAGES[choice]
+    render = getattr(importlib.import_module(module_name), fn_name)
+    if takes_role:
+        safe_page(choice)(render)(role=role)
+    else:
+        safe_page(choice)(render)()
 
 
 def main() -> None:
@@ -72,8 +102,16 @@ def main() -> None:
     ensure_session_defaults()
 
     # Phase 6: startup checks (DB + solver availability).
-    checks = run_startup_checks()
+    # They ping MongoDB and probe every solver, so run them once per session
+    # instead of on every widget interaction.
+    if st.sidebar.button("Re-check database & solvers"):
+        st.session_state.pop("startup_checks", None)
+    if "startup_checks" not in st.session_state:
+        st.session_state.startup_checks = run_startup_checks()
+    checks = st.session_state.startup_checks
     if not checks.get("mongo", {}).get("ok", False):
+        # Do not keep a failed result around; retry on the next rerun.
+        st.session_state.pop("startup_checks", None)
         logger.error("Startup check failed: %s", checks)
         st.error("Database is not reachable. Please check configuration and try again.")
         return
@@ -142,32 +180,7 @@ def main() -> None:
             return
 
         # Route to the selected page.
-        if choice == "Dashboard":
-            safe_page("Dashboard")(render_dashboard)()
-        elif choice == "Data Input":
-            render_simple_data_input_page()
-        elif choice == "Plants":
-            safe_page("Plants")(render_plant_page)(role=role)
-        elif choice == "Demands":
-            safe_page("Demands")(render_demand_page)(role=role)
-        elif choice == "Transport":
-            safe_page("Transport")(render_transport_page)(role=role)
-        elif choice == "Inventory Policies":
-            safe_page("Inventory Policies")(render_inventory_page)(role=role)
-        elif choice == "Run Optimization":
-            safe_page("Run Optimization")(render_optimization_run)(role=role)
-        elif choice == "Demand Uncertainty Settings":
-            safe_page("Demand Uncertainty Settings")(render_uncertainty_settings)(role=role)
-        elif choice == "Scenario Comparison":
-            safe_page("Scenario Comparison")(render_scenario_comparison)(role=role)
-        elif choice == "Demand Uncertainty Analysis":
-            render_ultra_simple_uncertainty_analysis()
-        elif choice == "Management Insights Dashboard":
-            safe_page("Management Insights Dashboard")(render_management_dashboard)(role=role)
-        elif choice == "Run Comparison":
-            safe_page("Run Comparison")(render_run_comparison)(role=role)
-        else:
-            safe_page("Optimization Results")(render_optimization_results)(role=role)
+        _render_page(choice, role)
     else:
         choice = st.sidebar.radio("Navigation", ["Login", "Signup"])
 
@@ -15,20 +15,29 @@ Important:
 
 from __future__ import annotations
 
+import base64
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
 
 from backend.analytics.bottleneck_detector import detect_bottlenecks
 from backend.analytics.cost_driver_analysis import compute_cost_drivers
 from backend.analytics.kpi_engine import compute_kpis
 from backend.analytics.utilization_analysis import compute_utilization
-from backend.demand.demand_service import get_all_demands
-from backend.inventory.inventory_service import get_all_policies
-from backend.plant.plant_service import get_all_plants
+from backend.core.cache import (
+    cached_get_all_demands,
+    cached_get_all_plants,
+    cached_get_all_policies,
+    cached_get_all_routes,
+)
 from backend.results.result_repository import update_run_fields
 from backend.results.result_service import get_run
-from backend.transport.transport_service import get_all_routes
 
 
 def _safe_float(x: Any, default: float = 0.0) -> float:
@@ -38,26 +47,185 @@ def _safe_float(x: Any, default: float = 0.0) -> float:
         return float(default)
 
 
-def _build_inventory_defaults(plants: List[Dict[str, Any]], policies: List[Dict[str, Any]]):
-    storage_capacity = {str(p.get("_id")): _safe_float(p.get("storage_capacity", 0.0)) for p in plants}
-    safety_stock = {str(p.get("_id")): _safe_float(p.get("safety_stock", 0.0)) for p in plants}
+# Striped locks so concurrent dashboard requests do not recompute the same run.
+# A run id always maps to the same lock; the fixed list never grows, unlike a
+# lock per run id. Two runs sharing a stripe just wait for each other.
+_RUN_LOCK_STRIPES = 64
+_run_locks: List[threading.Lock] = [threading.Lock() for _ in range(_RUN_LOCK_STRIPES)]
 
+# Record lists longer than this are stored column-wise (see `_compact_rows`).
+_COLUMNAR_MIN_ROWS = 50
+
+# Frames longer than this store numeric columns as base64 buffers (see `_encode_df`).
+_BINARY_MIN_ROWS = 1000
+
+
+def _records(df: pd.DataFrame | None) -> List[Dict[str, Any]]:
+    """Serialize a dataframe to plain-Python records via pandas' JSON writer + orjson.
+
+    This is much faster than `to_dict(orient="records")` and yields native
+    int/float/str values, so PyMongo does not have to handle numpy scalars.
+    """
+
+    if df is None or df.empty:
+        return []
+    return orjson.loads(df.to_json(orient="records", date_format="iso", double_precision=15))
+
+
+def _encode_df(df: pd.DataFrame) -> Dict[str, Any]:
+    """Encode a large dataframe compactly: numeric columns as base64 buffers.
+
+    Keeps big runs well below MongoDB's 16MB document limit. Float columns are
+    stored as float64 and integer columns as int64, so costs and trip counts
+    come back exactly. Other columns (text, bool, None) stay plain JSON values.
+    """
+
+    blobs: Dict[str, str] = {}
+    blob_dtypes: Dict[str, str] = {}
+    values: Dict[str, List[Any]] = {}
+    for c in df.columns:
+        col = df[c]
+        if pd.api.types.is_integer_dtype(col) and not col.isna().any():
+            buf, dtype = np.ascontiguousarray(col.to_numpy(), dtype=np.int64).tobytes(), "int64"
+        elif pd.api.types.is_float_dtype(col):
+            buf, dtype = np.ascontiguousarray(col.to_numpy(), dtype=np.float64).tobytes(), "float64"
+        else:
+            values[str(c)] = orjson.loads(col.to_json(orient="values", date_format="iso", double_precision=15))
+            continue
+        blobs[str(c)] = base64.b64encode(buf).decode("ascii")
+        blob_dtypes[str(c)] = dtype
+    return {
+        "columns": [str(c) for c in df.columns],
+        "dtypes": {str(c): str(df[c].dtype) for c in df.columns},
+        "n": int(len(df)),
+        "blobs": blobs,
+        "blob_dtypes": blob_dtypes,
+        "values": values,
+    }
+
+
+def _decode_df(value: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Inverse of `_encode_df`, returning plain records.
+
+    Runs saved before blob_dtypes existed used float32 buffers and stored
+    every other column as strings ("strcols"); those still decode.
+    """
+
+    columns = list(value.get("columns") or [])
+    dtypes = value.get("dtypes") or {}
+    blobs = value.get("blobs") or {}
+    blob_dtypes = value.get("blob_dtypes") or {}
+    values = value.get("values") or {}
+    strcols = value.get("strcols") or {}
+    data: Dict[str, List[Any]] = {}
+    for c in columns:
+        if c in blobs:
+            blob_dtype = blob_dtypes.get(c, "float32")
+            arr = np.frombuffer(base64.b64decode(blobs[c]), dtype=blob_dtype)
+            if blob_dtype == "float32":
+                arr = arr.astype(float)
+                if str(dtypes.get(c, "")).startswith(("int", "uint")):
+                    arr = arr.round().astype(np.int64)
+            data[c] = arr.tolist()
+        elif c in values:
+            data[c] = list(values[c])
+        else:
+            data[c] = list(strcols.get(c) or [])
+    return [dict(zip(columns, row)) for row in zip(*(data[c] for c in columns))]
+
+
+def _columnar(df: pd.DataFrame) -> Dict[str, Any] | List[Dict[str, Any]]:
+    """Encode a dataframe as {columns, data} so column names are stored once, not per row.
+
+    Frames above `_BINARY_MIN_ROWS` rows use the binary `_encode_df` layout instead.
+    """
+
+    if df is None or df.empty:
+        return []
+    if len(df) > _BINARY_MIN_ROWS:
+        return _encode_df(df)
+    split = orjson.loads(df.to_json(orient="split", index=False, date_format="iso", double_precision=15))
+    return {"columns": [str(c) for c in split["columns"]], "data": split["data"]}
+
+
+def _compact_rows(rows: List[Dict[str, Any]]) -> Dict[str, Any] | List[Dict[str, Any]]:
+    """Store long lists of uniform dicts column-wise; short lists stay readable records."""
+
+    if len(rows) <= _COLUMNAR_MIN_ROWS:
+        return rows
+    columns = list(rows[0].keys())
+    return {"columns": columns, "data": [[r.get(c) for c in columns] for r in rows]}
+
+
+def records_from_columnar(value: Any) -> List[Dict[str, Any]]:
+    """Decode a stored analytics table (records, {columns, data} or binary) into a list of records."""
+
+    if isinstance(value, dict) and "blobs" in value:
+        return _decode_df(value)
+    if isinstance(value, dict) and "columns" in value:
+        columns = list(value.get("columns") or [])
+        return [dict(zip(columns, row)) for row in value.get("data") or []]
+    return list(value or [])
+
+
+@dataclass
+class PlantIndex:
+    """Plant-keyed lookups used by analytics, all keyed by str(plant _id)."""
+
+    names: Dict[str, str] = field(default_factory=dict)
+    prod_cap: Dict[str, float] = field(default_factory=dict)
+    prod_cost: Dict[str, float] = field(default_factory=dict)
+    storage_capacity: Dict[str, float] = field(default_factory=dict)
+    safety_stock: Dict[str, float] = field(default_factory=dict)
+
+
+def _index_plants(plants: List[Dict[str, Any]]) -> PlantIndex:
+    """Build every plant lookup in a single pass over the plant documents."""
+
+    index = PlantIndex()
+    for p in plants:
+        pid = str(p.get("_id"))
+        index.names[pid] = str(p.get("name") or "")
+        index.prod_cap[pid] = _safe_float(p.get("production_capacity", 0.0))
+        index.prod_cost[pid] = _safe_float(p.get("production_cost", 0.0))
+        index.storage_capacity[pid] = _safe_float(p.get("storage_capacity", 0.0))
+        index.safety_stock[pid] = _safe_float(p.get("safety_stock", 0.0))
+    return index
+
+
+def _build_inventory_defaults(plant_index: PlantIndex, policies: List[Dict[str, Any]]):
     policy_by_pid = {str(pol.get("plant_id")): pol for pol in policies}
 
     max_inventory: Dict[str, float] = {}
     holding_cost: Dict[str, float] = {}
 
-    for p in plants:
-        pid = str(p.get("_id"))
+    for pid, storage_capacity in plant_index.storage_capacity.items():
         pol = policy_by_pid.get(pid)
         if pol is None:
-            max_inventory[pid] = float(storage_capacity.get(pid, 0.0))
+            max_inventory[pid] = storage_capacity
             holding_cost[pid] = 0.0
         else:
             max_inventory[pid] = _safe_float(pol.get("max_inventory", 0.0))
             holding_cost[pid] = _safe_float(pol.get("holding_cost_per_month", 0.0))
 
-    return safety_stock, max_inventory, holding_cost
+    return plant_index.safety_stock, max_inventory, holding_cost
+
+
+def _analytics_input_hash(run: Dict[str, Any], *master_data: List[Dict[str, Any]]) -> str:
+    """Fingerprint everything analytics is computed from (run outputs + master data)."""
+
+    payload = [
+        run.get("production_rows"),
+        run.get("transport_rows"),
+        run.get("inventory_rows"),
+        run.get("months"),
+        run.get("demand_type"),
+        run.get("scenarios"),
+        run.get("scenario_probabilities"),
+        *master_data,
+    ]
+    blob = orjson.dumps(payload, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return hashlib.blake2b(blob, digest_size=16).hexdigest()
 
 
 def _demand_for_run(run: Dict[str, Any]) -> pd.DataFrame:
@@ -71,12 +239,14 @@ def _demand_for_run(run: Dict[str, Any]) -> pd.DataFrame:
       using the stored scenario definitions.
     """
 
-    months = set(run.get("months", []) or [])
+    months = frozenset(run.get("months", []) or [])
     demand_type = str(run.get("demand_type", "Fixed"))
     opt_type = str(run.get("optimization_type", "deterministic"))
 
-    all_demands = get_all_demands()
-    base_rows: List[Dict[str, Any]] = []
+    all_demands = cached_get_all_demands()
+    pids: List[str] = []
+    months_list: List[str] = []
+    qtys: List[Any] = []
 
     # Base demand is always Fixed in our system.
     for d in all_demands:
@@ -85,9 +255,18 @@ def _demand_for_run(run: Dict[str, Any]) -> pd.DataFrame:
         m = str(d.get("month") or "")
         if m not in months:
             continue
-        base_rows.append({"plant_id": str(d.get("plant_id")), "month": m, "demand_quantity": _safe_float(d.get("demand_quantity", 0.0))})
-
-    base_df = pd.DataFrame(base_rows)
+        pids.append(str(d.get("plant_id")))
+        months_list.append(m)
+        qtys.append(d.get("demand_quantity", 0.0))
+
+    # Quantities are coerced in one batch instead of a _safe_float call per row.
+    base_df = pd.DataFrame(
+        {
+            "plant_id": pd.Series(pids, dtype=object),
+            "month": pd.Series(months_list, dtype=object),
+            "demand_quantity": pd.to_numeric(pd.Series(qtys, dtype=object), errors="coerce").fillna(0.0).astype(float),
+        }
+    )
 
     if opt_type in {"stochastic", "robust"}:
         scenarios = run.get("scenarios", []) or []
@@ -97,22 +276,36 @@ def _demand_for_run(run: Dict[str, Any]) -> pd.DataFrame:
             return base_df
 
         # Expected demand = sum_s prob_s * multiplier_s * base_demand
-        exp_df = base_df.copy()
-        exp_df["expected_multiplier"] = 0.0
+        # The multiplier does not depend on the row, so fold it to a scalar first.
+        expected_multiplier = 0.0
         for s in scenarios:
             name = str(s.get("name"))
             mult = _safe_float(s.get("demand_multiplier", 1.0), 1.0)
             p = _safe_float(probs.get(name, 0.0))
-            exp_df["expected_multiplier"] += p * mult
+            expected_multiplier += p * mult
 
-        exp_df["demand_quantity"] = exp_df["demand_quantity"] * exp_df["expected_multiplier"]
-        exp_df = exp_df.drop(columns=["expected_multiplier"])
+        exp_df = base_df.copy()
+        exp_df["demand_quantity"] = exp_df["demand_quantity"].to_numpy() * expected_multiplier
         return exp_df
 
     return base_df
 
 
 def compute_and_store_analytics(run_id: str) -> Tuple[bool, str]:
+    """Compute analytics for a run and store them on the run document.
+
+    Concurrent calls for the same run (two tabs, a reload mid-compute) are
+    serialized: the second caller waits, then re-reads the run and returns
+    early through the input-hash check instead of redoing the work.
+    """
+
+    run_lock = _run_locks[hash(str(run_id)) % _RUN_LOCK_STRIPES]
+
+    with run_lock:
+        return _compute_and_store_analytics(run_id)
+
+
+def _compute_and_store_analytics(run_id: str) -> Tuple[bool, str]:
     run = get_run(run_id)
     if run is None:
         return False, "Run not found."
@@ -120,15 +313,21 @@ def compute_and_store_analytics(run_id: str) -> Tuple[bool, str]:
     if str(run.get("status") or "").lower() != "success":
         return False, "Analytics is only computed for successful runs."
 
-    plants = get_all_plants(include_inactive=False)
-    routes = get_all_routes(include_disabled=True)
-    policies = get_all_policies()
+    plants = cached_get_all_plants(include_inactive=False)
+    routes = cached_get_all_routes(include_disabled=True)
+    policies = cached_get_all_policies()
 
-    plant_names = {str(p.get("_id")): str(p.get("name") or "") for p in plants}
-    prod_cap = {str(p.get("_id")): _safe_float(p.get("production_capacity", 0.0)) for p in plants}
-    prod_cost = {str(p.get("_id")): _safe_float(p.get("production_cost", 0.0)) for p in plants}
+    # Skip the recompute + rewrite when nothing analytics depends on has changed.
+    input_hash = _analytics_input_hash(run, plants, routes, policies, cached_get_all_demands())
+    if run.get("analytics") and run.get("analytics_input_hash") == input_hash:
+        return True, "Analytics already up to date."
 
-    safety_stock, max_inventory, _holding_cost = _build_inventory_defaults(plants, policies)
+    plant_index = _index_plants(plants)
+    plant_names = plant_index.names
+    prod_cap = plant_index.prod_cap
+    prod_cost = plant_index.prod_cost
+
+    safety_stock, max_inventory, _holding_cost = _build_inventory_defaults(plant_index, policies)
 
     route_cap = {}
     route_cost = {}
@@ -141,21 +340,35 @@ def compute_and_store_analytics(run_id: str) -> Tuple[bool, str]:
 
     demand_df = _demand_for_run(run)
 
-    kpi_res = compute_kpis(
-        run=run,
-        demand_df=demand_df,
-        safety_stock_by_plant=safety_stock,
-        scenario_probabilities=(run.get("scenario_probabilities", {}) or None),
-    )
-
-    util_res = compute_utilization(
-        run=run,
-        months=months,
-        plant_names=plant_names,
-        production_capacity_by_plant=prod_cap,
-        max_inventory_by_plant=max_inventory,
-        route_capacity_per_trip=route_cap,
-    )
+    # KPIs, utilization and cost drivers only read the run + lookups built above,
+    # so run them concurrently (pandas releases the GIL in most C kernels).
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        kpi_future = executor.submit(
+            compute_kpis,
+            run=run,
+            demand_df=demand_df,
+            safety_stock_by_plant=safety_stock,
+            scenario_probabilities=(run.get("scenario_probabilities", {}) or None),
+        )
+        util_future = executor.submit(
+            compute_utilization,
+            run=run,
+            months=months,
+            plant_names=plant_names,
+            production_capacity_by_plant=prod_cap,
+            max_inventory_by_plant=max_inventory,
+            route_capacity_per_trip=route_cap,
+        )
+        cost_future = executor.submit(
+            compute_cost_drivers,
+            run=run,
+            plant_names=plant_names,
+            production_cost_by_plant=prod_cost,
+            route_cost_per_trip=route_cost,
+        )
+        kpi_res = kpi_future.result()
+        util_res = util_future.result()
+        cost_drivers = cost_future.result()
 
     inv_df = pd.DataFrame(run.get("inventory_rows", []) or [])
     bottlenecks = detect_bottlenecks(
@@ -165,13 +378,6 @@ def compute_and_store_analytics(run_id: str) -> Tuple[bool, str]:
         safety_stock_by_plant=safety_stock,
     )
 
-    cost_drivers = compute_cost_drivers(
-        run=run,
-        plant_names=plant_names,
-        production_cost_by_plant=prod_cost,
-        route_cost_per_trip=route_cost,
-    )
-
     def _avg_headroom(df: pd.DataFrame, col: str = "utilization_percent") -> Tuple[float | None, float | None]:
         if df is None or df.empty or col not in df.columns:
             return None, None
@@ -240,19 +446,19 @@ def compute_and_store_analytics(run_id: str) -> Tuple[bool, str]:
     analytics_doc: Dict[str, Any] = {
         "kpis": kpi_res.kpis,
         "utilization": {
-            "production": util_res.production_utilization_df.to_dict(orient="records") if not util_res.production_utilization_df.empty else [],
-            "transport": util_res.transport_utilization_df.to_dict(orient="records") if not util_res.transport_utilization_df.empty else [],
-            "storage": util_res.storage_utilization_df.to_dict(orient="records") if not util_res.storage_utilization_df.empty else [],
+            "production": _columnar(util_res.production_utilization_df),
+            "transport": _columnar(util_res.transport_utilization_df),
+            "storage": _columnar(util_res.storage_utilization_df),
         },
         "bottlenecks": {
-            "plants": bottlenecks.plant_bottlenecks,
-            "routes": bottlenecks.route_bottlenecks,
-            "inventory": bottlenecks.inventory_bottlenecks,
+            "plants": _compact_rows(bottlenecks.plant_bottlenecks),
+            "routes": _compact_rows(bottlenecks.route_bottlenecks),
+            "inventory": _compact_rows(bottlenecks.inventory_bottlenecks),
         },
         "cost_drivers": {
-            "top_plants": cost_drivers.top_plants_df.to_dict(orient="records") if not cost_drivers.top_plants_df.empty else [],
-            "top_routes": cost_drivers.top_routes_df.to_dict(orient="records") if not cost_drivers.top_routes_df.empty else [],
-            "mode_cost": cost_drivers.mode_cost_df.to_dict(orient="records") if cost_drivers.mode_cost_df is not None and not cost_drivers.mode_cost_df.empty else [],
+            "top_plants": _compact_rows(_records(cost_drivers.top_plants_df)),
+            "top_routes": _compact_rows(_records(cost_drivers.top_routes_df)),
+            "mode_cost": _compact_rows(_records(cost_drivers.mode_cost_df)),
         },
         "resilience": {
             "score": resilience_score,
@@ -270,6 +476,7 @@ def compute_and_store_analytics(run_id: str) -> Tuple[bool, str]:
     update_payload = {
         "analytics": analytics_doc,
         "summary_metrics": summary_metrics,
+        "analytics_input_hash": input_hash,
     }
 
     ok = update_run_fields(run_id, update_payload)
@@ -39,49 +39,53 @@ def detect_bottlenecks(
 
     # Plants near max capacity
     if production_utilization_df is not None and not production_utilization_df.empty:
-        df = production_utilization_df.copy()
-        df = df[df["utilization_percent"] >= float(plant_threshold_percent)]
-        for _, r in df.iterrows():
+        df = production_utilization_df.loc[production_utilization_df["utilization_percent"].to_numpy() >= float(plant_threshold_percent)]
+        for plant, util in df[["plant", "utilization_percent"]].itertuples(index=False, name=None):
             plant_bottlenecks.append(
                 {
-                    "plant": r.get("plant"),
-                    "utilization_percent": float(r.get("utilization_percent", 0.0) or 0.0),
+                    "plant": plant,
+                    "utilization_percent": float(util or 0.0),
                     "message": "Plant operating near max production capacity.",
                 }
             )
 
     # Routes fully utilized (trip fill rate)
     if transport_utilization_df is not None and not transport_utilization_df.empty:
-        df = transport_utilization_df.copy()
-        df = df[(df["trips"] > 0) & (df["utilization_percent"] >= float(route_threshold_percent))]
-        for _, r in df.iterrows():
+        df = transport_utilization_df
+        df = df.loc[(df["trips"].to_numpy() > 0) & (df["utilization_percent"].to_numpy() >= float(route_threshold_percent))]
+        route_cols = ["from", "to", "mode", "month", "utilization_percent"]
+        for src, dst, mode, month, util in df[route_cols].itertuples(index=False, name=None):
             route_bottlenecks.append(
                 {
-                    "from": r.get("from"),
-                    "to": r.get("to"),
-                    "mode": r.get("mode"),
-                    "month": r.get("month"),
-                    "utilization_percent": float(r.get("utilization_percent", 0.0) or 0.0),
+                    "from": src,
+                    "to": dst,
+                    "mode": mode,
+                    "month": month,
+                    "utilization_percent": float(util or 0.0),
                     "message": "Route trips are near full capacity.",
                 }
             )
 
     # Inventory consistently at safety stock (low buffer)
     if inventory_df is not None and not inventory_df.empty and "inventory" in inventory_df.columns and "plant_id" in inventory_df.columns:
-        inv_df = inventory_df.copy()
-        inv_df["safety_stock"] = inv_df["plant_id"].map(lambda pid: float(safety_stock_by_plant.get(str(pid), 0.0)))
-        inv_df["buffer"] = inv_df["inventory"] - inv_df["safety_stock"]
+        safety_stock = inventory_df["plant_id"].astype(str).map(safety_stock_by_plant).astype(float).fillna(0.0)
 
         # If scenario exists, we treat each row independently and then group.
-        grp_cols = ["plant_id", "plant"] if "plant" in inv_df.columns else ["plant_id"]
-        min_buf = inv_df.groupby(grp_cols, as_index=False)["buffer"].min()
-        min_buf = min_buf[min_buf["buffer"] <= float(inventory_buffer_threshold)]
+        grp_cols = ["plant_id", "plant"] if "plant" in inventory_df.columns else ["plant_id"]
+        inv_df = inventory_df.assign(
+            buffer=inventory_df["inventory"].astype(float).to_numpy() - safety_stock.to_numpy(),
+            **{col: inventory_df[col].astype("category") for col in grp_cols},
+        )
+        min_buf = inv_df.groupby(grp_cols, as_index=False, sort=False, observed=True)["buffer"].min()
+        min_buf = min_buf.loc[min_buf["buffer"].to_numpy() <= float(inventory_buffer_threshold)]
 
-        for _, r in min_buf.iterrows():
+        if "plant" not in min_buf.columns:
+            min_buf = min_buf.assign(plant=None)
+        for plant_id, plant, buffer in min_buf[["plant_id", "plant", "buffer"]].itertuples(index=False, name=None):
             inventory_bottlenecks.append(
                 {
-                    "plant": r.get("plant") or r.get("plant_id"),
-                    "min_buffer": float(r.get("buffer", 0.0) or 0.0),
+                    "plant": plant or plant_id,
+                    "min_buffer": float(buffer or 0.0),
                     "message": "Inventory hits safety stock (low buffer).",
                 }
             )
@@ -29,11 +29,15 @@ class CostDriverResults:
     mode_cost_df: pd.DataFrame
 
 
-def _safe_float(x: Any, default: float = 0.0) -> float:
-    try:
-        return float(x)
-    except Exception:
-        return float(default)
+def _route_cost_column(trans_df: pd.DataFrame, route_cost_per_trip: Dict[Tuple[str, str, str], float]) -> pd.Series:
+    """Look up cost per trip for every transport row in one vectorized pass.
+
+    The key columns must already be normalized to strings.
+    """
+
+    keys = pd.MultiIndex.from_arrays([trans_df["from_id"], trans_df["to_id"], trans_df["mode"]])
+    costs = pd.to_numeric(pd.Series(keys.map(route_cost_per_trip), index=trans_df.index), errors="coerce")
+    return costs.fillna(0.0).astype(float)
 
 
 def compute_cost_drivers(
@@ -42,56 +46,56 @@ def compute_cost_drivers(
     production_cost_by_plant: Dict[str, float],
     route_cost_per_trip: Dict[Tuple[str, str, str], float],
 ) -> CostDriverResults:
-    prod_df = pd.DataFrame(run.get("production_rows", []) or [])
-    trans_df = pd.DataFrame(run.get("transport_rows", []) or [])
+    prod_rows = run.get("production_rows") or []
+    prod_df = pd.DataFrame(prod_rows) if prod_rows else None
+    trans_rows = run.get("transport_rows") or []
+    trans_df = pd.DataFrame(trans_rows) if trans_rows else None
+
+    # Coerce numeric columns once per column (one C loop) instead of a
+    # float() call per row; bad/missing values become 0.0.
+    if prod_df is not None and "production" in prod_df.columns:
+        prod_df["production"] = pd.to_numeric(prod_df["production"], errors="coerce").fillna(0.0)
+    if trans_df is not None and "trips" in trans_df.columns:
+        trans_df["trips"] = pd.to_numeric(trans_df["trips"], errors="coerce").fillna(0.0)
 
     # Plant production cost contribution
     plant_rows: List[Dict[str, Any]] = []
     if prod_df is not None and not prod_df.empty and "plant_id" in prod_df.columns:
-        prod_df2 = prod_df.copy()
-        prod_df2["unit_cost"] = prod_df2["plant_id"].map(lambda pid: _safe_float(production_cost_by_plant.get(str(pid), 0.0)))
-        prod_df2["cost"] = prod_df2["production"].map(_safe_float) * prod_df2["unit_cost"]
-        grp = prod_df2.groupby(["plant_id"], as_index=False)["cost"].sum().sort_values("cost", ascending=False)
-        for _, r in grp.head(3).iterrows():
-            pid = str(r.get("plant_id"))
-            plant_rows.append({"plant": plant_names.get(pid, pid), "plant_id": pid, "cost": float(r.get("cost", 0.0) or 0.0)})
+        plant_ids = prod_df["plant_id"].astype(str)
+        unit_cost = plant_ids.map(production_cost_by_plant).astype(float).fillna(0.0)
+        prod_df2 = prod_df.assign(
+            plant_id=plant_ids.astype("category"),
+            unit_cost=unit_cost,
+            cost=prod_df["production"] * unit_cost,
+        )
+        grp = prod_df2.groupby(["plant_id"], as_index=False, sort=False, observed=True)["cost"].sum().nlargest(3, "cost")
+        for pid, cost in grp[["plant_id", "cost"]].itertuples(index=False, name=None):
+            plant_rows.append({"plant": plant_names.get(pid, pid), "plant_id": pid, "cost": float(cost or 0.0)})
     top_plants_df = pd.DataFrame(plant_rows)
 
-    # Route transport cost contribution
+    # Route transport cost contribution (per-row cost is computed once and
+    # shared by the route and mode aggregations below)
     route_rows: List[Dict[str, Any]] = []
+    mode_df = pd.DataFrame()
     if trans_df is not None and not trans_df.empty:
-        trans_df2 = trans_df.copy()
-        trans_df2["route_cost_per_trip"] = trans_df2.apply(
-            lambda r: _safe_float(route_cost_per_trip.get((str(r.get("from_id")), str(r.get("to_id")), str(r.get("mode"))), 0.0)),
-            axis=1,
-        )
-        trans_df2["cost"] = trans_df2["route_cost_per_trip"] * trans_df2["trips"].map(_safe_float)
         grp_cols = ["from_id", "to_id", "mode"]
-        grp = trans_df2.groupby(grp_cols, as_index=False)["cost"].sum().sort_values("cost", ascending=False)
-        for _, r in grp.head(3).iterrows():
-            i = str(r.get("from_id"))
-            j = str(r.get("to_id"))
-            mode = str(r.get("mode"))
+        trans_df2 = trans_df.assign(**{col: trans_df[col].astype(str).astype("category") for col in grp_cols})
+        trans_df2["route_cost_per_trip"] = _route_cost_column(trans_df2, route_cost_per_trip)
+        trans_df2["cost"] = trans_df2["route_cost_per_trip"] * trans_df2["trips"]
+        grp = trans_df2.groupby(grp_cols, as_index=False, sort=False, observed=True)["cost"].sum().nlargest(3, "cost")
+        for i, j, mode, cost in grp[grp_cols + ["cost"]].itertuples(index=False, name=None):
             route_rows.append(
                 {
                     "from": plant_names.get(i, i),
                     "to": plant_names.get(j, j),
                     "mode": mode,
-                    "cost": float(r.get("cost", 0.0) or 0.0),
+                    "cost": float(cost or 0.0),
                 }
             )
-    top_routes_df = pd.DataFrame(route_rows)
 
-    # Most expensive transport mode
-    mode_df = pd.DataFrame()
-    if trans_df is not None and not trans_df.empty and "mode" in trans_df.columns:
-        trans_df3 = trans_df.copy()
-        trans_df3["route_cost_per_trip"] = trans_df3.apply(
-            lambda r: _safe_float(route_cost_per_trip.get((str(r.get("from_id")), str(r.get("to_id")), str(r.get("mode"))), 0.0)),
-            axis=1,
-        )
-        trans_df3["cost"] = trans_df3["route_cost_per_trip"] * trans_df3["trips"].map(_safe_float)
-        mode_df = trans_df3.groupby(["mode"], as_index=False)["cost"].sum().sort_values("cost", ascending=False)
+        # Most expensive transport mode
+        mode_df = trans_df2.groupby(["mode"], as_index=False, sort=False, observed=True)["cost"].sum().sort_values("cost", ascending=False)
+    top_routes_df = pd.DataFrame(route_rows)
 
     return CostDriverResults(
         top_plants_df=top_plants_df,
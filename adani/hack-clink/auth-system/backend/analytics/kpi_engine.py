@@ -16,10 +16,13 @@ A KPI (Key Performance Indicator) is a single number that helps management answe
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from backend.analytics.utilization_analysis import gather_by_plant
+
 
 @dataclass
 class KPIResults:
@@ -33,10 +36,25 @@ def _safe_float(x: Any, default: float = 0.0) -> float:
         return float(default)
 
 
-def _run_tables(run: Dict[str, Any]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    prod_df = pd.DataFrame(run.get("production_rows", []) or [])
-    trans_df = pd.DataFrame(run.get("transport_rows", []) or [])
-    inv_df = pd.DataFrame(run.get("inventory_rows", []) or [])
+def _run_tables(
+    run: Dict[str, Any],
+) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """Build the run's row tables, returning None for missing/empty sections.
+
+    Skipping the DataFrame constructor for empty lists avoids allocating empty
+    frames for runs that have no rows in a section (e.g. no inventory).
+    """
+
+    prod_rows = run.get("production_rows") or []
+    trans_rows = run.get("transport_rows") or []
+    inv_rows = run.get("inventory_rows") or []
+    prod_df = pd.DataFrame(prod_rows) if prod_rows else None
+    trans_df = pd.DataFrame(trans_rows) if trans_rows else None
+    inv_df = pd.DataFrame(inv_rows) if inv_rows else None
+    if inv_df is not None and "inventory" in inv_df.columns:
+        # One column-wide coercion instead of per-row float() calls; missing
+        # values stay NaN so the means skip them.
+        inv_df["inventory"] = pd.to_numeric(inv_df["inventory"], errors="coerce")
     return prod_df, trans_df, inv_df
 
 
@@ -85,18 +103,48 @@ def compute_kpis(
     # Average inventory:
     # - deterministic: average over (plant,month)
     # - uncertainty: if scenario exists, compute expected average using scenario probabilities if provided.
+    #
+    # Buffer KPI (how far above safety stock inventory is on average).
+    #
+    # Both plain means come from a single .agg() pass over the inventory rows.
     avg_inventory = 0.0
+    avg_buffer = 0.0
     if inv_df is not None and not inv_df.empty and "inventory" in inv_df.columns:
+        inv_frame = inv_df[["inventory"]]
+        agg_spec = {"inventory": "mean"}
+        if "plant_id" in inv_df.columns:
+            inv_frame = inv_df[["inventory"]].assign(
+                buffer=inv_df["inventory"].to_numpy(dtype=float)
+                - gather_by_plant(inv_df["plant_id"], safety_stock_by_plant)
+            )
+            agg_spec["buffer"] = "mean"
+        means = inv_frame.agg(agg_spec)
+        avg_inventory = float(means["inventory"])
+        avg_buffer = float(means.get("buffer", 0.0))
+
         if "scenario" in inv_df.columns and scenario_probabilities:
-            inv_df2 = inv_df.copy()
-            inv_df2["prob"] = inv_df2["scenario"].map(lambda s: float(scenario_probabilities.get(str(s), 0.0)))
+            # Join against a small (scenario -> prob) lookup table instead of copying
+            # the inventory frame and mapping a Python lambda over every row.
+            probs = pd.DataFrame(
+                {
+                    "scenario": [str(s) for s in scenario_probabilities],
+                    "prob": [float(p) for p in scenario_probabilities.values()],
+                }
+            )
+            merged = inv_df[["scenario", "inventory"]].assign(scenario=inv_df["scenario"].astype(str))
+            merged = merged.merge(probs, on="scenario", how="left").fillna({"prob": 0.0})
             # Expected inventory across scenarios:
             # E[Inv] = sum_s prob_s * Inv_s
-            weighted = inv_df2["inventory"] * inv_df2["prob"]
-            denom = inv_df2["prob"].sum()
-            avg_inventory = float(weighted.sum() / denom) if denom > 0 else float(inv_df2["inventory"].mean())
-        else:
-            avg_inventory = float(inv_df["inventory"].mean())
+            # np.dot fuses the multiply and the sum (no intermediate array) on
+            # .to_numpy() views; missing inventory values fall back to nansum.
+            inv = merged["inventory"].to_numpy(dtype=np.float64, copy=False)
+            prob = merged["prob"].to_numpy(dtype=np.float64, copy=False)
+            denom = float(prob.sum())
+            if denom > 0:
+                num = float(np.dot(inv, prob))
+                if np.isnan(num):
+                    num = float(np.nansum(inv * prob))
+                avg_inventory = num / denom
 
     # Inventory turnover ratio (simple):
     # turnover = total demand / average inventory
@@ -106,14 +154,6 @@ def compute_kpis(
     if avg_inventory > 0:
         inventory_turnover = demand_total / avg_inventory
 
-    # Buffer KPI (how far above safety stock inventory is on average)
-    avg_buffer = 0.0
-    if inv_df is not None and not inv_df.empty and "plant_id" in inv_df.columns and "inventory" in inv_df.columns:
-        inv_df3 = inv_df.copy()
-        inv_df3["safety_stock"] = inv_df3["plant_id"].map(lambda pid: float(safety_stock_by_plant.get(str(pid), 0.0)))
-        inv_df3["buffer"] = inv_df3["inventory"] - inv_df3["safety_stock"]
-        avg_buffer = float(inv_df3["buffer"].mean())
-
     kpis: Dict[str, Any] = {
         "total_cost": float(total_cost),
         "cost_production": float(prod_cost),
@@ -15,6 +15,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 
@@ -32,6 +33,32 @@ def _safe_float(x: Any, default: float = 0.0) -> float:
         return float(default)
 
 
+def gather_by_plant(plant_ids: pd.Series, values_by_plant: Dict[str, float]) -> np.ndarray:
+    """Vectorized `values_by_plant.get(str(pid), 0.0)` for a column of plant ids.
+
+    Shared with kpi_engine.
+
+    Plant ids are encoded as categorical codes over the lookup's keys, then the
+    values are gathered from a NumPy array. Unknown plants get code -1, which
+    indexes the trailing 0.0 sentinel.
+    """
+
+    values = np.fromiter(
+        (_safe_float(v) for v in values_by_plant.values()), dtype=float, count=len(values_by_plant)
+    )
+    codes = pd.Categorical(plant_ids.astype(str), categories=list(values_by_plant)).codes
+    return np.append(values, 0.0)[codes]
+
+
+def _percent(numerator: pd.Series, denominator: pd.Series) -> np.ndarray:
+    """numerator / denominator * 100, or 0.0 where the denominator is not positive."""
+
+    num = numerator.to_numpy(dtype=float)
+    den = denominator.to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den > 0, num / den * 100.0, 0.0)
+
+
 def compute_utilization(
     run: Dict[str, Any],
     months: List[str],
@@ -40,80 +67,97 @@ def compute_utilization(
     max_inventory_by_plant: Dict[str, float],
     route_capacity_per_trip: Dict[Tuple[str, str, str], float],
 ) -> UtilizationResults:
-    prod_df = pd.DataFrame(run.get("production_rows", []) or [])
-    trans_df = pd.DataFrame(run.get("transport_rows", []) or [])
-    inv_df = pd.DataFrame(run.get("inventory_rows", []) or [])
+    prod_rows = run.get("production_rows") or []
+    prod_df = pd.DataFrame(prod_rows) if prod_rows else None
+    trans_rows = run.get("transport_rows") or []
+    trans_df = pd.DataFrame(trans_rows) if trans_rows else None
+    inv_rows = run.get("inventory_rows") or []
+    inv_df = pd.DataFrame(inv_rows) if inv_rows else None
+
+    # Coerce numeric columns once per column instead of per-row _safe_float calls.
+    # Missing inventory stays NaN so it is skipped by the mean (as before).
+    if prod_df is not None and "production" in prod_df.columns:
+        prod_df["production"] = pd.to_numeric(prod_df["production"], errors="coerce").fillna(0.0)
+    if inv_df is not None and "inventory" in inv_df.columns:
+        inv_df["inventory"] = pd.to_numeric(inv_df["inventory"], errors="coerce")
+
+    # Plant-name lookup as a Series so every section resolves names with a
+    # vectorized .map() instead of per-row dict.get() calls.
+    name_series = pd.Series(plant_names, dtype=object)
 
-    # Production utilization per plant (aggregated over months)
-    prod_util_rows: List[Dict[str, Any]] = []
+    # Production utilization per plant (aggregated over months).
+    # Capacity and utilization are added as columns on the groupby output
+    # instead of looping over it and rebuilding a frame from dicts.
+    production_utilization_df = pd.DataFrame()
     if prod_df is not None and not prod_df.empty:
-        prod_group = prod_df.groupby(["plant_id"], as_index=False)["production"].sum()
-        for _, r in prod_group.iterrows():
-            pid = str(r.get("plant_id"))
-            produced = _safe_float(r.get("production"))
-            cap = _safe_float(production_capacity_by_plant.get(pid, 0.0)) * max(len(months), 1)
-            util = (produced / cap * 100.0) if cap > 0 else 0.0
-            prod_util_rows.append(
-                {
-                    "plant_id": pid,
-                    "plant": plant_names.get(pid, pid),
-                    "production_total": produced,
-                    "capacity_total": cap,
-                    "utilization_percent": util,
-                }
-            )
-    production_utilization_df = pd.DataFrame(prod_util_rows)
+        g = prod_df.groupby(["plant_id"], as_index=False)["production"].sum()
+        g["plant_id"] = g["plant_id"].astype(str)
+        g["plant"] = g["plant_id"].map(name_series).fillna(g["plant_id"])
+        g["production_total"] = g["production"].astype(float)
+        g["capacity_total"] = gather_by_plant(g["plant_id"], production_capacity_by_plant) * max(len(months), 1)
+        g["utilization_percent"] = _percent(g["production_total"], g["capacity_total"])
+        production_utilization_df = g[
+            ["plant_id", "plant", "production_total", "capacity_total", "utilization_percent"]
+        ]
 
     # Transport utilization per route/mode: shipped / (trips * cap_per_trip)
-    trans_util_rows: List[Dict[str, Any]] = []
+    transport_utilization_df = pd.DataFrame()
     if trans_df is not None and not trans_df.empty:
-        for _, r in trans_df.iterrows():
-            i = str(r.get("from_id"))
-            j = str(r.get("to_id"))
-            mode = str(r.get("mode"))
-            month = str(r.get("month"))
-            shipped = _safe_float(r.get("shipment"))
-            trips = _safe_float(r.get("trips"))
-            cap_trip = _safe_float(route_capacity_per_trip.get((i, j, mode), 0.0))
-            denom = trips * cap_trip
-            util = (shipped / denom * 100.0) if denom > 0 else 0.0
-            trans_util_rows.append(
-                {
-                    "from": plant_names.get(i, i),
-                    "to": plant_names.get(j, j),
-                    "from_id": i,
-                    "to_id": j,
-                    "mode": mode,
-                    "month": month,
-                    "shipment": shipped,
-                    "trips": trips,
-                    "cap_per_trip": cap_trip,
-                    "trip_capacity_used": denom,
-                    "utilization_percent": util,
-                }
-            )
-    transport_utilization_df = pd.DataFrame(trans_util_rows)
+        # One merge against a (from_id, to_id, mode) -> cap_per_trip table replaces
+        # a per-row iterrows() loop with dict lookups.
+        key_cols = ["from_id", "to_id", "mode"]
+        cap_df = pd.DataFrame(
+            [(i, j, m, c) for (i, j, m), c in route_capacity_per_trip.items()],
+            columns=key_cols + ["cap_per_trip"],
+        ).astype({"from_id": str, "to_id": str, "mode": str})
+        # Older stored runs may lack some columns: missing keys read as "None"
+        # and missing numbers as 0.0, like the row.get() loop this replaced.
+        t = trans_df.assign(
+            **{
+                col: trans_df[col].astype(str) if col in trans_df.columns else "None"
+                for col in key_cols + ["month"]
+            },
+            **{
+                col: pd.to_numeric(trans_df[col], errors="coerce").fillna(0.0) if col in trans_df.columns else 0.0
+                for col in ("shipment", "trips")
+            },
+        ).merge(cap_df, on=key_cols, how="left")
+        t["cap_per_trip"] = pd.to_numeric(t["cap_per_trip"], errors="coerce").fillna(0.0)
+        denom = t["trips"].to_numpy(dtype=float) * t["cap_per_trip"].to_numpy(dtype=float)
+        shipped = t["shipment"].to_numpy(dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            util = np.where(denom > 0, shipped / denom * 100.0, 0.0)
+        t["trip_capacity_used"] = denom
+        t["utilization_percent"] = util
+        t["from"] = t["from_id"].map(name_series).fillna(t["from_id"])
+        t["to"] = t["to_id"].map(name_series).fillna(t["to_id"])
+        transport_utilization_df = t[
+            [
+                "from",
+                "to",
+                "from_id",
+                "to_id",
+                "mode",
+                "month",
+                "shipment",
+                "trips",
+                "cap_per_trip",
+                "trip_capacity_used",
+                "utilization_percent",
+            ]
+        ].reset_index(drop=True)
 
     # Storage utilization per plant: avg inventory / max inventory
-    storage_rows: List[Dict[str, Any]] = []
+    storage_utilization_df = pd.DataFrame()
     if inv_df is not None and not inv_df.empty and "inventory" in inv_df.columns and "plant_id" in inv_df.columns:
         # If scenarios exist, use average across all rows (simple, consistent).
-        inv_group = inv_df.groupby(["plant_id"], as_index=False)["inventory"].mean()
-        for _, r in inv_group.iterrows():
-            pid = str(r.get("plant_id"))
-            avg_inv = _safe_float(r.get("inventory"))
-            max_inv = _safe_float(max_inventory_by_plant.get(pid, 0.0))
-            util = (avg_inv / max_inv * 100.0) if max_inv > 0 else 0.0
-            storage_rows.append(
-                {
-                    "plant_id": pid,
-                    "plant": plant_names.get(pid, pid),
-                    "avg_inventory": avg_inv,
-                    "max_inventory": max_inv,
-                    "utilization_percent": util,
-                }
-            )
-    storage_utilization_df = pd.DataFrame(storage_rows)
+        g = inv_df.groupby(["plant_id"], as_index=False)["inventory"].mean()
+        g["plant_id"] = g["plant_id"].astype(str)
+        g["plant"] = g["plant_id"].map(name_series).fillna(g["plant_id"])
+        g["avg_inventory"] = g["inventory"].astype(float)
+        g["max_inventory"] = gather_by_plant(g["plant_id"], max_inventory_by_plant)
+        g["utilization_percent"] = _percent(g["avg_inventory"], g["max_inventory"])
+        storage_utilization_df = g[["plant_id", "plant", "avg_inventory", "max_inventory", "utilization_percent"]]
 
     return UtilizationResults(
         production_utilization_df=production_utilization_df,
@@ -10,14 +10,28 @@ It talks to:
 - password (to hash and verify passwords)
 
 It does NOT contain Streamlit UI code.
+
+Login lookups go through a short-lived (30s) in-process cache so repeated
+auth attempts do not hit MongoDB every time. Only the user document is cached;
+the password is still verified on every login. Anything that changes a user
+(role, active flag, password hash) must call invalidate_cached_user().
 """
 
 from __future__ import annotations
 
-from typing import Tuple
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from cachetools import TTLCache, cached
 
-from backend.auth.password import hash_password, verify_password
-from backend.database.user_repository import create_user, find_user_by_email
+from backend.auth.password import hash_password, needs_rehash, verify_password
+from backend.core.logger import log_exception
+from backend.database.user_repository import (
+    bulk_create_users,
+    create_user,
+    find_user_by_email,
+    set_user_password_hash,
+)
 from utils.validators import (
     validate_email,
     validate_name,
@@ -26,6 +40,23 @@ from utils.validators import (
 )
 
 
+# TTLCache is not thread-safe and Streamlit sessions run in separate threads.
+_USER_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=30)
+_USER_CACHE_LOCK = threading.Lock()
+
+
+@cached(_USER_CACHE, key=lambda email: email, lock=_USER_CACHE_LOCK)
+def _find_user_cached(email: str) -> Optional[Dict[str, Any]]:
+    return find_user_by_email(email)
+
+
+def invalidate_cached_user(email: str) -> None:
+    """Drop a user from the login lookup cache (call after any user update)."""
+
+    with _USER_CACHE_LOCK:
+        _USER_CACHE.pop((email or "").strip().lower(), None)
+
+
 def signup(name: str, email: str, password: str, role: str) -> Tuple[bool, str]:
     """Create a new user.
 
@@ -64,9 +95,59 @@ def signup(name: str, email: str, password: str, role: str) -> Tuple[bool, str]:
     if not created:
         return False, "An account with this email already exists."
 
+    # A failed login just before signup may have cached "no such user".
+    invalidate_cached_user(normalized_email)
+
     return True, "Account created successfully. You can now login."
 
 
+def bulk_signup(rows: List[Dict[str, Any]]) -> Tuple[bool, str]:
+    """Create many users with one database write.
+
+    Each row needs: name, email, password, role. Nothing is written if any
+    row is invalid. Emails that already exist are skipped (same rule as signup).
+    """
+
+    docs: List[Dict[str, Any]] = []
+    for row_no, row in enumerate(rows, start=1):
+        for ok, msg in (
+            validate_name(row.get("name") or ""),
+            validate_email(row.get("email") or ""),
+            validate_password(row.get("password") or ""),
+            validate_role(row.get("role") or ""),
+        ):
+            if not ok:
+                return False, f"Row {row_no}: {msg}"
+
+        docs.append(
+            {
+                "name": row["name"].strip(),
+                "email": row["email"].strip().lower(),
+                "password_hash": hash_password(row["password"]),
+                "role": row["role"].strip(),
+            }
+        )
+
+    if not docs:
+        return False, "No users to create."
+
+    try:
+        inserted, errors = bulk_create_users(docs)
+    except Exception:
+        return False, "Failed to create users."
+
+    # Same as signup(): drop any cached "no such user" for the new accounts.
+    failed = {int(err.get("index", -1)) for err in errors}
+    for index, doc in enumerate(docs):
+        if index not in failed:
+            invalidate_cached_user(doc["email"])
+
+    msg = f"Created {inserted} users."
+    if errors:
+        msg += f" {len(errors)} skipped (email already exists or invalid)."
+    return inserted > 0, msg
+
+
 def login(email: str, password: str) -> Tuple[bool, str, object]:
     """Login a user.
 
@@ -84,7 +165,7 @@ def login(email: str, password: str) -> Tuple[bool, str, object]:
 
     normalized_email = email.strip().lower()
 
-    user = find_user_by_email(normalized_email)
+    user = _find_user_cached(normalized_email)
     if user is None:
         # Do not reveal whether the email exists (small security best practice).
         return False, "Invalid email or password.", None
@@ -94,7 +175,17 @@ def login(email: str, password: str) -> Tuple[bool, str, object]:
     if user.get("is_active", True) is False:
         return False, "Your account is disabled. Please contact an administrator.", None
 
-    if not verify_password(password, user.get("password_hash", "")):
+    stored_hash = user.get("password_hash", "")
+    if not verify_password(password, stored_hash):
         return False, "Invalid email or password.", None
 
+    # Upgrade legacy bcrypt hashes (or outdated Argon2 parameters) while we
+    # have the plain password. A failed upgrade must never block the login.
+    if needs_rehash(stored_hash):
+        try:
+            set_user_password_hash(normalized_email, hash_password(password))
+            invalidate_cached_user(normalized_email)
+        except Exception as e:
+            log_exception("Password hash upgrade failed", e, {"email": normalized_email})
+
     return True, "Login successful.", user
@@ -4,34 +4,58 @@ Security rule:
 - NEVER store plain-text passwords.
 - Always store a salted hash.
 
-We use bcrypt:
+We use Argon2id (argon2-cffi):
 - It automatically generates a salt.
-- It is designed to be slow (makes brute-force harder).
+- It is memory-hard, so brute-force stays expensive while a single verify
+  on login is much faster than bcrypt at a comparable security level.
+
+Older accounts were hashed with bcrypt ("$2b$..." hashes). Those still verify,
+and login upgrades them to Argon2 (see needs_rehash()).
 """
 
 from __future__ import annotations
 
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 
-def hash_password(plain_password: str) -> str:
-    """Hash a password and return a UTF-8 string for storage."""
+# One hasher for the whole process (it is stateless and thread-safe).
+_ph = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
 
-    password_bytes = plain_password.encode("utf-8")
 
-    # gensalt() creates a random salt.
-    salt = bcrypt.gensalt(rounds=12)
+def _is_bcrypt_hash(password_hash: str) -> bool:
+    return password_hash.startswith(("$2a$", "$2b$", "$2y$"))
 
-    hashed = bcrypt.hashpw(password_bytes, salt)
 
-    # Store as string in DB.
-    return hashed.decode("utf-8")
+def hash_password(plain_password: str) -> str:
+    """Hash a password and return a string for storage."""
+
+    return _ph.hash(plain_password)
 
 
 def verify_password(plain_password: str, password_hash: str) -> bool:
-    """Verify a password against a stored hash."""
+    """Verify a password against a stored hash (Argon2 or legacy bcrypt)."""
+
+    if not password_hash:
+        return False
+
+    if _is_bcrypt_hash(password_hash):
+        return bcrypt.checkpw(plain_password.encode("utf-8"), password_hash.encode("utf-8"))
+
+    try:
+        return _ph.verify(password_hash, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Return True when a stored hash should be replaced after a successful login."""
 
-    plain_bytes = plain_password.encode("utf-8")
-    hash_bytes = password_hash.encode("utf-8")
+    if _is_bcrypt_hash(password_hash):
+        return True
 
-    return bcrypt.checkpw(plain_bytes, hash_bytes)
+    try:
+        return _ph.check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return True
@@ -13,7 +13,7 @@ We store:
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+import time
 
 import streamlit as st
 
@@ -39,7 +39,8 @@ def ensure_session_defaults() -> None:
         st.session_state.user_role = None
 
     # Phase 6: session timeout support.
-    # We store last_activity as an ISO timestamp.
+    # We store last_activity as epoch seconds (int) so the per-rerun timeout
+    # check is a plain integer compare instead of a datetime parse.
     if "last_activity" not in st.session_state:
         st.session_state.last_activity = None
 
@@ -53,17 +54,9 @@ def is_authenticated() -> bool:
     # Enforce timeout.
     cfg = get_config()
     last = st.session_state.get("last_activity")
-    if last:
-        try:
-            last_dt = datetime.fromisoformat(str(last))
-        except Exception:
-            last_dt = None
-
-        if last_dt is not None:
-            now = datetime.now(timezone.utc)
-            if now - last_dt > timedelta(minutes=int(cfg.session_timeout_minutes)):
-                logout_user()
-                return False
+    if isinstance(last, int) and time.time() - last > int(cfg.session_timeout_minutes) * 60:
+        logout_user()
+        return False
 
     # Update activity timestamp on access.
     touch_session_activity()
@@ -73,7 +66,7 @@ def is_authenticated() -> bool:
 def touch_session_activity() -> None:
     """Update the session's last activity timestamp."""
 
-    st.session_state.last_activity = datetime.now(timezone.utc).isoformat()
+    st.session_state.last_activity = int(time.time())
 
 
 def login_user(user_doc) -> None:
@@ -5,14 +5,17 @@ Goal:
 
 Important:
 - Streamlit caches are per-process.
-- Caching is safe for master data that changes infrequently (plants, routes).
+- Caching is safe for master data that changes infrequently (plants, routes, policies, demands).
+- Service write paths call `.clear()` on the matching loader so edits show up immediately.
+- Plants and routes use `cache_resource`: every caller gets the same list object
+  (no per-call copy), so callers must treat the returned documents as read-only.
 
 We keep caching in a separate module so business logic remains unchanged.
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import streamlit as st
 
@@ -26,15 +29,52 @@ def cache_data(ttl_seconds: int = 60) -> Callable[[Callable[..., Any]], Callable
     return _decorator
 
 
-@cache_data(ttl_seconds=60)
-def cached_get_all_plants(include_inactive: bool = False):
+def cache_resource(ttl_seconds: int = 300) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Small wrapper around st.cache_resource with a TTL.
+
+    Unlike cache_data, the cached value is returned by reference (not copied),
+    which is cheaper for read-only master data that is read many times per rerun.
+    """
+
+    def _decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        return st.cache_resource(ttl=ttl_seconds, show_spinner=False)(fn)
+
+    return _decorator
+
+
+def _projection(fields: Optional[Tuple[str, ...]]) -> Optional[Dict[str, int]]:
+    """Turn a hashable field tuple (part of the cache key) into a Mongo projection."""
+
+    return {f: 1 for f in fields} if fields else None
+
+
+@cache_resource(ttl_seconds=300)
+def cached_get_all_plants(include_inactive: bool = False, fields: Optional[Tuple[str, ...]] = None):
+    """All plants; pass `fields` to fetch only those fields (cached separately)."""
+
     from backend.plant.plant_service import get_all_plants
 
-    return get_all_plants(include_inactive=include_inactive)
+    return get_all_plants(include_inactive=include_inactive, projection=_projection(fields))
+
 
+@cache_resource(ttl_seconds=300)
+def cached_get_all_routes(include_disabled: bool = True, fields: Optional[Tuple[str, ...]] = None):
+    """All routes; pass `fields` to fetch only those fields (cached separately)."""
 
-@cache_data(ttl_seconds=60)
-def cached_get_all_routes(include_disabled: bool = True):
     from backend.transport.transport_service import get_all_routes
 
-    return get_all_routes(include_disabled=include_disabled)
+    return get_all_routes(include_disabled=include_disabled, projection=_projection(fields))
+
+
+@cache_data(ttl_seconds=300)
+def cached_get_all_policies():
+    from backend.inventory.inventory_service import get_all_policies
+
+    return get_all_policies()
+
+
+@cache_data(ttl_seconds=300)
+def cached_get_all_demands():
+    from backend.demand.demand_service import get_all_demands
+
+    return get_all_demands()
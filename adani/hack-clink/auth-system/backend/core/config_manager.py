@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
@@ -65,8 +66,15 @@ def _get_float(name: str, default: float) -> float:
         return float(default)
 
 
+@lru_cache(maxsize=1)
 def get_config() -> AppConfig:
-    """Load configuration from environment variables."""
+    """Load configuration from environment variables.
+
+    The result is cached for the life of the process: AppConfig is frozen and the
+    environment does not change between Streamlit reruns, but get_config() is
+    called on every auth check and log line. Use reload_config() after changing
+    environment variables (e.g. in tests).
+    """
 
     app_env = os.getenv("APP_ENV", "development").strip().lower()
 
@@ -80,3 +88,10 @@ def get_config() -> AppConfig:
         default_mip_gap=_get_float("SOLVER_MIP_GAP", 0.01),
         solver_logs_enabled=_get_bool("SOLVER_LOGS_ENABLED", True),
     )
+
+
+def reload_config() -> AppConfig:
+    """Drop the cached config and re-read it from the environment."""
+
+    get_config.cache_clear()
+    return get_config()
@@ -2,7 +2,9 @@
 
 This module provides:
 - File logging (rotating log file)
-- Optional MongoDB audit log storage
+- Optional MongoDB audit log storage (batched by a background thread, so
+  audit events never wait on a MongoDB round-trip; the file log is the
+  source of truth)
 
 Design goal:
 - UI shows friendly messages.
@@ -16,26 +18,49 @@ Audit log examples:
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import queue
+import threading
+import time
 from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
 from typing import Any, Dict, Optional
 
+import orjson
+
 from backend.core.config_manager import get_config
 
 
 _LOGGER: logging.Logger | None = None
 
+# Captured once when the logger is built so audit_log() does not need to
+# consult the config on every event.
+_AUDIT_TO_MONGO: bool = False
+
+# Pending audit documents for MongoDB, drained in batches by _audit_writer().
+_AUDIT_QUEUE: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=10_000)
+_AUDIT_BATCH_SIZE = 200
+_AUDIT_BATCH_WAIT_SECONDS = 0.05
+_AUDIT_THREAD: threading.Thread | None = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize log context with orjson (datetime/UUID handled natively)."""
+
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
 
 def get_logger() -> logging.Logger:
-    global _LOGGER
+    global _LOGGER, _AUDIT_TO_MONGO
 
     if _LOGGER is not None:
         return _LOGGER
 
     cfg = get_config()
+    _AUDIT_TO_MONGO = bool(cfg.audit_log_to_mongo)
+    if _AUDIT_TO_MONGO:
+        _start_audit_writer()
     logger = logging.getLogger("clinker_app")
 
     # Avoid duplicate handlers on Streamlit re-runs.
@@ -71,6 +96,39 @@ def _audit_doc(event_type: str, actor_email: str | None, details: Dict[str, Any]
     }
 
 
+def _audit_writer() -> None:
+    """Background loop: collect queued audit docs and write them with insert_many."""
+
+    from backend.database.mongo import get_audit_logs_collection
+
+    while True:
+        batch = [_AUDIT_QUEUE.get()]
+        deadline = time.monotonic() + _AUDIT_BATCH_WAIT_SECONDS
+        while len(batch) < _AUDIT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_AUDIT_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            get_audit_logs_collection().insert_many(batch, ordered=False)
+        except Exception:
+            # Never fail the app because audit logging failed.
+            get_logger().warning("AUDIT | failed to write %d entries to MongoDB", len(batch), exc_info=True)
+
+
+def _start_audit_writer() -> None:
+    global _AUDIT_THREAD
+
+    if _AUDIT_THREAD is not None and _AUDIT_THREAD.is_alive():
+        return
+    _AUDIT_THREAD = threading.Thread(target=_audit_writer, name="audit-log-writer", daemon=True)
+    _AUDIT_THREAD.start()
+
+
 def audit_log(event_type: str, actor_email: str | None, details: Dict[str, Any]) -> None:
     """Write an audit log entry to file and (optionally) MongoDB."""
 
@@ -78,22 +136,18 @@ def audit_log(event_type: str, actor_email: str | None, details: Dict[str, Any])
     safe_details = details or {}
 
     # Always log to file.
-    logger.info("AUDIT | %s | %s", event_type, json.dumps({"actor": actor_email, **safe_details}, default=str))
+    logger.info("AUDIT | %s | %s", event_type, _dumps({"actor": actor_email, **safe_details}))
 
-    cfg = get_config()
-    if not cfg.audit_log_to_mongo:
+    if not _AUDIT_TO_MONGO:
         return
 
     try:
-        from backend.database.mongo import get_audit_logs_collection
-
-        coll = get_audit_logs_collection()
-        coll.insert_one(_audit_doc(event_type, actor_email, safe_details))
-    except Exception:
-        # Never fail the app because audit logging failed.
-        logger.warning("AUDIT | failed to write to MongoDB", exc_info=True)
+        _AUDIT_QUEUE.put_nowait(_audit_doc(event_type, actor_email, safe_details))
+    except queue.Full:
+        # Never block the app on audit logging; the file log above still has it.
+        logger.warning("AUDIT | MongoDB queue full, dropping %s event", event_type)
 
 
 def log_exception(message: str, exc: Exception, context: Optional[Dict[str, Any]] = None) -> None:
     logger = get_logger()
-    logger.error("%s | context=%s", message, json.dumps(context or {}, default=str), exc_info=True)
+    logger.error("%s | context=%s", message, _dumps(context or {}), exc_info=True)
@@ -5,12 +5,21 @@ We use pymongo to connect to MongoDB.
 Important notes:
 - The connection string (URI) is stored in environment variables.
 - We create a unique index on email to prevent duplicate accounts.
+- Each get_*_collection() helper is cached (functools.lru_cache), so the
+  collection handle is built and its indexes ensured once per process; later
+  calls return the same handle without any create_index round-trips.
+- Nothing connects at import time: the first call opens the client.
 """
 
 from __future__ import annotations
 
+import threading
+from functools import lru_cache
+
 from pymongo import MongoClient
+from pymongo.errors import PyMongoError
 
+from backend.core.logger import get_logger
 from utils.config import (
     get_mongo_db_name,
     get_mongo_uri,
@@ -29,11 +38,34 @@ def get_client() -> MongoClient:
     global _client
 
     if _client is None:
-        _client = MongoClient(get_mongo_uri())
+        _client = MongoClient(
+            get_mongo_uri(),
+            maxPoolSize=50,
+            minPoolSize=5,
+            # Fail fast (3s instead of the 30s default) when MongoDB is down.
+            serverSelectionTimeoutMS=3000,
+            connectTimeoutMS=3000,
+            retryWrites=True,
+            # Shows up in MongoDB logs / currentOp so app traffic is easy to spot.
+            appname="clinker_app",
+        )
+        # Warm up server discovery in the background so the first user query
+        # (usually login) does not pay for it, without blocking the page
+        # render when MongoDB is down.
+        threading.Thread(target=_warm_up, args=(_client,), name="mongo-warm-up", daemon=True).start()
 
     return _client
 
 
+def _warm_up(client: MongoClient) -> None:
+    """Ping once to start server discovery; a failure is only logged."""
+
+    try:
+        client.admin.command("ping")
+    except PyMongoError as e:
+        get_logger().warning("MongoDB warm-up ping failed: %s", e)
+
+
 def get_db():
     """Get the MongoDB database object."""
 
@@ -41,6 +73,7 @@ def get_db():
     return client[get_mongo_db_name()]
 
 
+@lru_cache(maxsize=None)
 def get_users_collection():
     """Get the users collection and ensure indexes exist."""
 
@@ -50,10 +83,13 @@ def get_users_collection():
     # Unique index ensures email cannot be duplicated.
     # If the index already exists, MongoDB keeps it.
     users.create_index("email", unique=True)
+    # list_users() sorts newest first.
+    users.create_index([("created_at", -1)])
 
     return users
 
 
+@lru_cache(maxsize=None)
 def get_plants_collection():
     """Get the plants collection and ensure indexes exist."""
 
@@ -66,6 +102,7 @@ def get_plants_collection():
     return plants
 
 
+@lru_cache(maxsize=None)
 def get_demands_collection():
     """Get the demands collection and ensure indexes exist."""
 
@@ -77,10 +114,13 @@ def get_demands_collection():
         [("plant_id", 1), ("month", 1), ("demand_type", 1)],
         unique=True,
     )
+    # list_demands() sorts by month, then plant name.
+    demands.create_index([("month", 1), ("plant_name", 1)])
 
     return demands
 
 
+@lru_cache(maxsize=None)
 def get_transport_routes_collection():
     """Get the transport_routes collection and ensure indexes exist."""
 
@@ -96,6 +136,7 @@ def get_transport_routes_collection():
     return routes
 
 
+@lru_cache(maxsize=None)
 def get_inventory_policies_collection():
     """Get the inventory_policies collection and ensure indexes exist."""
 
@@ -108,6 +149,7 @@ def get_inventory_policies_collection():
     return policies
 
 
+@lru_cache(maxsize=None)
 def get_optimization_results_collection():
     """Get the optimization_results collection for run history."""
 
@@ -120,6 +162,7 @@ def get_optimization_results_collection():
     return results
 
 
+@lru_cache(maxsize=None)
 def get_demand_uncertainty_collection():
     """Get the demand_uncertainty_settings collection.
 
@@ -135,6 +178,7 @@ def get_demand_uncertainty_collection():
     return settings
 
 
+@lru_cache(maxsize=None)
 def get_audit_logs_collection():
     """Get the audit_logs collection.
 
@@ -16,19 +16,50 @@ A user document looks like:
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pymongo.errors import DuplicateKeyError
+from cachetools import TTLCache, cached
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from backend.database.mongo import get_users_collection
 
 
+# Dashboard counts (count_users / role_distribution) are cached for 30 seconds.
+# Writes in this module that change them call _invalidate_user_stats().
+# Callers must treat the returned dicts as read-only (they are shared).
+_STATS_CACHE: TTLCache = TTLCache(maxsize=2, ttl=30)
+_STATS_CACHE_LOCK = threading.Lock()
+
+
+def _invalidate_user_stats() -> None:
+    with _STATS_CACHE_LOCK:
+        _STATS_CACHE.clear()
+
+
+_AUTH_PROJECTION: Dict[str, int] = {"name": 1, "email": 1, "password_hash": 1, "role": 1, "is_active": 1}
+
+
 def find_user_by_email(email: str) -> Optional[Dict[str, Any]]:
     """Find a single user by email."""
 
     users = get_users_collection()
-    return users.find_one({"email": email})
+    # Login only needs these fields (_id is always returned); the hint pins the
+    # unique email index that get_users_collection() creates.
+    return users.find_one({"email": email}, _AUTH_PROJECTION, hint=[("email", 1)])
+
+
+def _user_doc(name: str, email: str, password_hash: str, role: str) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "email": email,
+        "password_hash": password_hash,
+        "role": role,
+        # Accounts are enabled by default.
+        "is_active": True,
+        "created_at": datetime.now(timezone.utc),
+    }
 
 
 def create_user(name: str, email: str, password_hash: str, role: str) -> bool:
@@ -41,24 +72,47 @@ def create_user(name: str, email: str, password_hash: str, role: str) -> bool:
 
     users = get_users_collection()
 
-    doc = {
-        "name": name,
-        "email": email,
-        "password_hash": password_hash,
-        "role": role,
-        # Accounts are enabled by default.
-        "is_active": True,
-        "created_at": datetime.now(timezone.utc),
-    }
+    doc = _user_doc(name=name, email=email, password_hash=password_hash, role=role)
 
     try:
         users.insert_one(doc)
+        _invalidate_user_stats()
         return True
     except DuplicateKeyError:
         # Email already exists (because of the unique index).
         return False
 
 
+def bulk_create_users(rows: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+    """Create many users in one round-trip.
+
+    Each row needs: name, email, password_hash, role.
+
+    Returns:
+- (inserted_count, write_errors)
+  Duplicate emails are reported in write_errors (code 11000) instead of
+  aborting the batch, matching create_user()'s duplicate handling per row.
+    """
+
+    if not rows:
+        return 0, []
+
+    users = get_users_collection()
+    docs = [
+        _user_doc(name=r["name"], email=r["email"], password_hash=r["password_hash"], role=r["role"])
+        for r in rows
+    ]
+
+    try:
+        result = users.insert_many(docs, ordered=False)
+        return len(result.inserted_ids), []
+    except BulkWriteError as exc:
+        details = exc.details or {}
+        return int(details.get("nInserted", 0)), list(details.get("writeErrors", []))
+    finally:
+        _invalidate_user_stats()
+
+
 def list_users() -> List[Dict[str, Any]]:
     """List all users for admin UI."""
 
@@ -67,7 +121,7 @@ def list_users() -> List[Dict[str, Any]]:
     # Exclude password hash from UI results.
     projection = {"password_hash": 0}
 
-    return list(users.find({}, projection).sort("created_at", -1))
+    return list(users.find({}, projection).sort("created_at", -1).batch_size(500))
 
 
 def set_user_role(email: str, role: str) -> bool:
@@ -75,6 +129,16 @@ def set_user_role(email: str, role: str) -> bool:
 
     users = get_users_collection()
     result = users.update_one({"email": email}, {"$set": {"role": role}})
+    if result.modified_count == 1:
+        _invalidate_user_stats()
+    return result.modified_count == 1
+
+
+def set_user_password_hash(email: str, password_hash: str) -> bool:
+    """Replace a user's stored password hash (used to upgrade old hashes)."""
+
+    users = get_users_collection()
+    result = users.update_one({"email": email}, {"$set": {"password_hash": password_hash}})
     return result.modified_count == 1
 
 
@@ -83,21 +147,42 @@ def set_user_active(email: str, is_active: bool) -> bool:
 
     users = get_users_collection()
     result = users.update_one({"email": email}, {"$set": {"is_active": bool(is_active)}})
+    if result.modified_count == 1:
+        _invalidate_user_stats()
     return result.modified_count == 1
 
 
+@cached(_STATS_CACHE, key=lambda: "count_users", lock=_STATS_CACHE_LOCK)
 def count_users() -> Dict[str, int]:
-    """Return summary counts for dashboard cards."""
+    """Return summary counts for dashboard cards.
+
+    "total" is exact: it is the sum of the $group buckets below, so it costs
+    no extra query (estimated_document_count() would only save a call we no
+    longer make, and can drift after unclean shutdowns).
+    """
 
     users = get_users_collection()
 
-    total = users.count_documents({})
-    active = users.count_documents({"is_active": True})
-    inactive = users.count_documents({"is_active": False})
+    # One $group pass instead of three count_documents round-trips.
+    # Users without an is_active field land in the None group: they count
+    # toward the total but neither active nor inactive (same as before).
+    pipeline = [{"$group": {"_id": "$is_active", "count": {"$sum": 1}}}]
+
+    total = 0
+    active = 0
+    inactive = 0
+    for row in users.aggregate(pipeline):
+        count = int(row.get("count", 0))
+        total += count
+        if row.get("_id") is True:
+            active = count
+        elif row.get("_id") is False:
+            inactive = count
 
     return {"total": total, "active": active, "inactive": inactive}
 
 
+@cached(_STATS_CACHE, key=lambda: "role_distribution", lock=_STATS_CACHE_LOCK)
 def role_distribution() -> Dict[str, int]:
     """Return counts per role."""
 
@@ -0,0 +1,27 @@
+"""Small helpers shared by the repository modules."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+from bson import ObjectId
+
+
+@lru_cache(maxsize=4096)
+def _parse_oid(value: str) -> ObjectId:
+    return ObjectId(value)
+
+
+def to_oid(value: Any) -> ObjectId:
+    """Convert an id string to ObjectId, reusing earlier parses of the same string.
+
+    A single write often parses the same plant id several times (validation,
+    duplicate check, insert), so parsed strings are cached.
+    Invalid strings still raise bson.errors.InvalidId, exactly like ObjectId().
+    Non-strings are not cached: ObjectId(None) must keep generating a new id.
+    """
+
+    if isinstance(value, str):
+        return _parse_oid(value)
+    return ObjectId(value)
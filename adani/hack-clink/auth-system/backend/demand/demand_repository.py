@@ -16,18 +16,26 @@ Demand document shape:
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from backend.database.mongo import get_demands_collection
+from backend.database.util import to_oid
 
 
-def list_demands() -> List[Dict[str, Any]]:
-    """Return all demand documents."""
+# Fields the list views and the optimizer never read; leaving them out keeps
+# each returned document smaller on the wire and in memory.
+_LIST_PROJECTION: Dict[str, int] = {"created_at": 0}
+
+
+def list_demands(projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    """Return all demand documents (without created_at unless a projection is given)."""
 
     demands = get_demands_collection()
-    return list(demands.find({}).sort([("month", 1), ("plant_name", 1)]))
+    cursor = demands.find({}, projection or _LIST_PROJECTION).sort([("month", 1), ("plant_name", 1)])
+    return list(cursor.batch_size(500))
 
 
 def find_demand_by_id(demand_id: str) -> Optional[Dict[str, Any]]:
@@ -36,7 +44,7 @@ def find_demand_by_id(demand_id: str) -> Optional[Dict[str, Any]]:
     demands = get_demands_collection()
 
     try:
-        oid = ObjectId(demand_id)
+        oid = to_oid(demand_id)
     except Exception:
         return None
 
@@ -49,24 +57,20 @@ def find_duplicate(plant_id: str, month: str, demand_type: str, exclude_id: str
     demands = get_demands_collection()
 
     query: Dict[str, Any] = {
-        "plant_id": ObjectId(plant_id),
+        "plant_id": to_oid(plant_id),
         "month": month,
         "demand_type": demand_type,
     }
 
     if exclude_id:
-        query["_id"] = {"$ne": ObjectId(exclude_id)}
+        query["_id"] = {"$ne": to_oid(exclude_id)}
 
     return demands.find_one(query)
 
 
-def create_demand(data: Dict[str, Any]) -> str:
-    """Insert a new demand document."""
-
-    demands = get_demands_collection()
-
-    doc = {
-        "plant_id": ObjectId(data["plant_id"]),
+def _demand_doc(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "plant_id": to_oid(data["plant_id"]),
         "plant_name": data["plant_name"],
         "month": data["month"],
         "demand_quantity": float(data["demand_quantity"]),
@@ -74,23 +78,110 @@ def create_demand(data: Dict[str, Any]) -> str:
         "created_at": datetime.now(timezone.utc),
     }
 
-    result = demands.insert_one(doc)
+
+def create_demand(data: Dict[str, Any]) -> str:
+    """Insert a new demand document."""
+
+    demands = get_demands_collection()
+
+    result = demands.insert_one(_demand_doc(data))
     return str(result.inserted_id)
 
 
+def upsert_demand(data: Dict[str, Any]) -> Optional[str]:
+    """Insert a demand unless one already exists for (plant_id, month, demand_type).
+
+    The duplicate check and the insert are a single update_one(upsert=True) with
+    $setOnInsert, backed by the unique (plant_id, month, demand_type) index from
+    get_demands_collection(). Existing documents are never modified.
+
+    Returns:
+- the new demand id as a string
+- None if a matching demand already exists
+    """
+
+    demands = get_demands_collection()
+
+    doc = _demand_doc(data)
+    key = {"plant_id": doc["plant_id"], "month": doc["month"], "demand_type": doc["demand_type"]}
+
+    try:
+        result = demands.update_one(key, {"$setOnInsert": doc}, upsert=True)
+    except DuplicateKeyError:
+        # A concurrent request inserted the same key between match and insert.
+        return None
+
+    if result.upserted_id is None:
+        return None
+    return str(result.upserted_id)
+
+
+def bulk_create_demands(rows: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+    """Insert many demand documents in one round-trip.
+
+    Returns:
+- (inserted_count, write_errors)
+  write_errors are MongoDB's per-row errors (e.g. duplicate plant/month/type);
+  the other rows are still inserted because the batch is unordered.
+    """
+
+    if not rows:
+        return 0, []
+
+    demands = get_demands_collection()
+
+    try:
+        result = demands.insert_many([_demand_doc(r) for r in rows], ordered=False)
+        return len(result.inserted_ids), []
+    except BulkWriteError as exc:
+        details = exc.details or {}
+        return int(details.get("nInserted", 0)), list(details.get("writeErrors", []))
+
+
+def bulk_upsert_demands(rows: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+    """Upsert many demands in one bulk_write round-trip (import path).
+
+    Same semantics as upsert_demand() per row: rows whose (plant_id, month,
+    demand_type) already exists are left untouched.
+
+    Returns:
+- (inserted_count, write_errors)
+  write_errors are MongoDB's per-row errors; the batch is unordered, so the
+  other rows are still written.
+    """
+
+    if not rows:
+        return 0, []
+
+    demands = get_demands_collection()
+
+    ops = []
+    for r in rows:
+        doc = _demand_doc(r)
+        key = {"plant_id": doc["plant_id"], "month": doc["month"], "demand_type": doc["demand_type"]}
+        ops.append(UpdateOne(key, {"$setOnInsert": doc}, upsert=True))
+
+    try:
+        result = demands.bulk_write(ops, ordered=False)
+        return int(result.upserted_count), []
+    except BulkWriteError as exc:
+        details = exc.details or {}
+        return int(details.get("nUpserted", 0)), list(details.get("writeErrors", []))
+
+
 def update_demand(demand_id: str, data: Dict[str, Any]) -> bool:
     """Update an existing demand."""
 
     demands = get_demands_collection()
 
     try:
-        oid = ObjectId(demand_id)
+        oid = to_oid(demand_id)
     except Exception:
         return False
 
     update_doc = {
         "$set": {
-            "plant_id": ObjectId(data["plant_id"]),
+            "plant_id": to_oid(data["plant_id"]),
             "plant_name": data["plant_name"],
             "month": data["month"],
             "demand_quantity": float(data["demand_quantity"]),
@@ -108,7 +199,7 @@ def delete_demand(demand_id: str) -> bool:
     demands = get_demands_collection()
 
     try:
-        oid = ObjectId(demand_id)
+        oid = to_oid(demand_id)
     except Exception:
         return False
 
@@ -15,19 +15,24 @@ Validations:
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from backend.core.cache import cached_get_all_demands
 from backend.demand.demand_repository import (
-    create_demand,
+    bulk_upsert_demands,
     delete_demand,
     find_demand_by_id,
     find_duplicate,
     list_demands,
     update_demand,
+    upsert_demand,
 )
-from backend.plant.plant_repository import find_plant_by_id
+from backend.plant.plant_cache import cached_find_plant_by_id
 
 
+# Compiled once; the groups give year and month without re-splitting the text.
+_MONTH_RE = re.compile(r"^(\d{4})-(\d{2})$")
+
 _ALLOWED_DEMAND_TYPES = {
     "Fixed",
     "Scenario-Low",
@@ -40,11 +45,11 @@ def _validate_month(value: str) -> Tuple[bool, str]:
     """Validate month as YYYY-MM."""
 
     text = (value or "").strip()
-    if not re.match(r"^\d{4}-\d{2}$", text):
+    m = _MONTH_RE.match(text)
+    if not m:
         return False, "Month must be in format YYYY-MM (example: 2026-01)."
 
-    year = int(text.split("-")[0])
-    month = int(text.split("-")[1])
+    year, month = int(m.group(1)), int(m.group(2))
 
     if year < 2000 or year > 2100:
         return False, "Year must be between 2000 and 2100."
@@ -55,61 +60,114 @@ def _validate_month(value: str) -> Tuple[bool, str]:
     return True, ""
 
 
-def validate_demand_payload(payload: Dict[str, Any]) -> Tuple[bool, str]:
-    """Validate demand fields."""
+def validate_demand_payload(payload: Dict[str, Any]) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    """Validate demand fields.
+
+    Returns (ok, message, plant_doc); the plant document fetched for validation
+    is handed back so callers do not look it up a second time.
+    """
 
     plant_id = (payload.get("plant_id") or "").strip()
     if not plant_id:
-        return False, "Plant is required."
+        return False, "Plant is required.", None
 
-    plant = find_plant_by_id(plant_id)
+    plant = cached_find_plant_by_id(plant_id)
     if plant is None:
-        return False, "Selected plant does not exist."
+        return False, "Selected plant does not exist.", None
 
     ok, msg = _validate_month(payload.get("month") or "")
     if not ok:
-        return False, msg
+        return False, msg, None
 
     demand_type = (payload.get("demand_type") or "").strip()
     if demand_type not in _ALLOWED_DEMAND_TYPES:
-        return False, "Invalid demand type."
+        return False, "Invalid demand type.", None
 
     try:
         qty = float(payload.get("demand_quantity"))
     except Exception:
-        return False, "Demand quantity must be a number."
+        return False, "Demand quantity must be a number.", None
 
     if qty < 0:
-        return False, "Demand quantity cannot be negative."
+        return False, "Demand quantity cannot be negative.", None
 
-    return True, ""
+    return True, "", plant
 
 
-def get_all_demands() -> List[Dict[str, Any]]:
-    return list_demands()
+def get_all_demands(projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    return list_demands(projection)
 
 
 def add_demand(payload: Dict[str, Any]) -> Tuple[bool, str]:
-    ok, msg = validate_demand_payload(payload)
+    ok, msg, plant = validate_demand_payload(payload)
     if not ok:
         return False, msg
 
-    plant = find_plant_by_id(payload["plant_id"].strip())
     payload["plant_name"] = plant.get("name")
 
-    dup = find_duplicate(payload["plant_id"].strip(), payload["month"].strip(), payload["demand_type"].strip())
-    if dup is not None:
-        return False, "Duplicate demand entry for the same plant, month, and demand type."
+    payload["plant_id"] = payload["plant_id"].strip()
+    payload["month"] = payload["month"].strip()
+    payload["demand_type"] = payload["demand_type"].strip()
 
     try:
-        create_demand(payload)
-        return True, "Demand created successfully."
+        # Duplicate check + insert in one round-trip (see upsert_demand).
+        new_id = upsert_demand(payload)
     except Exception:
         return False, "Failed to create demand."
 
+    if new_id is None:
+        return False, "Duplicate demand entry for the same plant, month, and demand type."
+
+    cached_get_all_demands.clear()
+    return True, "Demand created successfully."
+
+
+def import_demands(payloads: List[Dict[str, Any]]) -> Tuple[bool, str]:
+    """Validate a batch of demand rows, then write them with one bulk upsert.
+
+    Nothing is written if any row is invalid. Rows that already exist for the
+    same plant, month, and demand type are skipped (same rule as add_demand).
+    """
+
+    rows: List[Dict[str, Any]] = []
+    for row_no, payload in enumerate(payloads, start=1):
+        # Plant lookups go through the plant cache, so repeated plants are cheap.
+        ok, msg, plant = validate_demand_payload(payload)
+        if not ok:
+            return False, f"Row {row_no}: {msg}"
+
+        rows.append(
+            {
+                "plant_id": payload["plant_id"].strip(),
+                "plant_name": plant.get("name"),
+                "month": payload["month"].strip(),
+                "demand_quantity": payload["demand_quantity"],
+                "demand_type": payload["demand_type"].strip(),
+            }
+        )
+
+    if not rows:
+        return False, "No demand rows to import."
+
+    try:
+        inserted, errors = bulk_upsert_demands(rows)
+    except Exception:
+        return False, "Failed to import demands."
+
+    if inserted:
+        cached_get_all_demands.clear()
+
+    skipped = len(rows) - inserted - len(errors)
+    msg = f"Imported {inserted} demand rows."
+    if skipped:
+        msg += f" {skipped} already existed."
+    if errors:
+        msg += f" {len(errors)} failed."
+    return not errors, msg
+
 
 def edit_demand(demand_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
-    ok, msg = validate_demand_payload(payload)
+    ok, msg, plant = validate_demand_payload(payload)
     if not ok:
         return False, msg
 
@@ -117,7 +175,6 @@ def edit_demand(demand_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
     if existing is None:
         return False, "Demand record not found."
 
-    plant = find_plant_by_id(payload["plant_id"].strip())
     payload["plant_name"] = plant.get("name")
 
     dup = find_duplicate(
@@ -133,6 +190,7 @@ def edit_demand(demand_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
         updated = update_demand(demand_id, payload)
         if not updated:
             return False, "No changes were saved."
+        cached_get_all_demands.clear()
         return True, "Demand updated successfully."
     except Exception:
         return False, "Failed to update demand."
@@ -147,6 +205,7 @@ def remove_demand(demand_id: str) -> Tuple[bool, str]:
         deleted = delete_demand(demand_id)
         if not deleted:
             return False, "Failed to delete demand."
+        cached_get_all_demands.clear()
         return True, "Demand deleted successfully."
     except Exception:
         return False, "Failed to delete demand."
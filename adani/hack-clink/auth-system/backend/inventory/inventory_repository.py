@@ -17,23 +17,29 @@ Rule:
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from bson import ObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 
 from backend.database.mongo import get_inventory_policies_collection
+from backend.database.util import to_oid
 
 
-def list_policies() -> List[Dict[str, Any]]:
+# created_at is bookkeeping only; the UI and optimizer never read it.
+_LIST_PROJECTION: Dict[str, int] = {"created_at": 0}
+
+
+def list_policies(projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
     policies = get_inventory_policies_collection()
-    return list(policies.find({}).sort("plant_name", 1))
+    cursor = policies.find({}, projection or _LIST_PROJECTION).sort("plant_name", 1)
+    return list(cursor.batch_size(500))
 
 
 def find_policy_by_id(policy_id: str) -> Optional[Dict[str, Any]]:
     policies = get_inventory_policies_collection()
 
     try:
-        oid = ObjectId(policy_id)
+        oid = to_oid(policy_id)
     except Exception:
         return None
 
@@ -43,18 +49,16 @@ def find_policy_by_id(policy_id: str) -> Optional[Dict[str, Any]]:
 def find_policy_by_plant(plant_id: str, exclude_id: str | None = None):
     policies = get_inventory_policies_collection()
 
-    query: Dict[str, Any] = {"plant_id": ObjectId(plant_id)}
+    query: Dict[str, Any] = {"plant_id": to_oid(plant_id)}
     if exclude_id:
-        query["_id"] = {"$ne": ObjectId(exclude_id)}
+        query["_id"] = {"$ne": to_oid(exclude_id)}
 
     return policies.find_one(query)
 
 
-def create_policy(data: Dict[str, Any]) -> str:
-    policies = get_inventory_policies_collection()
-
-    doc = {
-        "plant_id": ObjectId(data["plant_id"]),
+def _policy_doc(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "plant_id": to_oid(data["plant_id"]),
         "plant_name": data["plant_name"],
         "safety_stock": float(data["safety_stock"]),
         "max_inventory": float(data["max_inventory"]),
@@ -62,21 +66,68 @@ def create_policy(data: Dict[str, Any]) -> str:
         "created_at": datetime.now(timezone.utc),
     }
 
-    result = policies.insert_one(doc)
+
+def create_policy(data: Dict[str, Any]) -> str:
+    policies = get_inventory_policies_collection()
+
+    result = policies.insert_one(_policy_doc(data))
     return str(result.inserted_id)
 
 
+def upsert_policy(data: Dict[str, Any]) -> Optional[str]:
+    """Insert a policy unless the plant already has one.
+
+    One update_one(upsert=True) with $setOnInsert replaces "find then insert";
+    the unique plant_id index makes concurrent inserts safe.
+
+    Returns the new policy id, or None if the plant already has a policy.
+    """
+
+    policies = get_inventory_policies_collection()
+
+    doc = _policy_doc(data)
+
+    try:
+        result = policies.update_one({"plant_id": doc["plant_id"]}, {"$setOnInsert": doc}, upsert=True)
+    except DuplicateKeyError:
+        return None
+
+    if result.upserted_id is None:
+        return None
+    return str(result.upserted_id)
+
+
+def bulk_create_policies(rows: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+    """Insert many policies in one round-trip.
+
+    Returns (inserted_count, write_errors). Rows rejected by the unique plant_id
+    index show up in write_errors; the rest are still inserted (unordered batch).
+    """
+
+    if not rows:
+        return 0, []
+
+    policies = get_inventory_policies_collection()
+
+    try:
+        result = policies.insert_many([_policy_doc(r) for r in rows], ordered=False)
+        return len(result.inserted_ids), []
+    except BulkWriteError as exc:
+        details = exc.details or {}
+        return int(details.get("nInserted", 0)), list(details.get("writeErrors", []))
+
+
 def update_policy(policy_id: str, data: Dict[str, Any]) -> bool:
     policies = get_inventory_policies_collection()
 
     try:
-        oid = ObjectId(policy_id)
+        oid = to_oid(policy_id)
     except Exception:
         return False
 
     update_doc = {
         "$set": {
-            "plant_id": ObjectId(data["plant_id"]),
+            "plant_id": to_oid(data["plant_id"]),
             "plant_name": data["plant_name"],
             "safety_stock": float(data["safety_stock"]),
             "max_inventory": float(data["max_inventory"]),
@@ -92,7 +143,7 @@ def delete_policy(policy_id: str) -> bool:
     policies = get_inventory_policies_collection()
 
     try:
-        oid = ObjectId(policy_id)
+        oid = to_oid(policy_id)
     except Exception:
         return False
 
@@ -12,74 +12,87 @@ Validations:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
+from backend.core.cache import cached_get_all_policies
 from backend.inventory.inventory_repository import (
-    create_policy,
     delete_policy,
     find_policy_by_id,
     find_policy_by_plant,
     list_policies,
     update_policy,
+    upsert_policy,
 )
-from backend.plant.plant_repository import find_plant_by_id
+from backend.plant.plant_cache import cached_find_plant_by_id
 
 
-def validate_policy_payload(payload: Dict[str, Any]) -> Tuple[bool, str]:
-    plant_id = (payload.get("plant_id") or "").strip()
-    if not plant_id:
-        return False, "Plant is required."
-
-    plant = find_plant_by_id(plant_id)
-    if plant is None:
-        return False, "Selected plant does not exist."
+# (payload field, label used in error messages), checked in this order.
+_POLICY_NUMBER_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("safety_stock", "Safety stock"),
+    ("max_inventory", "Max inventory"),
+    ("holding_cost_per_month", "Holding cost"),
+)
 
-    try:
-        safety = float(payload.get("safety_stock"))
-        max_inv = float(payload.get("max_inventory"))
-        holding = float(payload.get("holding_cost_per_month"))
-    except Exception:
-        return False, "Safety stock, max inventory, and holding cost must be numbers."
 
-    if safety < 0:
-        return False, "Safety stock cannot be negative."
+def validate_policy_payload(payload: Dict[str, Any]) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+    """Validate policy fields; returns (ok, message, plant_doc) so callers reuse the plant."""
 
-    if max_inv < 0:
-        return False, "Max inventory cannot be negative."
+    plant_id = (payload.get("plant_id") or "").strip()
+    if not plant_id:
+        return False, "Plant is required.", None
 
-    if holding < 0:
-        return False, "Holding cost cannot be negative."
+    plant = cached_find_plant_by_id(plant_id)
+    if plant is None:
+        return False, "Selected plant does not exist.", None
+
+    # Check each number on its own so the message names the field that failed.
+    values: Dict[str, float] = {}
+    for field, label in _POLICY_NUMBER_FIELDS:
+        try:
+            value = float(payload.get(field))
+        except (TypeError, ValueError):
+            return False, f"{label} must be a number.", None
+        if value < 0:
+            return False, f"{label} cannot be negative.", None
+        values[field] = value
+
+    safety = values["safety_stock"]
+    max_inv = values["max_inventory"]
 
     if max_inv < safety:
-        return False, "Max inventory must be greater than or equal to safety stock."
+        return False, "Max inventory must be greater than or equal to safety stock.", None
 
-    return True, ""
+    return True, "", plant
 
 
-def get_all_policies() -> List[Dict[str, Any]]:
-    return list_policies()
+def get_all_policies(projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    return list_policies(projection)
 
 
 def add_policy(payload: Dict[str, Any]) -> Tuple[bool, str]:
-    ok, msg = validate_policy_payload(payload)
+    ok, msg, plant = validate_policy_payload(payload)
     if not ok:
         return False, msg
 
-    plant = find_plant_by_id(payload["plant_id"].strip())
     payload["plant_name"] = plant.get("name")
 
-    if find_policy_by_plant(payload["plant_id"].strip()) is not None:
-        return False, "An inventory policy for this plant already exists."
+    payload["plant_id"] = payload["plant_id"].strip()
 
     try:
-        create_policy(payload)
-        return True, "Inventory policy created successfully."
+        # Duplicate check + insert in one round-trip (see upsert_policy).
+        new_id = upsert_policy(payload)
     except Exception:
         return False, "Failed to create inventory policy."
 
+    if new_id is None:
+        return False, "An inventory policy for this plant already exists."
+
+    cached_get_all_policies.clear()
+    return True, "Inventory policy created successfully."
+
 
 def edit_policy(policy_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
-    ok, msg = validate_policy_payload(payload)
+    ok, msg, plant = validate_policy_payload(payload)
     if not ok:
         return False, msg
 
@@ -87,7 +100,6 @@ def edit_policy(policy_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
     if existing is None:
         return False, "Inventory policy not found."
 
-    plant = find_plant_by_id(payload["plant_id"].strip())
     payload["plant_name"] = plant.get("name")
 
     if find_policy_by_plant(payload["plant_id"].strip(), exclude_id=policy_id) is not None:
@@ -97,6 +109,7 @@ def edit_policy(policy_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
         updated = update_policy(policy_id, payload)
         if not updated:
             return False, "No changes were saved."
+        cached_get_all_policies.clear()
         return True, "Inventory policy updated successfully."
     except Exception:
         return False, "Failed to update inventory policy."
@@ -111,6 +124,7 @@ def remove_policy(policy_id: str) -> Tuple[bool, str]:
         deleted = delete_policy(policy_id)
         if not deleted:
             return False, "Failed to delete inventory policy."
+        cached_get_all_policies.clear()
         return True, "Inventory policy deleted successfully."
     except Exception:
         return False, "Failed to delete inventory policy."
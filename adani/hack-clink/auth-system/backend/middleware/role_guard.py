@@ -16,6 +16,12 @@ import streamlit as st
 from backend.auth.session import is_authenticated
 
 
+# Role sets for require_role(). Pages run top-to-bottom on every Streamlit
+# rerun, so passing one of these avoids building a new set each time.
+ADMIN_ONLY = frozenset({"Admin"})
+ADMIN_OR_PLANNER = frozenset({"Admin", "Planner"})
+
+
 def require_authentication() -> bool:
     """Return True if logged in, else show a message and return False."""
 
@@ -27,14 +33,20 @@ def require_authentication() -> bool:
 
 
 def require_role(allowed_roles: Iterable[str]) -> bool:
-    """Return True if current user role is allowed, else show a message."""
+    """Return True if current user role is allowed, else show a message.
+
+    Prefer a set such as ADMIN_ONLY; other iterables are converted per call.
+    """
 
     if not require_authentication():
         return False
 
     user_role = st.session_state.get("user_role")
 
-    if user_role not in set(allowed_roles):
+    if not isinstance(allowed_roles, (set, frozenset)):
+        allowed_roles = frozenset(allowed_roles)
+
+    if user_role not in allowed_roles:
         st.error("You are not authorized to view this page.")
         return False
 
@@ -18,7 +18,7 @@ Real-world meaning of key constraints:
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 import pyomo.environ as pyo
 
@@ -26,18 +26,34 @@ import pyomo.environ as pyo
 def add_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000) -> None:
     """Add all constraints to the model."""
 
+    # Route adjacency, built once with a single pass over model.R.
+    # Rules below look up their routes here instead of scanning every route
+    # for every (plant, month), which made model build O(|P|*|T|*|R|).
+    in_routes: Dict[str, List[Tuple[str, str, str]]] = {}
+    out_routes: Dict[str, List[Tuple[str, str, str]]] = {}
+    modes_by_ij: Dict[Tuple[str, str], List[str]] = {}
+    routes_by_ik: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = {}
+    for (i, j, k) in model.R:
+        out_routes.setdefault(i, []).append((i, j, k))
+        in_routes.setdefault(j, []).append((i, j, k))
+        modes_by_ij.setdefault((i, j), []).append(k)
+        routes_by_ik.setdefault((i, k), []).append((i, j, k))
+
     # Production capacity for clinker plants.
     def production_capacity_rule(m: pyo.ConcreteModel, p: str, t: str):
         return m.Prod[p, t] <= m.ProdCap[p]
 
     model.ProductionCapacity = pyo.Constraint(model.CL, model.T, rule=production_capacity_rule)
 
+    # Previous-month lookup bound once (the rule runs |P|*|T| times).
+    prev_t_map = model.PREV_T
+
     # Inventory balance (multi-period).
     def inventory_balance_rule(m: pyo.ConcreteModel, p: str, t: str):
-        prev_t = m.PREV_T[t]
+        prev_t = prev_t_map[t]
 
-        inflow = sum(m.Ship[i, p, k, t] for (i, j, k) in m.R if j == p)
-        outflow = sum(m.Ship[p, j, k, t] for (i, j, k) in m.R if i == p)
+        inflow = pyo.quicksum(m.Ship[i, j, k, t] for (i, j, k) in in_routes.get(p, ()))
+        outflow = pyo.quicksum(m.Ship[i, j, k, t] for (i, j, k) in out_routes.get(p, ()))
 
         # Only clinker plants can produce. For grinding plants, Prod is fixed at 0.
         prod = m.Prod[p, t]
@@ -73,25 +89,8 @@ def add_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000) -> None
 
     model.SBQ = pyo.Constraint(model.R, model.T, rule=sbq_rule)
 
-    # If a route is disabled, force shipments and trips to 0.
-    def route_enabled_ship_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-        if bool(m.RouteEnabled[i, j, k]):
-            return pyo.Constraint.Skip
-        return m.Ship[i, j, k, t] == 0
-
-    def route_enabled_trips_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-        if bool(m.RouteEnabled[i, j, k]):
-            return pyo.Constraint.Skip
-        return m.Trips[i, j, k, t] == 0
-
-    def route_enabled_use_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-        if bool(m.RouteEnabled[i, j, k]):
-            return pyo.Constraint.Skip
-        return m.Use[i, j, k, t] == 0
-
-    model.RouteEnabledShip = pyo.Constraint(model.R, model.T, rule=route_enabled_ship_rule)
-    model.RouteEnabledTrips = pyo.Constraint(model.R, model.T, rule=route_enabled_trips_rule)
-    model.RouteEnabledUse = pyo.Constraint(model.R, model.T, rule=route_enabled_use_rule)
+    # Disabled routes: Ship/Trips/Use are fixed to 0 in the model builder,
+    # so no constraints are needed for them here.
 
     # Mode selection:
     # If Use[i,j,k,t] = 0 then Trips must be 0.
@@ -101,11 +100,9 @@ def add_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000) -> None
     model.LinkUseTrips = pyo.Constraint(model.R, model.T, rule=link_use_trips_rule)
 
     # At most one mode per (i,j) per month.
+    # model.IJ is built from the route list, so every pair has at least one mode.
     def one_mode_rule(m: pyo.ConcreteModel, i: str, j: str, t: str):
-        modes = [k for (ii, jj, k) in m.R if ii == i and jj == j]
-        if not modes:
-            return pyo.Constraint.Skip
-        return sum(m.Use[i, j, k, t] for k in modes) <= 1
+        return pyo.quicksum(m.Use[i, j, k, t] for k in modes_by_ij[i, j]) <= 1
 
     model.OneModePerRoute = pyo.Constraint(model.IJ, model.T, rule=one_mode_rule)
 
@@ -114,102 +111,118 @@ def add_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000) -> None
     # Additional constraints for Excel dataset compatibility
     
     # Min fulfillment constraint: demand fulfillment must meet minimum percentage
+    # The optional Params below are read once into plain dicts of the values
+    # that were actually given (extract_values_sparse leaves out defaults).
+    # Defaults would only add rows like Inv >= 0 that the variable domains
+    # already guarantee, so each constraint is built over its given keys only.
     if hasattr(model, 'MinFulfillment'):
+        min_fulfill = dict(model.MinFulfillment.extract_values_sparse())
+        model.MinFulfillmentSet = pyo.Set(initialize=sorted(min_fulfill), dimen=2)
+
         def min_fulfillment_rule(m: pyo.ConcreteModel, p: str, t: str):
-            if (p, t) not in m.MinFulfillment:
-                return pyo.Constraint.Skip
-            min_fulfill_pct = m.MinFulfillment[p, t]
+            min_fulfill_pct = min_fulfill[p, t]
             # Total supply = production + inflow - outflow
-            inflow = sum(m.Ship[i, p, k, t] for (i, j, k) in m.R if j == p)
+            inflow = pyo.quicksum(m.Ship[i, j, k, t] for (i, j, k) in in_routes.get(p, ()))
             prod = m.Prod[p, t]
             total_supply = prod + inflow
             return total_supply >= min_fulfill_pct * m.Demand[p, t]
         
-        model.MinFulfillmentConstraint = pyo.Constraint(model.P, model.T, rule=min_fulfillment_rule)
+        model.MinFulfillmentConstraint = pyo.Constraint(model.MinFulfillmentSet, rule=min_fulfillment_rule)
     
     # Closing stock constraints (min and max)
     if hasattr(model, 'MinClosingStock'):
+        min_closing = dict(model.MinClosingStock.extract_values_sparse())
+        model.MinClosingStockSet = pyo.Set(initialize=sorted(min_closing), dimen=2)
+
         def min_closing_stock_rule(m: pyo.ConcreteModel, p: str, t: str):
-            if (p, t) not in m.MinClosingStock:
-                return pyo.Constraint.Skip
-            return m.Inv[p, t] >= m.MinClosingStock[p, t]
+            return m.Inv[p, t] >= min_closing[p, t]
         
-        model.MinClosingStockConstraint = pyo.Constraint(model.P, model.T, rule=min_closing_stock_rule)
+        model.MinClosingStockConstraint = pyo.Constraint(model.MinClosingStockSet, rule=min_closing_stock_rule)
     
     if hasattr(model, 'MaxClosingStock'):
+        max_closing = dict(model.MaxClosingStock.extract_values_sparse())
+        model.MaxClosingStockSet = pyo.Set(initialize=sorted(max_closing), dimen=2)
+
         def max_closing_stock_rule(m: pyo.ConcreteModel, p: str, t: str):
-            if (p, t) not in m.MaxClosingStock:
-                return pyo.Constraint.Skip
-            return m.Inv[p, t] <= m.MaxClosingStock[p, t]
+            return m.Inv[p, t] <= max_closing[p, t]
         
-        model.MaxClosingStockConstraint = pyo.Constraint(model.P, model.T, rule=max_closing_stock_rule)
+        model.MaxClosingStockConstraint = pyo.Constraint(model.MaxClosingStockSet, rule=max_closing_stock_rule)
     
     # Transport code limits (aggregate limits per transport code)
-    if hasattr(model, 'TransportCodeLimits'):
+    # Each side gets its own sparse set holding only the keys that define it.
+    if hasattr(model, 'TransportCodeLimits') and hasattr(model, 'TransportCodeLimitSet'):
+        code_limits = dict(model.TransportCodeLimits.extract_values())
+        code_limit_lower_keys = []
+        code_limit_upper_keys = []
+        for key, limits in code_limits.items():
+            if limits.get('lower') is not None:
+                code_limit_lower_keys.append(key)
+            if limits.get('upper') is not None:
+                code_limit_upper_keys.append(key)
+
+        model.TransportCodeLimitLowerSet = pyo.Set(initialize=code_limit_lower_keys, dimen=3)
+        model.TransportCodeLimitUpperSet = pyo.Set(initialize=code_limit_upper_keys, dimen=3)
+
+        # Total shipped per (origin, transport code, month), built once and shared
+        # by the lower and upper rules when a key has both limits.
+        shipped_exprs: Dict[Tuple[str, str, str], object] = {}
+
+        def shipped_by_code(m: pyo.ConcreteModel, i: str, k: str, t: str):
+            expr = shipped_exprs.get((i, k, t))
+            if expr is None:
+                expr = pyo.quicksum(m.Ship[ii, jj, kk, t] for (ii, jj, kk) in routes_by_ik.get((i, k), ()))
+                shipped_exprs[(i, k, t)] = expr
+            return expr
+
         def transport_code_limit_lower_rule(m: pyo.ConcreteModel, i: str, k: str, t: str):
-            if (i, k, t) not in m.TransportCodeLimits:
-                return pyo.Constraint.Skip
-            limits = m.TransportCodeLimits[i, k, t]
-            if 'lower' not in limits or limits['lower'] is None:
-                return pyo.Constraint.Skip
-            total_shipped = sum(m.Ship[ii, jj, k, t] for (ii, jj, kk) in m.R if ii == i and kk == k)
-            return total_shipped >= limits['lower']
+            total_shipped = shipped_by_code(m, i, k, t)
+            return total_shipped >= code_limits[i, k, t]['lower']
         
         def transport_code_limit_upper_rule(m: pyo.ConcreteModel, i: str, k: str, t: str):
-            if (i, k, t) not in m.TransportCodeLimits:
-                return pyo.Constraint.Skip
-            limits = m.TransportCodeLimits[i, k, t]
-            if 'upper' not in limits or limits['upper'] is None:
-                return pyo.Constraint.Skip
-            total_shipped = sum(m.Ship[ii, jj, k, t] for (ii, jj, kk) in m.R if ii == i and kk == k)
-            return total_shipped <= limits['upper']
+            total_shipped = shipped_by_code(m, i, k, t)
+            return total_shipped <= code_limits[i, k, t]['upper']
         
-        if hasattr(model, 'TransportCodeLimitSet'):
-            model.TransportCodeLimitLower = pyo.Constraint(
-                model.TransportCodeLimitSet, 
-                rule=transport_code_limit_lower_rule
-            )
-            model.TransportCodeLimitUpper = pyo.Constraint(
-                model.TransportCodeLimitSet,
-                rule=transport_code_limit_upper_rule
-            )
+        model.TransportCodeLimitLower = pyo.Constraint(
+            model.TransportCodeLimitLowerSet, 
+            rule=transport_code_limit_lower_rule
+        )
+        model.TransportCodeLimitUpper = pyo.Constraint(
+            model.TransportCodeLimitUpperSet,
+            rule=transport_code_limit_upper_rule
+        )
     
     # Transport bounds (route-specific bounds from IUGUConstraint)
-    if hasattr(model, 'TransportBounds'):
+    # One sparse set per bound type ('L', 'U', 'E'), same idea as above.
+    if hasattr(model, 'TransportBounds') and hasattr(model, 'TransportBoundSet'):
+        transport_bounds = dict(model.TransportBounds.extract_values())
+        bound_keys: Dict[str, List[Tuple[str, str, str, str]]] = {'L': [], 'U': [], 'E': []}
+        for key, bounds in transport_bounds.items():
+            for bound_type, keys in bound_keys.items():
+                if bound_type in bounds:
+                    keys.append(key)
+
+        model.TransportBoundLowerSet = pyo.Set(initialize=bound_keys['L'], dimen=4)
+        model.TransportBoundUpperSet = pyo.Set(initialize=bound_keys['U'], dimen=4)
+        model.TransportBoundEqualSet = pyo.Set(initialize=bound_keys['E'], dimen=4)
+
         def transport_bound_lower_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-            if (i, j, k, t) not in m.TransportBounds:
-                return pyo.Constraint.Skip
-            bounds = m.TransportBounds[i, j, k, t]
-            if 'L' not in bounds:
-                return pyo.Constraint.Skip
-            return m.Ship[i, j, k, t] >= bounds['L']
+            return m.Ship[i, j, k, t] >= transport_bounds[i, j, k, t]['L']
         
         def transport_bound_upper_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-            if (i, j, k, t) not in m.TransportBounds:
-                return pyo.Constraint.Skip
-            bounds = m.TransportBounds[i, j, k, t]
-            if 'U' not in bounds:
-                return pyo.Constraint.Skip
-            return m.Ship[i, j, k, t] <= bounds['U']
+            return m.Ship[i, j, k, t] <= transport_bounds[i, j, k, t]['U']
         
         def transport_bound_equal_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-            if (i, j, k, t) not in m.TransportBounds:
-                return pyo.Constraint.Skip
-            bounds = m.TransportBounds[i, j, k, t]
-            if 'E' not in bounds:
-                return pyo.Constraint.Skip
-            return m.Ship[i, j, k, t] == bounds['E']
+            return m.Ship[i, j, k, t] == transport_bounds[i, j, k, t]['E']
         
-        if hasattr(model, 'TransportBoundSet'):
-            model.TransportBoundLower = pyo.Constraint(
-                model.TransportBoundSet,
-                rule=transport_bound_lower_rule
-            )
-            model.TransportBoundUpper = pyo.Constraint(
-                model.TransportBoundSet,
-                rule=transport_bound_upper_rule
-            )
-            model.TransportBoundEqual = pyo.Constraint(
-                model.TransportBoundSet,
-                rule=transport_bound_equal_rule
-            )
\ No newline at end of file
+        model.TransportBoundLower = pyo.Constraint(
+            model.TransportBoundLowerSet,
+            rule=transport_bound_lower_rule
+        )
+        model.TransportBoundUpper = pyo.Constraint(
+            model.TransportBoundUpperSet,
+            rule=transport_bound_upper_rule
+        )
+        model.TransportBoundEqual = pyo.Constraint(
+            model.TransportBoundEqualSet,
+            rule=transport_bound_equal_rule
+        )
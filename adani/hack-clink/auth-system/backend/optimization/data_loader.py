@@ -16,9 +16,12 @@ Pyomo works best when you provide "clean" inputs:
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
 from backend.core.cache import cached_get_all_plants, cached_get_all_routes
 from backend.demand.demand_service import get_all_demands
 from backend.inventory.inventory_service import get_all_policies
@@ -47,6 +50,7 @@ class OptimizationData:
     production_capacity: Dict[str, float]
     production_cost: Dict[str, float]
 
+    # Sparse: (plant_id, month) pairs without demand may be missing (= 0).
     demand: Dict[Tuple[str, str], float]
 
     # Route keys use: (from_id, to_id, mode)
@@ -57,9 +61,31 @@ class OptimizationData:
     route_enabled: Dict[Tuple[str, str, str], bool]
 
 
+# Only the fields read below are fetched from MongoDB (smaller documents to
+# transfer, decode and cache).
+_PLANT_FIELDS = (
+    "name",
+    "plant_type",
+    "storage_capacity",
+    "initial_inventory",
+    "safety_stock",
+    "production_capacity",
+    "production_cost",
+)
+_POLICY_PROJECTION = {"plant_id": 1, "safety_stock": 1, "max_inventory": 1, "holding_cost_per_month": 1}
+_DEMAND_PROJECTION = {"plant_id": 1, "month": 1, "demand_type": 1, "demand_quantity": 1}
+_ROUTE_FIELDS = ("from_plant_id", "to_plant_id", "transport_mode", "cost_per_trip", "capacity_per_trip", "sbq", "is_enabled")
+
+
 def _to_float(value: Any, field_name: str) -> float:
     """Convert a value to float with a clear error."""
 
+    # Fast path: Mongo returns native numbers, which need no try/except.
+    if type(value) is float:
+        return value
+    if isinstance(value, int):
+        return float(value)
+
     try:
         return float(value)
     except Exception:
@@ -88,41 +114,51 @@ def assemble_optimization_data(
         raise ValueError("Please select at least one month.")
 
     # Phase 6: use cached master data to avoid repeated DB reads on Streamlit reruns.
-    plants = cached_get_all_plants(include_inactive=False)
+    plants = cached_get_all_plants(include_inactive=False, fields=_PLANT_FIELDS)
     if not plants:
         raise ValueError("No plants found. Please create plants first.")
 
-    plant_ids = [str(p.get("_id")) for p in plants]
-    plant_names = {str(p.get("_id")): (p.get("name") or "") for p in plants}
-    plant_type = {str(p.get("_id")): (p.get("plant_type") or "") for p in plants}
-
-    clinker_plants = [pid for pid in plant_ids if plant_type.get(pid) == "Clinker Plant"]
-
-    # Storage capacity and initial inventory come from Plant module.
-    storage_capacity = {
-        str(p.get("_id")): _to_float(p.get("storage_capacity", 0.0), "Storage capacity")
-        for p in plants
-    }
-    initial_inventory = {
-        str(p.get("_id")): _to_float(p.get("initial_inventory", 0.0), "Initial inventory")
-        for p in plants
-    }
-
     # Inventory policies are optional; if missing, we derive defaults:
     # - safety_stock from plant.safety_stock
     # - max_inventory from plant.storage_capacity
     # - holding_cost default 0
-    policies = get_all_policies()
+    policies = get_all_policies(_POLICY_PROJECTION)
     policy_by_plant_id = {str(p.get("plant_id")): p for p in policies}
 
+    # All plant-keyed inputs are filled in one pass over the plant documents
+    # (each _id is converted to str once).
+    plant_ids: List[str] = []
+    plant_names: Dict[str, str] = {}
+    plant_type: Dict[str, str] = {}
+    clinker_plants: List[str] = []
+
+    # Storage capacity and initial inventory come from Plant module.
+    storage_capacity: Dict[str, float] = {}
+    initial_inventory: Dict[str, float] = {}
+
     safety_stock: Dict[str, float] = {}
     max_inventory: Dict[str, float] = {}
     holding_cost: Dict[str, float] = {}
 
+    # Production capacity/cost fields:
+    # We read optional values from plant doc. If missing for clinker plants, we error.
+    # Non-clinker plants get 0.
+    production_capacity: Dict[str, float] = {}
+    production_cost: Dict[str, float] = {}
+
     for p in plants:
         pid = str(p.get("_id"))
-        pol = policy_by_plant_id.get(pid)
+        name = p.get("name") or ""
+        ptype = p.get("plant_type") or ""
+
+        plant_ids.append(pid)
+        plant_names[pid] = name
+        plant_type[pid] = ptype
+
+        storage_capacity[pid] = _to_float(p.get("storage_capacity", 0.0), "Storage capacity")
+        initial_inventory[pid] = _to_float(p.get("initial_inventory", 0.0), "Initial inventory")
 
+        pol = policy_by_plant_id.get(pid)
         if pol is None:
             safety_stock[pid] = _to_float(p.get("safety_stock", 0.0), "Safety stock")
             max_inventory[pid] = storage_capacity[pid]
@@ -132,56 +168,58 @@ def assemble_optimization_data(
             max_inventory[pid] = _to_float(pol.get("max_inventory", 0.0), "Max inventory")
             holding_cost[pid] = _to_float(pol.get("holding_cost_per_month", 0.0), "Holding cost")
 
-    # Production capacity/cost fields:
-    # We read optional values from plant doc. If missing for clinker plants, we error.
-    production_capacity: Dict[str, float] = {}
-    production_cost: Dict[str, float] = {}
-
-    for pid in plant_ids:
-        production_capacity[pid] = 0.0
-        production_cost[pid] = 0.0
+        if ptype == "Clinker Plant":
+            clinker_plants.append(pid)
 
-    for p in plants:
-        pid = str(p.get("_id"))
-
-        if plant_type.get(pid) == "Clinker Plant":
             if p.get("production_capacity") is None:
                 raise ValueError(
-                    f"Missing production_capacity for clinker plant: {plant_names.get(pid)}. "
+                    f"Missing production_capacity for clinker plant: {name}. "
                     "Please edit the plant and set a monthly production capacity."
                 )
             if p.get("production_cost") is None:
                 raise ValueError(
-                    f"Missing production_cost for clinker plant: {plant_names.get(pid)}. "
+                    f"Missing production_cost for clinker plant: {name}. "
                     "Please edit the plant and set a production cost per unit."
                 )
 
             production_capacity[pid] = _to_float(p.get("production_capacity"), "Production capacity")
             production_cost[pid] = _to_float(p.get("production_cost"), "Production cost")
+        else:
+            production_capacity[pid] = 0.0
+            production_cost[pid] = 0.0
 
-    # Demand: we will build demand[(plant_id, month)]
-    all_demands = get_all_demands()
+    # Sets for O(1) membership tests; the lists above keep the display order.
+    plant_id_set = frozenset(plant_ids)
+    month_set = frozenset(months)
+    clinker_set = frozenset(clinker_plants)
+
+    # Raw plant _id -> id string. Demand and route docs reference plants by the
+    # same ObjectId values, so they reuse the str() done once per plant above.
+    pid_by_oid = {p.get("_id"): pid for p, pid in zip(plants, plant_ids)}
 
-    demand: Dict[Tuple[str, str], float] = {}
+    def _plant_key(value: Any) -> str:
+        pid = pid_by_oid.get(value)
+        return pid if pid is not None else str(value)
+
+    # Demand: we will build demand[(plant_id, month)]
+    all_demands = get_all_demands(_DEMAND_PROJECTION)
 
-    # Default 0 demand unless specified.
-    for pid in plant_ids:
-        for m in months:
-            demand[(pid, m)] = 0.0
+    # Only (plant, month) pairs that have demand rows get an entry; missing
+    # pairs mean 0 demand, so there is no |plants| x |months| zero fill.
+    demand: Dict[Tuple[str, str], float] = defaultdict(float)
 
     for d in all_demands:
         if (d.get("demand_type") or "") != demand_type_filter:
             continue
 
         month = (d.get("month") or "").strip()
-        if month not in months:
+        if month not in month_set:
             continue
 
         # Demand docs store plant_id as ObjectId.
-        plant_id_value = d.get("plant_id")
-        plant_id_str = str(plant_id_value)
+        plant_id_str = _plant_key(d.get("plant_id"))
 
-        if plant_id_str not in plant_ids:
+        if plant_id_str not in plant_id_set:
             continue
 
         qty = _to_float(d.get("demand_quantity", 0.0), "Demand quantity")
@@ -191,7 +229,7 @@ def assemble_optimization_data(
         demand[(plant_id_str, month)] += qty
 
     # Transport routes
-    all_routes = cached_get_all_routes(include_disabled=True)
+    all_routes = cached_get_all_routes(include_disabled=True, fields=_ROUTE_FIELDS)
     if not all_routes:
         raise ValueError("No transport routes found. Please create routes first.")
 
@@ -200,67 +238,47 @@ def assemble_optimization_data(
     transport_capacity_per_trip: Dict[Tuple[str, str, str], float] = {}
     transport_sbq: Dict[Tuple[str, str, str], float] = {}
     route_enabled: Dict[Tuple[str, str, str], bool] = {}
+    # (cost, capacity, sbq) per entry of `routes`, validated in one go below.
+    route_values: List[Tuple[float, float, float]] = []
 
     for r in all_routes:
-        from_id = str(r.get("from_plant_id"))
-        to_id = str(r.get("to_plant_id"))
+        from_id = _plant_key(r.get("from_plant_id"))
+        to_id = _plant_key(r.get("to_plant_id"))
         mode = (r.get("transport_mode") or "").strip()
 
-        if from_id not in plant_ids or to_id not in plant_ids:
+        if from_id not in plant_id_set or to_id not in plant_id_set:
             continue
 
         key = (from_id, to_id, mode)
+        cost = _to_float(r.get("cost_per_trip", 0.0), "Cost per trip")
+        capacity = _to_float(r.get("capacity_per_trip", 0.0), "Capacity per trip")
+        sbq = _to_float(r.get("sbq", 0.0), "SBQ")
 
         routes.append(key)
-        transport_cost_per_trip[key] = _to_float(r.get("cost_per_trip", 0.0), "Cost per trip")
-        transport_capacity_per_trip[key] = _to_float(r.get("capacity_per_trip", 0.0), "Capacity per trip")
-        transport_sbq[key] = _to_float(r.get("sbq", 0.0), "SBQ")
+        transport_cost_per_trip[key] = cost
+        transport_capacity_per_trip[key] = capacity
+        transport_sbq[key] = sbq
         route_enabled[key] = bool(r.get("is_enabled", True))
 
-        if transport_capacity_per_trip[key] < 0 or transport_cost_per_trip[key] < 0 or transport_sbq[key] < 0:
-            raise ValueError("Transport cost/capacity/SBQ cannot be negative.")
-
-        if transport_sbq[key] > transport_capacity_per_trip[key]:
+        route_values.append((cost, capacity, sbq))
+
+    # Validate all route values with array comparisons (one row per route, in
+    # order) and report the first bad route, like a per-route check would.
+    if route_values:
+        values = np.array(route_values, dtype=np.float64)
+        cost_arr, capacity_arr, sbq_arr = values[:, 0], values[:, 1], values[:, 2]
+        negative = (capacity_arr < 0) | (cost_arr < 0) | (sbq_arr < 0)
+        bad = negative | (sbq_arr > capacity_arr)
+        if bad.any():
+            first = int(np.argmax(bad))
+            if negative[first]:
+                raise ValueError("Transport cost/capacity/SBQ cannot be negative.")
+            from_id, to_id, mode = routes[first]
             raise ValueError(
                 f"SBQ cannot exceed capacity for route {plant_names.get(from_id)} -> {plant_names.get(to_id)} ({mode})."
             )
 
-    # Basic feasibility checks:
-    # 1) For any month, total demand must be <= total potential production + initial inventory.
-    # This is a quick sanity check, not a proof of feasibility.
-    for m in months:
-        total_demand = sum(demand[(pid, m)] for pid in plant_ids)
-        total_initial = sum(initial_inventory[pid] for pid in plant_ids)
-        total_prod_cap = sum(production_capacity[pid] for pid in clinker_plants)
-
-        if total_demand > total_initial + total_prod_cap:
-            raise ValueError(
-                f"Demand seems too high for month {m}. "
-                f"Total demand={total_demand}, total initial inventory={total_initial}, total clinker production capacity={total_prod_cap}."
-            )
-
-    # 2) Storage feasibility (initial inventory must fit inside max inventory).
-    for pid in plant_ids:
-        if initial_inventory[pid] > max_inventory[pid]:
-            raise ValueError(
-                f"Initial inventory for plant {plant_names.get(pid)} is greater than max inventory capacity."
-            )
-
-    # 3) Missing transport connectivity (simple check):
-    # If a plant has demand but no inflow route and no production, it will fail.
-    has_inflow = {pid: False for pid in plant_ids}
-    for (i, j, mode) in routes:
-        if route_enabled[(i, j, mode)]:
-            has_inflow[j] = True
-
-    for pid in plant_ids:
-        for m in months:
-            if demand[(pid, m)] > 0 and (pid not in clinker_plants) and not has_inflow.get(pid, False):
-                raise ValueError(
-                    f"Plant {plant_names.get(pid)} has demand in {m} but no enabled inbound transport route and no clinker production."
-                )
-
-    return OptimizationData(
+    data = OptimizationData(
         months=months,
         plant_ids=plant_ids,
         plant_names=plant_names,
@@ -273,10 +291,56 @@ def assemble_optimization_data(
         holding_cost=holding_cost,
         production_capacity=production_capacity,
         production_cost=production_cost,
-        demand=demand,
+        demand=dict(demand),
         routes=routes,
         transport_cost_per_trip=transport_cost_per_trip,
         transport_capacity_per_trip=transport_capacity_per_trip,
         transport_sbq=transport_sbq,
         route_enabled=route_enabled,
     )
+
+    # Basic feasibility checks:
+    # 1) For any month, total demand must be <= total potential production + initial inventory.
+    # This is a quick sanity check, not a proof of feasibility.
+    # Supply totals do not depend on the month, and one pass over the sparse
+    # demand entries sums every month's total demand.
+    total_initial = sum(initial_inventory[pid] for pid in plant_ids)
+    total_prod_cap = sum(production_capacity[pid] for pid in clinker_plants)
+    month_totals: Dict[str, float] = defaultdict(float)
+    for (_pid, m), qty in data.demand.items():
+        month_totals[m] += qty
+    demand_by_month = [month_totals.get(m, 0.0) for m in months]
+
+    for m, total_demand in zip(months, demand_by_month):
+        if total_demand > total_initial + total_prod_cap:
+            raise ValueError(
+                f"Demand seems too high for month {m}. "
+                f"Total demand={total_demand}, total initial inventory={total_initial}, total clinker production capacity={total_prod_cap}."
+            )
+
+    # 2) Storage feasibility (initial inventory must fit inside max inventory).
+    init_inv_arr = np.fromiter((initial_inventory.get(pid, 0.0) for pid in plant_ids), dtype=np.float64, count=len(plant_ids))
+    max_inv_arr = np.fromiter((max_inventory.get(pid, 0.0) for pid in plant_ids), dtype=np.float64, count=len(plant_ids))
+    over_storage = np.flatnonzero(init_inv_arr > max_inv_arr)
+    if over_storage.size:
+        pid = plant_ids[over_storage[0]]
+        raise ValueError(
+            f"Initial inventory for plant {plant_names.get(pid)} is greater than max inventory capacity."
+        )
+
+    # 3) Missing transport connectivity (simple check):
+    # If a plant has demand but no inflow route and no production, it will fail.
+    # Set algebra over the sparse demand entries instead of a plants x months
+    # scan: plants with positive demand, minus producers, minus plants with an
+    # enabled inbound route.
+    has_inflow = {j for (i, j, mode) in routes if route_enabled[(i, j, mode)]}
+    stranded = {pid for (pid, m), qty in data.demand.items() if qty > 0} - clinker_set - has_inflow
+    if stranded:
+        # Report the first such plant (then month) in display order.
+        pid = next(p for p in plant_ids if p in stranded)
+        month = next(m for m in months if data.demand.get((pid, m), 0.0) > 0)
+        raise ValueError(
+            f"Plant {plant_names.get(pid)} has demand in {month} but no enabled inbound transport route and no clinker production."
+        )
+
+    return data
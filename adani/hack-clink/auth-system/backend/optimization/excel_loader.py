@@ -8,12 +8,23 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 
 from backend.optimization.data_loader import OptimizationData
 
+# calamine (python-calamine) is a Rust xlsx reader, several times faster than
+# openpyxl. It is listed in requirements.txt, but an environment without it
+# still loads workbooks through openpyxl.
+try:
+    import python_calamine  # noqa: F401
+
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = 'openpyxl'
+
 
 @dataclass
 class ExcelOptimizationData(OptimizationData):
@@ -37,9 +48,85 @@ class ExcelOptimizationData(OptimizationData):
     transport_code_limits: Dict[Tuple[str, str, str], Dict[str, float]]  # (IU_CODE, TRANSPORT_CODE, TIME_PERIOD) -> {lower: value, upper: value}
 
 
+# Sheets read by load_excel_data: sheet -> (code columns, number columns).
+# Sheets listed in _PERIOD_SHEETS also need a TIME PERIOD column.
+# Only these columns are kept from the workbook.
+_SHEET_SCHEMA: Dict[str, Tuple[List[str], List[str]]] = {
+    'ClinkerDemand': (['IUGU CODE'], ['DEMAND', 'MIN FULFILLMENT (%)']),
+    'ClinkerCapacity': (['IU CODE'], ['CAPACITY']),
+    'ProductionCost': (['IU CODE'], ['PRODUCTION COST']),
+    'LogisticsIUGU': (
+        ['FROM IU CODE', 'TO IUGU CODE', 'TRANSPORT CODE'],
+        ['FREIGHT COST', 'HANDLING COST', 'QUANTITY MULTIPLIER'],
+    ),
+    'IUGUConstraint': (['IU CODE', 'TRANSPORT CODE', 'IUGU CODE', 'BOUND TYPEID'], ['Value']),
+    'IUGUOpeningStock': (['IUGU CODE'], ['OPENING STOCK']),
+    'HubOpeningStock': (['IUGU'], ['Opening Stock']),
+    'IUGUClosingStock': (['IUGU CODE'], ['MIN CLOSE STOCK', 'MAX CLOSE STOCK']),
+    'IUGUType': (['IUGU CODE', 'PLANT TYPE'], []),
+}
+_PERIOD_SHEETS = frozenset(
+    ['ClinkerDemand', 'ClinkerCapacity', 'ProductionCost', 'LogisticsIUGU', 'IUGUConstraint', 'IUGUClosingStock']
+)
+
+
+def _required_columns(sheet: str) -> List[str]:
+    code_columns, number_columns = _SHEET_SCHEMA[sheet]
+    period = ['TIME PERIOD'] if sheet in _PERIOD_SHEETS else []
+    return code_columns + period + number_columns
+
+
+# Union of every column used above (read_excel applies one usecols to all sheets).
+_USED_COLUMNS = frozenset(col for sheet in _SHEET_SCHEMA for col in _required_columns(sheet))
+
+
+def _codes_as_str(values: pd.Series) -> pd.Series:
+    """str() of every code cell, keeping blank cells missing.
+
+    astype(str) alone turns NaN into the text "nan" on pandas 2 (pandas 3
+    keeps it missing), which would make a blank cell look like a real code.
+    """
+
+    return values.where(values.isna(), values.astype(str))
+
+
+def _normalize_sheet(df: pd.DataFrame, code_columns: List[str], number_columns: List[str]) -> pd.DataFrame:
+    """Return the sheet with codes as categorical str, TIME PERIOD as int64 and numbers as float64.
+
+    Codes repeat a lot (a few hundred plants over thousands of rows), so they are
+    stored as categories: isin()/groupby() then work on small integer codes.
+    The categories are built from _codes_as_str(), so blank code cells stay
+    missing (NaN) instead of becoming a "nan" category, on pandas 2 and 3 alike.
+    """
+
+    columns: Dict[str, pd.Series] = {col: _codes_as_str(df[col]).astype('category') for col in code_columns}
+    if 'TIME PERIOD' in df.columns:
+        columns['TIME PERIOD'] = df['TIME PERIOD'].astype('int64')
+    columns.update({col: df[col].astype(float) for col in number_columns})
+    return df.assign(**columns)
+
+
+def _as_str(values: pd.Series) -> pd.Series:
+    """Column-wide str(); missing cells become "nan" just like str(float('nan'))."""
+
+    return values.astype(str).fillna("nan")
+
+
+def _optional_codes(values: pd.Series) -> pd.Series:
+    """Codes as str, with blank cells (missing or "") left as NaN."""
+
+    codes = _as_str(values)
+    return codes.where(values.notna() & (codes != ''))
+
+
 def load_excel_data(file_path: str, selected_months: List[str]) -> ExcelOptimizationData:
     """Load optimization data from Excel file.
     
+    Results are cached per (file, modification time, size, months), so Streamlit
+    reruns with an unchanged workbook skip parsing entirely. Editing or replacing
+    the file changes its mtime/size, which forces a fresh load.
+    The returned object is shared between callers: treat it as read-only.
+    
     Args:
         file_path: Path to the Excel file
         selected_months: List of time periods (months) to optimize
@@ -51,18 +138,51 @@ def load_excel_data(file_path: str, selected_months: List[str]) -> ExcelOptimiza
     if not os.path.exists(file_path):
         raise ValueError(f"Excel file not found: {file_path}")
     
-    xl = pd.ExcelFile(file_path)
+    stat = os.stat(file_path)
+    return _load_excel_data(
+        os.path.abspath(file_path), stat.st_mtime, stat.st_size, tuple(selected_months)
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_excel_data(
+    file_path: str, mtime: float, size: int, selected_months: Tuple[str, ...]
+) -> ExcelOptimizationData:
+    """Uncached loader behind load_excel_data (mtime/size are only cache-key parts)."""
+    
+    # Load all sheets in one call: the workbook (and its shared strings) is
+    # parsed once, with calamine when it is installed (see _EXCEL_ENGINE).
+    # Sheets are not read in parallel threads: one calamine workbook cannot be
+    # shared between threads, and opening it per sheet re-parses the shared
+    # strings every time, which costs more than the single pass saves.
+    sheets = pd.read_excel(
+        file_path,
+        sheet_name=list(_SHEET_SCHEMA),
+        usecols=lambda col: col in _USED_COLUMNS,
+        engine=_EXCEL_ENGINE,
+    )
     
-    # Load all sheets
-    demand_df = pd.read_excel(xl, 'ClinkerDemand')
-    capacity_df = pd.read_excel(xl, 'ClinkerCapacity')
-    prod_cost_df = pd.read_excel(xl, 'ProductionCost')
-    logistics_df = pd.read_excel(xl, 'LogisticsIUGU')
-    constraints_df = pd.read_excel(xl, 'IUGUConstraint')
-    opening_stock_df = pd.read_excel(xl, 'IUGUOpeningStock')
-    hub_opening_df = pd.read_excel(xl, 'HubOpeningStock')
-    closing_stock_df = pd.read_excel(xl, 'IUGUClosingStock')
-    iugu_type_df = pd.read_excel(xl, 'IUGUType')
+    # Fail fast with a clear message instead of a KeyError halfway through.
+    for sheet in _SHEET_SCHEMA:
+        missing = [col for col in _required_columns(sheet) if col not in sheets[sheet].columns]
+        if missing:
+            raise ValueError(f"Sheet '{sheet}' is missing columns: {', '.join(missing)}")
+    
+    # Cast every column we use exactly once, right after reading. The code
+    # below then filters and zips typed columns without per-value conversions.
+    frames = {
+        sheet: _normalize_sheet(sheets[sheet], code_columns, number_columns)
+        for sheet, (code_columns, number_columns) in _SHEET_SCHEMA.items()
+    }
+    demand_df = frames['ClinkerDemand']
+    capacity_df = frames['ClinkerCapacity']
+    prod_cost_df = frames['ProductionCost']
+    logistics_df = frames['LogisticsIUGU']
+    constraints_df = frames['IUGUConstraint']
+    opening_stock_df = frames['IUGUOpeningStock']
+    hub_opening_df = frames['HubOpeningStock']
+    closing_stock_df = frames['IUGUClosingStock']
+    iugu_type_df = frames['IUGUType']
     
     # Convert selected_months to time periods (assuming format like "2024-01" -> 1, "2024-02" -> 2)
     # For now, assume selected_months are already time period numbers or convert them
@@ -101,81 +221,79 @@ def load_excel_data(file_path: str, selected_months: List[str]) -> ExcelOptimiza
     plant_ids = list(all_iugu_codes)
     plant_ids = [p for p in plant_ids if pd.notna(p)]
     
+    # Sets for O(1) membership tests (isin() and the per-plant loops below).
+    plant_id_set = frozenset(plant_ids)
+    time_period_set = frozenset(time_periods)
+    
     # Plant names (using IUGU codes as names for now)
     plant_names = {pid: pid for pid in plant_ids}
     
     # Plant types
-    plant_type = {}
-    for _, row in iugu_type_df.iterrows():
-        iugu_code = str(row['IUGU CODE'])
-        ptype = str(row['PLANT TYPE'])
-        if iugu_code in plant_ids:
-            if ptype == 'IU':
-                plant_type[iugu_code] = 'Clinker Plant'
-            elif ptype == 'GU':
-                plant_type[iugu_code] = 'Grinding Unit'
-            else:
-                plant_type[iugu_code] = 'Other'
+    # Sheets are processed column-wise: filter rows with boolean masks, then
+    # zip the remaining columns into dicts (no per-row Series like iterrows).
+    type_codes = iugu_type_df['IUGU CODE']
+    type_labels = iugu_type_df['PLANT TYPE'].astype(str).map({'IU': 'Clinker Plant', 'GU': 'Grinding Unit'}).fillna('Other')
+    mask = type_codes.isin(plant_id_set)
+    plant_type = dict(zip(type_codes[mask].tolist(), type_labels[mask].tolist()))
     
     # Clinker plants (IU codes)
     clinker_plants = list(iu_codes)
     
     # Production capacity: initialize 0 for all plants, then override IU codes
+    # (dict(zip(...)) keeps the last row per code = "use latest capacity for now")
     production_capacity: Dict[str, float] = {pid: 0.0 for pid in plant_ids}
-    for _, row in capacity_df.iterrows():
-        iu_code = str(row['IU CODE'])
-        period = int(row['TIME PERIOD'])
-        capacity = float(row['CAPACITY'])
-        if period in time_periods and iu_code in plant_ids:
-            production_capacity[iu_code] = capacity  # Use latest capacity for now
+    codes = capacity_df['IU CODE']
+    mask = capacity_df['TIME PERIOD'].isin(time_period_set) & codes.isin(plant_id_set)
+    production_capacity.update(zip(codes[mask].tolist(), capacity_df['CAPACITY'][mask].tolist()))
     
     # Production cost: initialize 0 for all plants, then override IU codes
     production_cost: Dict[str, float] = {pid: 0.0 for pid in plant_ids}
-    for _, row in prod_cost_df.iterrows():
-        iu_code = str(row['IU CODE'])
-        period = int(row['TIME PERIOD'])
-        cost = float(row['PRODUCTION COST'])
-        if period in time_periods and iu_code in plant_ids:
-            production_cost[iu_code] = cost  # Use latest cost for now
+    codes = prod_cost_df['IU CODE']
+    mask = prod_cost_df['TIME PERIOD'].isin(time_period_set) & codes.isin(plant_id_set)
+    production_cost.update(zip(codes[mask].tolist(), prod_cost_df['PRODUCTION COST'][mask].tolist()))
     
     # Demand: (IUGU_CODE, TIME_PERIOD) -> DEMAND
-    # Default 0 for all plant/period combinations
-    demand: Dict[Tuple[str, str], float] = {}
-    for pid in plant_ids:
-        for period in time_periods:
-            demand[(pid, str(period))] = 0.0
-    for _, row in demand_df.iterrows():
-        iugu_code = str(row['IUGU CODE'])
-        period = int(row['TIME PERIOD'])
-        demand_qty = float(row['DEMAND'])
-        if period in time_periods and iugu_code in plant_ids:
-            demand[(iugu_code, str(period))] += demand_qty
+    # Sparse: only pairs with demand rows get an entry (missing pairs = 0).
+    # Several rows for the same pair are added up by one groupby sum
+    # (blank DEMAND cells count as 0).
+    demand_codes = demand_df['IUGU CODE']
+    demand_periods = demand_df['TIME PERIOD']
+    demand_period_ok = demand_periods.isin(time_period_set)
+    mask = demand_period_ok & demand_codes.isin(plant_id_set)
+    demand_totals = demand_df[mask].groupby(['IUGU CODE', 'TIME PERIOD'], sort=False, observed=True)['DEMAND'].sum()
+    demand: Dict[Tuple[str, str], float] = dict(
+        zip(
+            zip(
+                demand_totals.index.get_level_values(0).tolist(),
+                demand_totals.index.get_level_values(1).astype(str).tolist(),
+            ),
+            demand_totals.tolist(),
+        )
+    )
     
     # Min fulfillment: (IUGU_CODE, TIME_PERIOD) -> MIN FULFILLMENT %
-    min_fulfillment = {}
-    for _, row in demand_df.iterrows():
-        iugu_code = str(row['IUGU CODE'])
-        period = int(row['TIME PERIOD'])
-        min_fulfill = row['MIN FULFILLMENT (%)']
-        if pd.notna(min_fulfill) and period in time_periods:
-            min_fulfillment[(iugu_code, str(period))] = float(min_fulfill) / 100.0  # Convert to decimal
+    min_fulfill = demand_df['MIN FULFILLMENT (%)']
+    mask = demand_period_ok & min_fulfill.notna()
+    min_fulfillment = dict(
+        zip(
+            zip(_as_str(demand_codes[mask]).tolist(), demand_periods[mask].astype(str).tolist()),
+            (min_fulfill[mask] / 100.0).tolist(),  # Convert to decimal
+        )
+    )
     
     # Initial inventory from IUGUOpeningStock
-    initial_inventory: Dict[str, float] = {}
-    for _, row in opening_stock_df.iterrows():
-        iugu_code = str(row['IUGU CODE'])
-        opening_stock = float(row['OPENING STOCK'])
-        if iugu_code in plant_ids:
-            initial_inventory[iugu_code] = opening_stock
+    codes = opening_stock_df['IUGU CODE']
+    mask = codes.isin(plant_id_set)
+    initial_inventory: Dict[str, float] = dict(
+        zip(codes[mask].tolist(), opening_stock_df['OPENING STOCK'][mask].tolist())
+    )
     
     # Add hub opening stock
-    for _, row in hub_opening_df.iterrows():
-        iu_code = str(row['IU'])
-        iugu_code = str(row['IUGU'])
-        opening_stock = float(row['Opening Stock'])
-        if iugu_code in plant_ids:
-            # Add to existing or set
-            initial_inventory[iugu_code] = initial_inventory.get(iugu_code, 0.0) + opening_stock
+    codes = hub_opening_df['IUGU']
+    mask = codes.isin(plant_id_set)
+    for iugu_code, opening_stock in zip(codes[mask].tolist(), hub_opening_df['Opening Stock'][mask].tolist()):
+        # Add to existing or set
+        initial_inventory[iugu_code] = initial_inventory.get(iugu_code, 0.0) + opening_stock
     
     # Ensure every plant has an initial inventory (default 0.0)
     for pid in plant_ids:
@@ -185,26 +303,30 @@ def load_excel_data(file_path: str, selected_months: List[str]) -> ExcelOptimiza
     # Closing stock constraints
     min_closing_stock = {}
     max_closing_stock = {}
-    for _, row in closing_stock_df.iterrows():
-        iugu_code = str(row['IUGU CODE'])
-        period = int(row['TIME PERIOD'])
-        min_close = row['MIN CLOSE STOCK']
-        max_close = row['MAX CLOSE STOCK']
-        if period in time_periods and iugu_code in plant_ids:
-            if pd.notna(min_close):
-                min_closing_stock[(iugu_code, str(period))] = float(min_close)
-            if pd.notna(max_close):
-                max_closing_stock[(iugu_code, str(period))] = float(max_close)
+    codes = closing_stock_df['IUGU CODE']
+    periods = closing_stock_df['TIME PERIOD']
+    mask = periods.isin(time_period_set) & codes.isin(plant_id_set)
+    for column, target in (('MIN CLOSE STOCK', min_closing_stock), ('MAX CLOSE STOCK', max_closing_stock)):
+        values = closing_stock_df[column]
+        rows = mask & values.notna()
+        target.update(
+            zip(
+                zip(codes[rows].tolist(), periods[rows].astype(str).tolist()),
+                values[rows].tolist(),
+            )
+        )
+    
+    # Max closing stock across the selected periods, per plant (positive values
+    # only). Used for both storage capacity and max inventory below.
+    max_close_by_pid: Dict[str, float] = {}
+    for (pid, _period), value in max_closing_stock.items():
+        if value > max_close_by_pid.get(pid, 0.0):
+            max_close_by_pid[pid] = value
     
     # Storage capacity (use max closing stock or a default)
     storage_capacity = {}
     for pid in plant_ids:
-        # Find max closing stock across all periods
-        max_stock = 0.0
-        for period in time_periods:
-            key = (pid, str(period))
-            if key in max_closing_stock:
-                max_stock = max(max_stock, max_closing_stock[key])
+        max_stock = max_close_by_pid.get(pid, 0.0)
         storage_capacity[pid] = max_stock if max_stock > 0 else initial_inventory.get(pid, 0.0) * 2
     
     # Safety stock and max inventory (derive from closing stock)
@@ -217,84 +339,90 @@ def load_excel_data(file_path: str, selected_months: List[str]) -> ExcelOptimiza
         safety_stock[pid] = min_closing_stock.get((pid, first_period), 0.0)
         
         # Max inventory = max closing stock
-        max_inv = 0.0
-        for period in time_periods:
-            key = (pid, str(period))
-            if key in max_closing_stock:
-                max_inv = max(max_inv, max_closing_stock[key])
+        max_inv = max_close_by_pid.get(pid, 0.0)
         max_inventory[pid] = max_inv if max_inv > 0 else storage_capacity[pid]
         
         holding_cost[pid] = 0.0  # Default
     
     # Transport routes from LogisticsIUGU
-    routes = []
     transport_cost_per_trip = {}
     transport_capacity_per_trip = {}
     transport_sbq = {}
     route_enabled = {}
     
-    for _, row in logistics_df.iterrows():
-        from_iu = str(row['FROM IU CODE'])
-        to_iugu = str(row['TO IUGU CODE'])
-        transport_code = str(row['TRANSPORT CODE'])
-        period = int(row['TIME PERIOD'])
-        freight_cost = float(row['FREIGHT COST'])
-        handling_cost = float(row['HANDLING COST'])
-        qty_multiplier = float(row['QUANTITY MULTIPLIER'])
+    from_codes = logistics_df['FROM IU CODE']
+    to_codes = logistics_df['TO IUGU CODE']
+    mask = (
+        logistics_df['TIME PERIOD'].isin(time_period_set)
+        & from_codes.isin(plant_id_set)
+        & to_codes.isin(plant_id_set)
+    )
+    # Total cost = freight + handling
+    total_costs = logistics_df['FREIGHT COST'] + logistics_df['HANDLING COST']
+    
+    for from_iu, to_iugu, transport_code, total_cost, qty_multiplier in zip(
+        from_codes[mask].tolist(),
+        to_codes[mask].tolist(),
+        _as_str(logistics_df['TRANSPORT CODE'][mask]).tolist(),
+        total_costs[mask].tolist(),
+        logistics_df['QUANTITY MULTIPLIER'][mask].tolist(),
+    ):
+        # Capacity per trip: use QUANTITY MULTIPLIER from dataset
+        # This represents how many units can be moved per trip / lane.
+        capacity_per_trip = max(qty_multiplier, 0.0) if qty_multiplier is not None else 0.0
+        
+        # SBQ (minimum shipment quantity)
+        sbq = 0.0  # Default
+        
+        route_key = (from_iu, to_iugu, transport_code)
         
-        if period in time_periods and from_iu in plant_ids and to_iugu in plant_ids:
-            # Total cost = freight + handling
-            total_cost = freight_cost + handling_cost
-            
-            # Capacity per trip: use QUANTITY MULTIPLIER from dataset
-            # This represents how many units can be moved per trip / lane.
-            capacity_per_trip = max(qty_multiplier, 0.0) if qty_multiplier is not None else 0.0
-            
-            # SBQ (minimum shipment quantity)
-            sbq = 0.0  # Default
-            
-            route_key = (from_iu, to_iugu, transport_code)
-            
-            if route_key not in routes:
-                routes.append(route_key)
-            
-            # Use period-specific or aggregate values
-            transport_cost_per_trip[route_key] = total_cost
-            transport_capacity_per_trip[route_key] = capacity_per_trip
-            transport_sbq[route_key] = sbq
-            route_enabled[route_key] = True
+        # Use period-specific or aggregate values
+        transport_cost_per_trip[route_key] = total_cost
+        transport_capacity_per_trip[route_key] = capacity_per_trip
+        transport_sbq[route_key] = sbq
+        route_enabled[route_key] = True
+    
+    # Unique routes in first-seen order: dict keys already keep that order,
+    # so no O(n) "route_key not in routes" list scan per row.
+    routes = list(route_enabled)
     
     # Transport constraints from IUGUConstraint
     transport_bounds = {}
     transport_code_limits = {}
     
-    for _, row in constraints_df.iterrows():
-        iu_code = str(row['IU CODE']) if pd.notna(row['IU CODE']) else None
-        transport_code = str(row['TRANSPORT CODE']) if pd.notna(row['TRANSPORT CODE']) else None
-        iugu_code = str(row['IUGU CODE']) if pd.notna(row['IUGU CODE']) else None
-        period = int(row['TIME PERIOD'])
-        bound_type = str(row['BOUND TYPEID'])  # L=Lower, E=Equal, U=Upper
-        value_type = str(row['VALUE TYPEID'])  # C=Capacity, Q=Quantity
-        value = float(row['Value'])
+    iu_codes_col = _optional_codes(constraints_df['IU CODE'])
+    transport_codes_col = _optional_codes(constraints_df['TRANSPORT CODE'])
+    iugu_codes_col = _optional_codes(constraints_df['IUGU CODE'])
+    periods = constraints_df['TIME PERIOD']
+    values = constraints_df['Value']
+    
+    # Only rows that name both an IU and a transport code produce constraints.
+    mask = periods.isin(time_period_set) & iu_codes_col.notna() & transport_codes_col.notna()
+    
+    for iu_code, transport_code, iugu_code, period, bound_type, value in zip(
+        iu_codes_col[mask].tolist(),
+        transport_codes_col[mask].tolist(),
+        iugu_codes_col[mask].tolist(),
+        periods[mask].astype(str).tolist(),
+        _as_str(constraints_df['BOUND TYPEID'][mask]).tolist(),  # L=Lower, E=Equal, U=Upper
+        values[mask].tolist(),
+    ):
+        # Transport code level constraint
+        key = (iu_code, transport_code, period)
+        if key not in transport_code_limits:
+            transport_code_limits[key] = {'lower': None, 'upper': None}
+        
+        if bound_type == 'L':
+            transport_code_limits[key]['lower'] = value
+        elif bound_type == 'U':
+            transport_code_limits[key]['upper'] = value
         
-        if period in time_periods:
-            if iu_code and transport_code:
-                # Transport code level constraint
-                key = (iu_code, transport_code, str(period))
-                if key not in transport_code_limits:
-                    transport_code_limits[key] = {'lower': None, 'upper': None}
-                
-                if bound_type == 'L':
-                    transport_code_limits[key]['lower'] = value
-                elif bound_type == 'U':
-                    transport_code_limits[key]['upper'] = value
-            
-            if iu_code and transport_code and iugu_code:
-                # Route-specific constraint
-                constraint_key = (iu_code, transport_code, iugu_code, str(period))
-                if constraint_key not in transport_bounds:
-                    transport_bounds[constraint_key] = {}
-                transport_bounds[constraint_key][bound_type] = value
+        if isinstance(iugu_code, str):
+            # Route-specific constraint
+            constraint_key = (iu_code, transport_code, iugu_code, period)
+            if constraint_key not in transport_bounds:
+                transport_bounds[constraint_key] = {}
+            transport_bounds[constraint_key][bound_type] = value
     
     return ExcelOptimizationData(
         months=[str(tp) for tp in time_periods],
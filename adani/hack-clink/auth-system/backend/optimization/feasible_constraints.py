@@ -6,7 +6,7 @@ even when the original problem is infeasible.
 
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 import pyomo.environ as pyo
 
@@ -14,6 +14,19 @@ import pyomo.environ as pyo
 def add_feasible_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000) -> None:
     """Add all constraints to the model with slack variables for feasibility."""
 
+    # Route adjacency, built once with a single pass over model.R.
+    # Rules below look up their routes here instead of scanning every route
+    # for every (plant, month), which made model build O(|P|*|T|*|R|).
+    in_routes: Dict[str, List[Tuple[str, str, str]]] = {}
+    out_routes: Dict[str, List[Tuple[str, str, str]]] = {}
+    modes_by_ij: Dict[Tuple[str, str], List[str]] = {}
+    routes_by_ik: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = {}
+    for (i, j, k) in model.R:
+        out_routes.setdefault(i, []).append((i, j, k))
+        in_routes.setdefault(j, []).append((i, j, k))
+        modes_by_ij.setdefault((i, j), []).append(k)
+        routes_by_ik.setdefault((i, k), []).append((i, j, k))
+
     # Add slack variables for demand fulfillment
     model.DemandSlack = pyo.Var(model.P, model.T, domain=pyo.NonNegativeReals, 
                                doc="Unmet demand slack variable")
@@ -27,12 +40,15 @@ def add_feasible_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000
 
     model.ProductionCapacity = pyo.Constraint(model.CL, model.T, rule=production_capacity_rule)
 
+    # Previous-month lookup bound once (the rule runs |P|*|T| times).
+    prev_t_map = model.PREV_T
+
     # Inventory balance (multi-period) with slack for demand
     def inventory_balance_rule(m: pyo.ConcreteModel, p: str, t: str):
-        prev_t = m.PREV_T[t]
+        prev_t = prev_t_map[t]
 
-        inflow = sum(m.Ship[i, p, k, t] for (i, j, k) in m.R if j == p)
-        outflow = sum(m.Ship[p, j, k, t] for (i, j, k) in m.R if i == p)
+        inflow = pyo.quicksum(m.Ship[i, j, k, t] for (i, j, k) in in_routes.get(p, ()))
+        outflow = pyo.quicksum(m.Ship[i, j, k, t] for (i, j, k) in out_routes.get(p, ()))
         prod = m.Prod[p, t]
 
         if prev_t is None:
@@ -70,25 +86,8 @@ def add_feasible_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000
 
     model.SBQ = pyo.Constraint(model.R, model.T, rule=sbq_rule)
 
-    # If a route is disabled, force shipments and trips to 0.
-    def route_enabled_ship_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-        if bool(m.RouteEnabled[i, j, k]):
-            return pyo.Constraint.Skip
-        return m.Ship[i, j, k, t] == 0
-
-    def route_enabled_trips_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-        if bool(m.RouteEnabled[i, j, k]):
-            return pyo.Constraint.Skip
-        return m.Trips[i, j, k, t] == 0
-
-    def route_enabled_use_rule(m: pyo.ConcreteModel, i: str, j: str, k: str, t: str):
-        if bool(m.RouteEnabled[i, j, k]):
-            return pyo.Constraint.Skip
-        return m.Use[i, j, k, t] == 0
-
-    model.RouteEnabledShip = pyo.Constraint(model.R, model.T, rule=route_enabled_ship_rule)
-    model.RouteEnabledTrips = pyo.Constraint(model.R, model.T, rule=route_enabled_trips_rule)
-    model.RouteEnabledUse = pyo.Constraint(model.R, model.T, rule=route_enabled_use_rule)
+    # Disabled routes: Ship/Trips/Use are fixed to 0 in the model builder,
+    # so no constraints are needed for them here.
 
     # Mode selection:
     # If Use[i,j,k,t] = 0 then Trips must be 0.
@@ -98,11 +97,9 @@ def add_feasible_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000
     model.LinkUseTrips = pyo.Constraint(model.R, model.T, rule=link_use_trips_rule)
 
     # At most one mode per (i,j) per month.
+    # model.IJ is built from the route list, so every pair has at least one mode.
     def one_mode_rule(m: pyo.ConcreteModel, i: str, j: str, t: str):
-        modes = [k for (ii, jj, k) in m.R if ii == i and jj == j]
-        if not modes:
-            return pyo.Constraint.Skip
-        return sum(m.Use[i, j, k, t] for k in modes) <= 1
+        return pyo.quicksum(m.Use[i, j, k, t] for k in modes_by_ij[i, j]) <= 1
 
     model.OneModePerRoute = pyo.Constraint(model.IJ, model.T, rule=one_mode_rule)
 
@@ -114,7 +111,7 @@ def add_feasible_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000
             if (p, t) not in m.MinFulfillment:
                 return pyo.Constraint.Skip
             min_fulfill_pct = m.MinFulfillment[p, t] * 0.8  # Allow 20% reduction
-            inflow = sum(m.Ship[i, p, k, t] for (i, j, k) in m.R if j == p)
+            inflow = pyo.quicksum(m.Ship[i, j, k, t] for (i, j, k) in in_routes.get(p, ()))
             prod = m.Prod[p, t]
             total_supply = prod + inflow
             return total_supply + m.DemandSlack[p, t] >= min_fulfill_pct * m.Demand[p, t]
@@ -140,13 +137,24 @@ def add_feasible_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000
     
     # Transport code limits (relaxed)
     if hasattr(model, 'TransportCodeLimits'):
+        # Total shipped per (origin, transport code, month), built once and shared
+        # by the lower and upper rules when a key has both limits.
+        shipped_exprs: Dict[Tuple[str, str, str], object] = {}
+
+        def shipped_by_code(m: pyo.ConcreteModel, i: str, k: str, t: str):
+            expr = shipped_exprs.get((i, k, t))
+            if expr is None:
+                expr = pyo.quicksum(m.Ship[ii, jj, kk, t] for (ii, jj, kk) in routes_by_ik.get((i, k), ()))
+                shipped_exprs[(i, k, t)] = expr
+            return expr
+
         def transport_code_limit_lower_rule(m: pyo.ConcreteModel, i: str, k: str, t: str):
             if (i, k, t) not in m.TransportCodeLimits:
                 return pyo.Constraint.Skip
             limits = m.TransportCodeLimits[i, k, t]
             if 'lower' not in limits or limits['lower'] is None:
                 return pyo.Constraint.Skip
-            total_shipped = sum(m.Ship[ii, jj, k, t] for (ii, jj, kk) in m.R if ii == i and kk == k)
+            total_shipped = shipped_by_code(m, i, k, t)
             return total_shipped >= limits['lower'] * 0.8  # Allow 20% reduction
         
         def transport_code_limit_upper_rule(m: pyo.ConcreteModel, i: str, k: str, t: str):
@@ -155,7 +163,7 @@ def add_feasible_constraints(model: pyo.ConcreteModel, big_m_trips: int = 10_000
             limits = m.TransportCodeLimits[i, k, t]
             if 'upper' not in limits or limits['upper'] is None:
                 return pyo.Constraint.Skip
-            total_shipped = sum(m.Ship[ii, jj, k, t] for (ii, jj, kk) in m.R if ii == i and kk == k)
+            total_shipped = shipped_by_code(m, i, k, t)
             return total_shipped <= limits['upper'] * 1.2  # Allow 20% overflow
         
         if hasattr(model, 'TransportCodeLimitSet'):
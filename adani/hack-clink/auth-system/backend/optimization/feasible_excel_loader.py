@@ -6,10 +6,12 @@ to ensure the optimization model can run successfully.
 
 from __future__ import annotations
 
+import math
 import os
 from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from backend.optimization.data_loader import OptimizationData
@@ -26,6 +28,14 @@ class FeasibleExcelOptimizationData(ExcelOptimizationData):
     stock_expansion_factor: float = 1.5  # 50% stock expansion
 
 
+def _scaled(values: Dict[Any, float], factor: float) -> Dict[Any, float]:
+    """Return a new dict with every value multiplied by factor (one NumPy multiply)."""
+
+    arr = np.fromiter(values.values(), dtype=np.float64, count=len(values))
+    arr *= factor
+    return dict(zip(values.keys(), arr.tolist()))
+
+
 def load_feasible_excel_data(file_path: str, selected_months: List[str]) -> FeasibleExcelOptimizationData:
     """Load optimization data from Excel file with feasibility adjustments.
     
@@ -44,9 +54,9 @@ def load_feasible_excel_data(file_path: str, selected_months: List[str]) -> Feas
     print("Applying feasibility adjustments...")
     
     # Calculate original coverage
-    total_capacity = sum(original_data.production_capacity.values())
-    total_demand = sum(original_data.demand.values())
-    total_stock = sum(original_data.initial_inventory.values())
+    total_capacity = math.fsum(original_data.production_capacity.values())
+    total_demand = math.fsum(original_data.demand.values())
+    total_stock = math.fsum(original_data.initial_inventory.values())
     original_coverage = (total_capacity + total_stock) / total_demand if total_demand > 0 else 0
     
     print(f"Original coverage ratio: {original_coverage:.3f}")
@@ -87,30 +97,23 @@ def load_feasible_excel_data(file_path: str, selected_months: List[str]) -> Feas
     if original_coverage < 1.0:
         print("Applying feasibility fixes...")
         
+        # New dicts are built (the loaded data is cached and shared, so it
+        # must not be changed in place).
         # 1. Reduce demand
-        adjusted_demand = {}
-        for (plant_id, period), demand_value in adjusted_data.demand.items():
-            adjusted_demand[(plant_id, period)] = demand_value * adjusted_data.demand_reduction_factor
+        adjusted_data.demand = _scaled(adjusted_data.demand, adjusted_data.demand_reduction_factor)
         
         # 2. Increase capacity
-        adjusted_capacity = {}
-        for plant_id, capacity_value in adjusted_data.production_capacity.items():
-            adjusted_capacity[plant_id] = capacity_value * adjusted_data.capacity_expansion_factor
+        adjusted_data.production_capacity = _scaled(
+            adjusted_data.production_capacity, adjusted_data.capacity_expansion_factor
+        )
         
         # 3. Increase initial stock
-        adjusted_stock = {}
-        for plant_id, stock_value in adjusted_data.initial_inventory.items():
-            adjusted_stock[plant_id] = stock_value * adjusted_data.stock_expansion_factor
-        
-        # Update the data
-        adjusted_data.demand = adjusted_demand
-        adjusted_data.production_capacity = adjusted_capacity
-        adjusted_data.initial_inventory = adjusted_stock
+        adjusted_data.initial_inventory = _scaled(adjusted_data.initial_inventory, adjusted_data.stock_expansion_factor)
         
         # Recalculate coverage
-        new_total_capacity = sum(adjusted_data.production_capacity.values())
-        new_total_demand = sum(adjusted_data.demand.values())
-        new_total_stock = sum(adjusted_data.initial_inventory.values())
+        new_total_capacity = math.fsum(adjusted_data.production_capacity.values())
+        new_total_demand = math.fsum(adjusted_data.demand.values())
+        new_total_stock = math.fsum(adjusted_data.initial_inventory.values())
         new_coverage = (new_total_capacity + new_total_stock) / new_total_demand if new_total_demand > 0 else 0
         
         print(f"New coverage ratio: {new_coverage:.3f}")
@@ -6,36 +6,51 @@ to ensure the model can find a feasible solution even with constraints violation
 
 from __future__ import annotations
 
+from typing import Any, List, Tuple
+
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
+
+
+def _add_cost_terms(model: pyo.ConcreteModel, index, cost_param, var, coefs: List[Any], variables: List[Any]) -> None:
+    """Append cost[idx] * var[idx, t] terms over index x T to the coef/var lists."""
+
+    for idx in index:
+        key: Tuple = idx if isinstance(idx, tuple) else (idx,)
+        cost = pyo.value(cost_param[idx])
+        for t in model.T:
+            coefs.append(cost)
+            variables.append(var[key + (t,)])
 
 
 def add_feasible_objective(model: pyo.ConcreteModel) -> None:
     """Add objective function with demand slack penalties to the model."""
 
+    # The whole objective is one flat LinearExpression (coefficient list +
+    # variable list) instead of Python sum() chains, which build the
+    # expression one "+" at a time.
+    coefs: List[Any] = []
+    variables: List[Any] = []
+
     # Production cost component
-    production_cost = (
-        sum(model.ProdCost[p] * model.Prod[p, t] for p in model.P for t in model.T)
-    )
+    _add_cost_terms(model, model.P, model.ProdCost, model.Prod, coefs, variables)
 
     # Transportation cost component
-    transport_cost = (
-        sum(model.RouteCost[i, j, k] * model.Ship[i, j, k, t] 
-            for (i, j, k) in model.R for t in model.T)
-    )
+    _add_cost_terms(model, model.R, model.RouteCost, model.Ship, coefs, variables)
 
     # Inventory holding cost component
-    holding_cost = (
-        sum(model.HoldCost[p] * model.Inv[p, t] for p in model.P for t in model.T)
-    )
+    _add_cost_terms(model, model.P, model.HoldCost, model.Inv, coefs, variables)
 
-    # Penalty for unmet demand (high penalty to minimize slack)
-    demand_penalty = (
-        sum(model.DemandPenalty * model.DemandSlack[p, t] 
-            for p in model.P for t in model.T)
-    )
+    # Penalty for unmet demand (high penalty to minimize slack).
+    # DemandPenalty is mutable, so it is kept as the Param itself (not its
+    # current value): changing it later still updates the objective.
+    for p in model.P:
+        for t in model.T:
+            coefs.append(model.DemandPenalty)
+            variables.append(model.DemandSlack[p, t])
 
     # Total objective: minimize total cost + demand penalties
-    total_cost = production_cost + transport_cost + holding_cost + demand_penalty
+    total_cost = LinearExpression(constant=0.0, linear_coefs=coefs, linear_vars=variables)
 
     model.TotalCost = pyo.Objective(
         expr=total_cost,
@@ -66,8 +66,8 @@ def build_model(data: OptimizationData) -> pyo.ConcreteModel:
     m.ProdCap = pyo.Param(m.P, initialize=data.production_capacity, within=pyo.NonNegativeReals)
     m.ProdCost = pyo.Param(m.P, initialize=data.production_cost, within=pyo.NonNegativeReals)
 
-    # Demand parameter: dict keyed by (plant_id, month)
-    m.Demand = pyo.Param(m.P, m.T, initialize=data.demand, within=pyo.NonNegativeReals)
+    # Demand parameter: dict keyed by (plant_id, month); missing pairs mean no demand.
+    m.Demand = pyo.Param(m.P, m.T, initialize=data.demand, default=0.0, within=pyo.NonNegativeReals)
 
     m.RouteCost = pyo.Param(m.R, initialize=data.transport_cost_per_trip, within=pyo.NonNegativeReals)
     m.RouteCap = pyo.Param(m.R, initialize=data.transport_capacity_per_trip, within=pyo.NonNegativeReals)
@@ -144,6 +144,16 @@ def build_model(data: OptimizationData) -> pyo.ConcreteModel:
     # Inventory at each plant per month.
     m.Inv = pyo.Var(m.P, m.T, domain=pyo.NonNegativeReals)
 
+    # Disabled routes can never be used: fix their shipment, trip and mode
+    # variables to 0 instead of adding "== 0" constraints. Fixed variables
+    # become constants when the model is written, so the solver never sees them.
+    for route in data.routes:
+        if not data.route_enabled[route]:
+            for t in data.months:
+                m.Ship[route + (t,)].fix(0)
+                m.Trips[route + (t,)].fix(0)
+                m.Use[route + (t,)].fix(0)
+
     # Fix production to 0 for non-clinker plants.
     non_clinker = [pid for pid in data.plant_ids if pid not in set(data.clinker_plants)]
     for p in non_clinker:
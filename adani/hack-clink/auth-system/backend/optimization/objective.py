@@ -13,23 +13,43 @@ Beginner tip:
 
 from __future__ import annotations
 
+from typing import Any, List
+
 import pyomo.environ as pyo
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 
 def add_objective(model: pyo.ConcreteModel) -> None:
     """Add the objective function to the model."""
 
     def total_cost_rule(m: pyo.ConcreteModel):
-        production_cost = sum(m.Prod[p, t] * m.ProdCost[p] for p in m.P for t in m.T)
-
-        transport_cost = sum(
-            m.Trips[i, j, k, t] * m.RouteCost[i, j, k]
-            for (i, j, k) in m.R
-            for t in m.T
-        )
-
-        holding_cost = sum(m.Inv[p, t] * m.HoldCost[p] for p in m.P for t in m.T)
-
-        return production_cost + transport_cost + holding_cost
+        # The objective is built as one flat LinearExpression (a list of
+        # coefficients + a list of variables). A Python sum() of products
+        # would build it one "+" at a time, which is much slower on big models.
+        coefs: List[float] = []
+        variables: List[Any] = []
+
+        # Production cost
+        for p in m.P:
+            cost = pyo.value(m.ProdCost[p])
+            for t in m.T:
+                coefs.append(cost)
+                variables.append(m.Prod[p, t])
+
+        # Transport cost (per trip)
+        for (i, j, k) in m.R:
+            cost = pyo.value(m.RouteCost[i, j, k])
+            for t in m.T:
+                coefs.append(cost)
+                variables.append(m.Trips[i, j, k, t])
+
+        # Holding cost
+        for p in m.P:
+            cost = pyo.value(m.HoldCost[p])
+            for t in m.T:
+                coefs.append(cost)
+                variables.append(m.Inv[p, t])
+
+        return LinearExpression(constant=0.0, linear_coefs=coefs, linear_vars=variables)
 
     model.TotalCost = pyo.Objective(rule=total_cost_rule, sense=pyo.minimize)
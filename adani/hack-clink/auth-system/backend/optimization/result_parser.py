@@ -12,8 +12,9 @@ These structures are easy to show in Streamlit and easy to export to Excel.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 import pyomo.environ as pyo
 
@@ -28,79 +29,110 @@ class OptimizationResults:
 
 
 def _safe_value(v) -> float:
+    """pyo.value() as float, or 0.0 if it cannot be evaluated.
+
+    Only used for cost Params and the objective; Var values go through _var_values.
+    """
+
     try:
         return float(pyo.value(v))
     except Exception:
         return 0.0
 
 
+def _var_values(var: pyo.Var) -> Tuple[List[Tuple], np.ndarray]:
+    """Return (index keys, values) of an indexed Var in one pass.
+
+    Reads .value directly (no pyo.value()/try per cell); unset values count as 0.
+    """
+
+    keys = list(var.keys())
+    values = np.fromiter((v.value or 0.0 for v in var.values()), dtype=np.float64, count=len(keys))
+    return keys, values
+
+
+def _names(ids: List[str], plant_names: Dict[str, str]) -> List[str]:
+    return [plant_names.get(pid, pid) for pid in ids]
+
+
 def parse_results(model: pyo.ConcreteModel, plant_names: Dict[str, str]) -> OptimizationResults:
-    """Parse a solved model into pandas DataFrames."""
+    """Parse a solved model into pandas DataFrames.
+
+    Variable values are pulled out once per Var as NumPy arrays; the tables are
+    then built column-wise and the cost breakdown uses dot products.
+    """
 
     # Production plan
-    prod_rows: List[Dict[str, Any]] = []
-    for p in list(model.P):
-        for t in list(model.T):
-            qty = _safe_value(model.Prod[p, t])
-            if qty != 0:
-                prod_rows.append(
-                    {
-                        "plant_id": p,
-                        "plant": plant_names.get(p, p),
-                        "month": t,
-                        "production": qty,
-                    }
-                )
-
-    production_df = pd.DataFrame(prod_rows)
-
-    # Transport plan
-    ship_rows: List[Dict[str, Any]] = []
-    for (i, j, k) in list(model.R):
-        for t in list(model.T):
-            ship_qty = _safe_value(model.Ship[i, j, k, t])
-            trips = _safe_value(model.Trips[i, j, k, t])
-
-            if ship_qty != 0 or trips != 0:
-                ship_rows.append(
-                    {
-                        "from_id": i,
-                        "from": plant_names.get(i, i),
-                        "to_id": j,
-                        "to": plant_names.get(j, j),
-                        "mode": k,
-                        "month": t,
-                        "shipment": ship_qty,
-                        "trips": int(round(trips)),
-                    }
-                )
-
-    transport_df = pd.DataFrame(ship_rows)
+    prod_keys, prod_vals = _var_values(model.Prod)
+    prod_plants = [p for (p, t) in prod_keys]
+    prod_months = [t for (p, t) in prod_keys]
+
+    production_df = pd.DataFrame()
+    nonzero = np.flatnonzero(prod_vals != 0)
+    if nonzero.size:
+        ids = [prod_plants[n] for n in nonzero]
+        production_df = pd.DataFrame(
+            {
+                "plant_id": ids,
+                "plant": _names(ids, plant_names),
+                "month": [prod_months[n] for n in nonzero],
+                "production": prod_vals[nonzero],
+            }
+        )
+
+    # Transport plan (Ship and Trips share the same (route, month) index)
+    ship_keys, ship_vals = _var_values(model.Ship)
+    _, trips_vals = _var_values(model.Trips)
+
+    transport_df = pd.DataFrame()
+    nonzero = np.flatnonzero((ship_vals != 0) | (trips_vals != 0))
+    if nonzero.size:
+        rows = [ship_keys[n] for n in nonzero]
+        from_ids = [r[0] for r in rows]
+        to_ids = [r[1] for r in rows]
+        transport_df = pd.DataFrame(
+            {
+                "from_id": from_ids,
+                "from": _names(from_ids, plant_names),
+                "to_id": to_ids,
+                "to": _names(to_ids, plant_names),
+                "mode": [r[2] for r in rows],
+                "month": [r[3] for r in rows],
+                "shipment": ship_vals[nonzero],
+                "trips": np.rint(trips_vals[nonzero]).astype(np.int64),
+            }
+        )
 
     # Inventory plan
-    inv_rows: List[Dict[str, Any]] = []
-    for p in list(model.P):
-        for t in list(model.T):
-            inv = _safe_value(model.Inv[p, t])
-            inv_rows.append(
-                {
-                    "plant_id": p,
-                    "plant": plant_names.get(p, p),
-                    "month": t,
-                    "inventory": inv,
-                }
-            )
-
-    inventory_df = pd.DataFrame(inv_rows)
-
-    # Cost breakdown
-    prod_cost = sum(_safe_value(model.Prod[p, t]) * _safe_value(model.ProdCost[p]) for p in model.P for t in model.T)
-    trans_cost = sum(
-        _safe_value(model.Trips[i, j, k, t]) * _safe_value(model.RouteCost[i, j, k])
-        for (i, j, k) in model.R
-        for t in model.T
+    inv_keys, inv_vals = _var_values(model.Inv)
+    inv_plants = [p for (p, t) in inv_keys]
+
+    inventory_df = pd.DataFrame()
+    if inv_keys:
+        inventory_df = pd.DataFrame(
+            {
+                "plant_id": inv_plants,
+                "plant": _names(inv_plants, plant_names),
+                "month": [t for (p, t) in inv_keys],
+                "inventory": inv_vals,
+            }
+        )
+
+    # Cost breakdown: read each cost Param once per plant/route (Param lookups
+    # are slow), expand to one cost per cell in the value-array order, then dot.
+    prod_cost_map = {p: _safe_value(model.ProdCost[p]) for p in model.P}
+    route_cost_map = {r: _safe_value(model.RouteCost[r]) for r in model.R}
+    hold_cost_map = {p: _safe_value(model.HoldCost[p]) for p in model.P}
+
+    prod_costs = np.fromiter((prod_cost_map[p] for p in prod_plants), dtype=np.float64, count=len(prod_keys))
+    route_costs = np.fromiter(
+        (route_cost_map[(i, j, k)] for (i, j, k, t) in ship_keys), dtype=np.float64, count=len(ship_keys)
     )
-    hold_cost = sum(_safe_value(model.Inv[p, t]) * _safe_value(model.HoldCost[p]) for p in model.P for t in model.T)
+    hold_costs = np.fromiter((hold_cost_map[p] for p in inv_plants), dtype=np.float64, count=len(inv_keys))
+
+    prod_cost = prod_vals @ prod_costs
+    trans_cost = trips_vals @ route_costs
+    hold_cost = inv_vals @ hold_costs
 
     obj = _safe_value(model.TotalCost)
 
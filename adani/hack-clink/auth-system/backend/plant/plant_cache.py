@@ -0,0 +1,49 @@
+"""Short-lived cache for plant lookups by id.
+
+Why:
+- Demand, inventory policy and transport route writes all validate their
+  plant ids with find_plant_by_id(), one MongoDB round-trip per lookup.
+- Plants change rarely, so a 60 second cache removes most of those trips.
+
+Rules:
+- Only found plants are cached (a missing id is always re-checked).
+- plant_service calls invalidate_plant() after every successful edit/delete.
+- Callers must treat the returned document as read-only (it is shared).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+from backend.plant.plant_repository import find_plant_by_id
+
+
+_cache: TTLCache = TTLCache(maxsize=2048, ttl=60)
+# TTLCache is not thread-safe and Streamlit sessions run in separate threads.
+_lock = threading.Lock()
+
+
+def cached_find_plant_by_id(plant_id: str) -> Optional[Dict[str, Any]]:
+    """Cached version of plant_repository.find_plant_by_id."""
+
+    key = (plant_id or "").strip()
+    with _lock:
+        plant = _cache.get(key)
+    if plant is not None:
+        return plant
+
+    plant = find_plant_by_id(key)
+    if plant is not None:
+        with _lock:
+            _cache[key] = plant
+    return plant
+
+
+def invalidate_plant(plant_id: str) -> None:
+    """Drop one plant from the cache (call after update/delete)."""
+
+    with _lock:
+        _cache.pop((plant_id or "").strip(), None)
@@ -21,20 +21,20 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from bson import ObjectId
 
 from backend.database.mongo import get_plants_collection
+from backend.database.util import to_oid
 
 
-def list_plants(include_inactive: bool = True) -> List[Dict[str, Any]]:
-    """Return all plant documents."""
+def list_plants(include_inactive: bool = True, projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    """Return all plant documents (only the projected fields if a projection is given)."""
 
     plants = get_plants_collection()
 
     query = {} if include_inactive else {"is_active": True}
 
     # Sort by name for a clean UI.
-    return list(plants.find(query).sort("name", 1))
+    return list(plants.find(query, projection).sort("name", 1))
 
 
 def find_plant_by_id(plant_id: str) -> Optional[Dict[str, Any]]:
@@ -43,7 +43,7 @@ def find_plant_by_id(plant_id: str) -> Optional[Dict[str, Any]]:
     plants = get_plants_collection()
 
     try:
-        oid = ObjectId(plant_id)
+        oid = to_oid(plant_id)
     except Exception:
         return None
 
@@ -93,7 +93,7 @@ def update_plant(plant_id: str, data: Dict[str, Any]) -> bool:
     plants = get_plants_collection()
 
     try:
-        oid = ObjectId(plant_id)
+        oid = to_oid(plant_id)
     except Exception:
         return False
 
@@ -125,7 +125,7 @@ def delete_plant(plant_id: str) -> bool:
     plants = get_plants_collection()
 
     try:
-        oid = ObjectId(plant_id)
+        oid = to_oid(plant_id)
     except Exception:
         return False
 
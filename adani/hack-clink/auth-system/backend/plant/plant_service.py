@@ -16,10 +16,12 @@ Validations implemented here:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from pymongo.errors import DuplicateKeyError
 
+from backend.core.cache import cached_get_all_plants
+from backend.plant.plant_cache import invalidate_plant
 from backend.plant.plant_repository import (
     create_plant,
     delete_plant,
@@ -114,10 +116,10 @@ def validate_plant_payload(payload: Dict[str, Any]) -> Tuple[bool, str]:
     return True, ""
 
 
-def get_all_plants(include_inactive: bool = True) -> List[Dict[str, Any]]:
+def get_all_plants(include_inactive: bool = True, projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
     """List plants for UI tables."""
 
-    return list_plants(include_inactive=include_inactive)
+    return list_plants(include_inactive=include_inactive, projection=projection)
 
 
 def add_plant(payload: Dict[str, Any]) -> Tuple[bool, str]:
@@ -135,6 +137,7 @@ def add_plant(payload: Dict[str, Any]) -> Tuple[bool, str]:
 
     try:
         create_plant(payload)
+        cached_get_all_plants.clear()
         return True, "Plant created successfully."
     except DuplicateKeyError:
         # Also protected by MongoDB unique index.
@@ -163,6 +166,8 @@ def edit_plant(plant_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
         updated = update_plant(plant_id, payload)
         if not updated:
             return False, "No changes were saved."
+        cached_get_all_plants.clear()
+        invalidate_plant(plant_id)
         return True, "Plant updated successfully."
     except DuplicateKeyError:
         return False, "A plant with this name already exists."
@@ -181,6 +186,8 @@ def remove_plant(plant_id: str) -> Tuple[bool, str]:
         deleted = delete_plant(plant_id)
         if not deleted:
             return False, "Failed to delete plant."
+        cached_get_all_plants.clear()
+        invalidate_plant(plant_id)
         return True, "Plant deleted successfully."
     except Exception:
         return False, "Failed to delete plant."
@@ -20,18 +20,17 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from bson import ObjectId
-
 from backend.database.mongo import get_transport_routes_collection
+from backend.database.util import to_oid
 
 
-def list_routes(include_disabled: bool = True) -> List[Dict[str, Any]]:
+def list_routes(include_disabled: bool = True, projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
     routes = get_transport_routes_collection()
 
     query = {} if include_disabled else {"is_enabled": True}
 
     return list(
-        routes.find(query).sort(
+        routes.find(query, projection).sort(
             [
                 ("from_plant_name", 1),
                 ("to_plant_name", 1),
@@ -45,7 +44,7 @@ def find_route_by_id(route_id: str) -> Optional[Dict[str, Any]]:
     routes = get_transport_routes_collection()
 
     try:
-        oid = ObjectId(route_id)
+        oid = to_oid(route_id)
     except Exception:
         return None
 
@@ -56,13 +55,13 @@ def find_duplicate(from_plant_id: str, to_plant_id: str, transport_mode: str, ex
     routes = get_transport_routes_collection()
 
     query: Dict[str, Any] = {
-        "from_plant_id": ObjectId(from_plant_id),
-        "to_plant_id": ObjectId(to_plant_id),
+        "from_plant_id": to_oid(from_plant_id),
+        "to_plant_id": to_oid(to_plant_id),
         "transport_mode": transport_mode,
     }
 
     if exclude_id:
-        query["_id"] = {"$ne": ObjectId(exclude_id)}
+        query["_id"] = {"$ne": to_oid(exclude_id)}
 
     return routes.find_one(query)
 
@@ -71,9 +70,9 @@ def create_route(data: Dict[str, Any]) -> str:
     routes = get_transport_routes_collection()
 
     doc = {
-        "from_plant_id": ObjectId(data["from_plant_id"]),
+        "from_plant_id": to_oid(data["from_plant_id"]),
         "from_plant_name": data["from_plant_name"],
-        "to_plant_id": ObjectId(data["to_plant_id"]),
+        "to_plant_id": to_oid(data["to_plant_id"]),
         "to_plant_name": data["to_plant_name"],
         "transport_mode": data["transport_mode"],
         "cost_per_trip": float(data["cost_per_trip"]),
@@ -91,15 +90,15 @@ def update_route(route_id: str, data: Dict[str, Any]) -> bool:
     routes = get_transport_routes_collection()
 
     try:
-        oid = ObjectId(route_id)
+        oid = to_oid(route_id)
     except Exception:
         return False
 
     update_doc = {
         "$set": {
-            "from_plant_id": ObjectId(data["from_plant_id"]),
+            "from_plant_id": to_oid(data["from_plant_id"]),
             "from_plant_name": data["from_plant_name"],
-            "to_plant_id": ObjectId(data["to_plant_id"]),
+            "to_plant_id": to_oid(data["to_plant_id"]),
             "to_plant_name": data["to_plant_name"],
             "transport_mode": data["transport_mode"],
             "cost_per_trip": float(data["cost_per_trip"]),
@@ -116,7 +115,7 @@ def delete_route(route_id: str) -> bool:
     routes = get_transport_routes_collection()
 
     try:
-        oid = ObjectId(route_id)
+        oid = to_oid(route_id)
     except Exception:
         return False
 
@@ -128,7 +127,7 @@ def set_route_enabled(route_id: str, is_enabled: bool) -> bool:
     routes = get_transport_routes_collection()
 
     try:
-        oid = ObjectId(route_id)
+        oid = to_oid(route_id)
     except Exception:
         return False
 
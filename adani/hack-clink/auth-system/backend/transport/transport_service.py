@@ -13,9 +13,10 @@ Validations:
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-from backend.plant.plant_repository import find_plant_by_id
+from backend.core.cache import cached_get_all_routes
+from backend.plant.plant_cache import cached_find_plant_by_id
 from backend.transport.transport_repository import (
     create_route,
     delete_route,
@@ -40,8 +41,8 @@ def validate_transport_payload(payload: Dict[str, Any]) -> Tuple[bool, str]:
     if from_plant_id == to_plant_id:
         return False, "From plant and To plant cannot be the same."
 
-    from_plant = find_plant_by_id(from_plant_id)
-    to_plant = find_plant_by_id(to_plant_id)
+    from_plant = cached_find_plant_by_id(from_plant_id)
+    to_plant = cached_find_plant_by_id(to_plant_id)
 
     if from_plant is None or to_plant is None:
         return False, "Selected plant does not exist."
@@ -72,8 +73,8 @@ def validate_transport_payload(payload: Dict[str, Any]) -> Tuple[bool, str]:
     return True, ""
 
 
-def get_all_routes(include_disabled: bool = True) -> List[Dict[str, Any]]:
-    return list_routes(include_disabled=include_disabled)
+def get_all_routes(include_disabled: bool = True, projection: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
+    return list_routes(include_disabled=include_disabled, projection=projection)
 
 
 def add_route(payload: Dict[str, Any]) -> Tuple[bool, str]:
@@ -81,8 +82,8 @@ def add_route(payload: Dict[str, Any]) -> Tuple[bool, str]:
     if not ok:
         return False, msg
 
-    from_plant = find_plant_by_id(payload["from_plant_id"].strip())
-    to_plant = find_plant_by_id(payload["to_plant_id"].strip())
+    from_plant = cached_find_plant_by_id(payload["from_plant_id"].strip())
+    to_plant = cached_find_plant_by_id(payload["to_plant_id"].strip())
 
     payload["from_plant_name"] = from_plant.get("name")
     payload["to_plant_name"] = to_plant.get("name")
@@ -97,6 +98,7 @@ def add_route(payload: Dict[str, Any]) -> Tuple[bool, str]:
 
     try:
         create_route(payload)
+        cached_get_all_routes.clear()
         return True, "Transport route created successfully."
     except Exception:
         return False, "Failed to create transport route."
@@ -111,8 +113,8 @@ def edit_route(route_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
     if existing is None:
         return False, "Transport route not found."
 
-    from_plant = find_plant_by_id(payload["from_plant_id"].strip())
-    to_plant = find_plant_by_id(payload["to_plant_id"].strip())
+    from_plant = cached_find_plant_by_id(payload["from_plant_id"].strip())
+    to_plant = cached_find_plant_by_id(payload["to_plant_id"].strip())
 
     payload["from_plant_name"] = from_plant.get("name")
     payload["to_plant_name"] = to_plant.get("name")
@@ -130,6 +132,7 @@ def edit_route(route_id: str, payload: Dict[str, Any]) -> Tuple[bool, str]:
         updated = update_route(route_id, payload)
         if not updated:
             return False, "No changes were saved."
+        cached_get_all_routes.clear()
         return True, "Transport route updated successfully."
     except Exception:
         return False, "Failed to update transport route."
@@ -144,6 +147,7 @@ def remove_route(route_id: str) -> Tuple[bool, str]:
         deleted = delete_route(route_id)
         if not deleted:
             return False, "Failed to delete transport route."
+        cached_get_all_routes.clear()
         return True, "Transport route deleted successfully."
     except Exception:
         return False, "Failed to delete transport route."
@@ -158,6 +162,7 @@ def toggle_route_enabled(route_id: str, is_enabled: bool) -> Tuple[bool, str]:
         changed = set_route_enabled(route_id, is_enabled=is_enabled)
         if not changed:
             return False, "No changes were saved."
+        cached_get_all_routes.clear()
         return True, "Transport route updated successfully."
     except Exception:
         return False, "Failed to update transport route."
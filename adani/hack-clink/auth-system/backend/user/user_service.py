@@ -17,6 +17,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Tuple
 
+from backend.auth.auth_service import invalidate_cached_user
 from backend.database.user_repository import (
     count_users,
     list_users,
@@ -55,6 +56,7 @@ def change_user_role(email: str, new_role: str) -> Tuple[bool, str]:
 
     try:
         changed = set_user_role(normalized_email, role)
+        invalidate_cached_user(normalized_email)
         if not changed:
             return False, "No changes were saved (maybe same role)."
         return True, "User role updated successfully."
@@ -72,6 +74,7 @@ def set_account_status(email: str, is_active: bool) -> Tuple[bool, str]:
 
     try:
         changed = set_user_active(normalized_email, is_active=is_active)
+        invalidate_cached_user(normalized_email)
         if not changed:
             return False, "No changes were saved."
 
@@ -0,0 +1,18 @@
+"""Shared cached workbook loader for the dataset analysis scripts."""
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+
+@lru_cache(maxsize=4)
+def _load_workbook(path, mtime):
+    """Parse every sheet of the workbook once per (path, mtime)."""
+    with pd.ExcelFile(path) as xl:
+        return {name: pd.read_excel(xl, sheet_name=name) for name in xl.sheet_names}
+
+
+def load_workbook(path):
+    """Return a dict of sheet name -> DataFrame, re-reading only when the file changes."""
+    return _load_workbook(os.path.abspath(path), os.path.getmtime(path))
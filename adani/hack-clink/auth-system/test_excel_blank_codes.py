@@ -0,0 +1,57 @@
+"""Regression test: blank code cells in the Excel workbook must stay blank.
+
+On pandas 2, astype(str) turns an empty cell into the text "nan". The loader
+then treated "nan" as a real TRANSPORT CODE and the feasible model failed to
+build (TransportCodeLimitLower[IU_..., 'nan', ...] was a trivial False).
+
+Run with:  python test_excel_blank_codes.py   (or pytest)
+"""
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+from backend.optimization.excel_loader import load_excel_data
+from backend.optimization.feasible_model import build_feasible_model
+
+
+EXCEL_FILE = "Dataset_Dummy_Clinker_3MPlan.xlsx"
+
+
+def _copy_with_blank_transport_code(target: str) -> None:
+    """Copy the dataset, blanking TRANSPORT CODE on the first IUGUConstraint row."""
+
+    sheets = pd.read_excel(EXCEL_FILE, sheet_name=None)
+    constraints = sheets["IUGUConstraint"]
+    constraints["TRANSPORT CODE"] = constraints["TRANSPORT CODE"].astype(object)
+    constraints.loc[constraints.index[0], "TRANSPORT CODE"] = None
+
+    with pd.ExcelWriter(target) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+
+
+def test_blank_transport_code() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "blank_transport_code.xlsx")
+        _copy_with_blank_transport_code(path)
+        data = load_excel_data(path, selected_months=["1", "2", "3"])
+
+    bad_limits = [key for key in data.transport_code_limits if "nan" in key]
+    bad_bounds = [key for key in data.transport_bounds if "nan" in key]
+    assert not bad_limits, f"'nan' used as a transport code: {bad_limits[:3]}"
+    assert not bad_bounds, f"'nan' used as a code in transport bounds: {bad_bounds[:3]}"
+
+    # Must build without an InvalidConstraintError.
+    build_feasible_model(data)
+
+
+if __name__ == "__main__":
+    try:
+        test_blank_transport_code()
+    except Exception as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    print("[SUCCESS] Blank code cells are ignored (pandas " + pd.__version__ + ")")
@@ -6,7 +6,7 @@ We show different content based on role.
 
 import streamlit as st
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from backend.user.user_service import (
     change_user_role,
     get_all_users,
@@ -43,7 +43,7 @@ def _render_admin_dashboard() -> None:
     st.markdown("### Admin Dashboard")
     st.caption("Admin tools: manage users and monitor role distribution.")
 
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
 
     counts, distribution = get_user_summaries()
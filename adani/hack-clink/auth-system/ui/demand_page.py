@@ -3,6 +3,7 @@
 What this page does:
 - Shows all demand rows in a table
 - Lets authorized users add/edit/delete demand entries
+- Lets authorized users import many demand rows from a CSV file
 
 Role access:
 - Admin & Planner: full access
@@ -14,9 +15,10 @@ UI -> backend.demand.demand_service -> backend.demand.demand_repository -> Mongo
 
 from __future__ import annotations
 
+import pandas as pd
 import streamlit as st
 
-from backend.demand.demand_service import add_demand, edit_demand, get_all_demands, remove_demand
+from backend.demand.demand_service import add_demand, edit_demand, get_all_demands, import_demands, remove_demand
 from backend.middleware.role_guard import require_authentication
 from backend.plant.plant_service import get_all_plants
 
@@ -89,6 +91,49 @@ def render_demand_page(role: str) -> None:
         else:
             st.error(msg)
 
+    st.divider()
+    st.subheader("Import Demands (CSV)")
+    st.caption(
+        "Columns: plant, month, demand_quantity, demand_type. "
+        "plant is a plant name (or plant id). Rows that already exist are skipped."
+    )
+
+    with st.form("import_demands_form"):
+        uploaded = st.file_uploader("CSV file", type=["csv"])
+        imported = st.form_submit_button("Import Demands")
+
+    if imported:
+        if uploaded is None:
+            st.error("Please choose a CSV file.")
+        else:
+            try:
+                # Read everything as text; the service validates each field.
+                csv_df = pd.read_csv(uploaded, dtype=str).fillna("")
+            except Exception:
+                csv_df = None
+                st.error("Could not read the CSV file.")
+
+            required = ["plant", "month", "demand_quantity", "demand_type"]
+            if csv_df is not None and any(col not in csv_df.columns for col in required):
+                st.error("CSV must have columns: " + ", ".join(required))
+            elif csv_df is not None:
+                payloads = [
+                    {
+                        "plant_id": plant_options.get(row["plant"].strip(), row["plant"]),
+                        "month": row["month"],
+                        "demand_quantity": row["demand_quantity"],
+                        "demand_type": row["demand_type"],
+                    }
+                    for row in csv_df[required].to_dict(orient="records")
+                ]
+                ok, msg = import_demands(payloads)
+
+                if ok:
+                    st.success(msg)
+                    st.rerun()
+                else:
+                    st.error(msg)
+
     if not demands:
         return
 
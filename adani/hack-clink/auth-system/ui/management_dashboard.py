@@ -21,8 +21,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from backend.analytics.analytics_service import compute_and_store_analytics
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.analytics.analytics_service import compute_and_store_analytics, records_from_columnar
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from backend.results.result_service import get_recent_runs, get_run
 
 
@@ -43,7 +43,7 @@ def render_management_dashboard(role: str) -> None:
     st.header("Management Insights Dashboard")
     st.caption("Enterprise KPI view of optimization outcomes, utilization, bottlenecks, and cost drivers.")
 
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
 
     runs = get_recent_runs(limit=50)
@@ -155,7 +155,7 @@ def render_management_dashboard(role: str) -> None:
     util = analytics.get("utilization") or {}
 
     st.subheader("Capacity utilization")
-    prod_util_df = pd.DataFrame(util.get("production", []) or [])
+    prod_util_df = pd.DataFrame(records_from_columnar(util.get("production")))
     if not prod_util_df.empty:
         prod_view = prod_util_df.copy()
         prod_view["headroom_percent"] = (100.0 - prod_view["utilization_percent"]).clip(lower=0)
@@ -172,7 +172,7 @@ def render_management_dashboard(role: str) -> None:
         st.plotly_chart(fig_prod, use_container_width=True)
         st.caption("Blue shows how much of each plant's clinker capacity is booked. Grey shows spare headroom.")
 
-    storage_util_df = pd.DataFrame(util.get("storage", []) or [])
+    storage_util_df = pd.DataFrame(records_from_columnar(util.get("storage")))
     if not storage_util_df.empty:
         storage_sorted = storage_util_df.sort_values("utilization_percent", ascending=False)
         fig_st = px.bar(
@@ -188,7 +188,7 @@ def render_management_dashboard(role: str) -> None:
         st.plotly_chart(fig_st, use_container_width=True)
         st.caption("Look for bars near 100% – those silos leave little room for demand spikes.")
 
-    transport_util_df = pd.DataFrame(util.get("transport", []) or [])
+    transport_util_df = pd.DataFrame(records_from_columnar(util.get("transport")))
     if not transport_util_df.empty:
         st.markdown("### Transport network load")
         month_options = sorted(transport_util_df["month"].astype(str).unique().tolist()) if "month" in transport_util_df.columns else []
@@ -247,9 +247,9 @@ def render_management_dashboard(role: str) -> None:
     st.subheader("Bottlenecks")
     bn = analytics.get("bottlenecks") or {}
 
-    plant_bn = pd.DataFrame(bn.get("plants", []) or [])
-    route_bn = pd.DataFrame(bn.get("routes", []) or [])
-    inv_bn = pd.DataFrame(bn.get("inventory", []) or [])
+    plant_bn = pd.DataFrame(records_from_columnar(bn.get("plants")))
+    route_bn = pd.DataFrame(records_from_columnar(bn.get("routes")))
+    inv_bn = pd.DataFrame(records_from_columnar(bn.get("inventory")))
 
     if plant_bn.empty and route_bn.empty and inv_bn.empty:
         st.success("No bottlenecks flagged by current thresholds.")
@@ -267,9 +267,9 @@ def render_management_dashboard(role: str) -> None:
     st.subheader("Cost drivers")
     cd = analytics.get("cost_drivers") or {}
 
-    top_plants = pd.DataFrame(cd.get("top_plants", []) or [])
-    top_routes = pd.DataFrame(cd.get("top_routes", []) or [])
-    mode_cost = pd.DataFrame(cd.get("mode_cost", []) or [])
+    top_plants = pd.DataFrame(records_from_columnar(cd.get("top_plants")))
+    top_routes = pd.DataFrame(records_from_columnar(cd.get("top_routes")))
+    mode_cost = pd.DataFrame(records_from_columnar(cd.get("mode_cost")))
 
     colA, colB = st.columns(2)
     colA.write("Top cost-driving plants")
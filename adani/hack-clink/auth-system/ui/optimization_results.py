@@ -22,7 +22,7 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from backend.results.result_service import get_recent_runs, get_run
 
 
@@ -59,7 +59,7 @@ def render_optimization_results(role: str) -> None:
     st.caption("View optimization runs, tables, charts, and export to Excel.")
 
     # Viewer is allowed, but read-only (this page is read-only anyway).
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
 
     runs = get_recent_runs(limit=30)
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import streamlit as st
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from backend.plant.plant_service import add_plant, edit_plant, get_all_plants, remove_plant
 
 
@@ -204,7 +204,7 @@ def render_plant_page(role: str) -> None:
     st.subheader("Delete Plant")
     st.caption("Only Admin can delete plants.")
 
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
 
     confirm = st.checkbox("I understand this will permanently delete the plant.")
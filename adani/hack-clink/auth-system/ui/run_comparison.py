@@ -24,7 +24,7 @@ import plotly.express as px
 import streamlit as st
 
 from backend.analytics.analytics_service import compute_and_store_analytics
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from backend.results.result_service import get_recent_runs, get_run
 
 
@@ -55,7 +55,7 @@ def render_run_comparison(role: str) -> None:
     st.header("Run Comparison")
     st.caption("Compare KPIs between two runs (deterministic vs stochastic vs robust).")
 
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
 
     runs = get_recent_runs(limit=60)
@@ -23,7 +23,7 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from backend.results.result_service import get_recent_runs
 
 
@@ -34,7 +34,7 @@ def render_scenario_comparison(role: str) -> None:
     st.header("Scenario Comparison")
     st.caption("Compare deterministic vs stochastic vs robust runs.")
 
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
 
     runs = get_recent_runs(limit=60)
@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import streamlit as st
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 from backend.plant.plant_service import get_all_plants
 from backend.transport.transport_service import (
     add_route,
@@ -186,7 +186,7 @@ def render_transport_page(role: str) -> None:
     st.subheader("Enable / Disable Route")
     st.caption("Only Admin can enable or disable transport routes.")
 
-    if require_role(["Admin"]):
+    if require_role(ADMIN_ONLY):
         enabled_now = bool(selected_doc.get("is_enabled", True))
         new_enabled = st.toggle("Enabled", value=enabled_now)
 
@@ -203,7 +203,7 @@ def render_transport_page(role: str) -> None:
     st.subheader("Delete Route")
     st.caption("Only Admin can delete routes.")
 
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
 
     confirm = st.checkbox("I understand this will permanently delete the route.")
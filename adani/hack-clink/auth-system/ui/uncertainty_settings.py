@@ -22,7 +22,7 @@ from typing import Any, Dict, List
 import streamlit as st
 import pandas as pd
 
-from backend.middleware.role_guard import require_authentication, require_role
+from backend.middleware.role_guard import ADMIN_ONLY, require_authentication, require_role
 
 
 def render_uncertainty_settings(role: str) -> None:
@@ -32,7 +32,7 @@ def render_uncertainty_settings(role: str) -> None:
     st.header("Demand Uncertainty Settings")
     st.caption("Configure demand scenarios and volatility for uncertainty analysis.")
 
-    if not require_role(["Admin"]):
+    if not require_role(ADMIN_ONLY):
         return
 
     can_edit = role in {"Admin"}